@@ -0,0 +1,85 @@
+"""vindicta dev bundle.
+
+Write one git bundle per workspace repo for offline `init --from-bundles`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from pathlib import Path
+
+import typer
+
+from vindicta_cli.cli.output import ResultOutput, check_json_flags, console
+from vindicta_cli.lib.bundle_service import BundleResult, bundle_repos
+from vindicta_cli.lib.logger import setup_logging
+from vindicta_cli.lib.workspace import discover_workspace_root, load_config, scan_repos
+
+
+def bundle_cmd(
+    output: Path = typer.Option(
+        Path("vindicta-bundles"), "-o", "--output", help="Bundle directory"
+    ),
+    incremental: bool = typer.Option(
+        False, "--incremental", help="Only bundle commits since the last bundle"
+    ),
+    repo: list[str] = typer.Option(["all"], "-r", "--repo", help="Repos to bundle"),
+    tier: list[str] = typer.Option(["all"], "-t", "--tier", help="Filter by tier"),
+    parallel: int | None = typer.Option(
+        None, "--parallel", "-p", help="Concurrent repos (default: parallel_count)"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    json_output: bool = typer.Option(False, "--json", help="JSON output"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream one JSON object per repo as it completes"
+    ),
+) -> None:
+    """Write git bundles of workspace repos for offline bootstrap."""
+    check_json_flags(json_output, ndjson)
+    setup_logging()
+    workspace_root = discover_workspace_root()
+    if not workspace_root:
+        console.print("[red]No workspace found.[/red] Run `vindicta dev init` first.")
+        raise typer.Exit(code=1)
+
+    repos = scan_repos(
+        workspace_root, tiers=tier, names=repo if "all" not in repo else None
+    )
+    present = [(r.name, r.local_path) for r in repos if r.present and r.local_path]
+    if not present:
+        console.print("[yellow]No repos found in workspace.[/yellow]")
+        raise typer.Exit(code=0)
+
+    config = load_config(workspace_root)
+    out: ResultOutput[BundleResult] = ResultOutput(asdict, json_output, ndjson)
+    results = bundle_repos(
+        present,
+        output.resolve(),
+        incremental=incremental,
+        parallel_count=parallel or config.parallel_count,
+        on_result=out.stream,
+    )
+
+    out.emit_json(out.records(results))
+    if out.human:
+        from rich.table import Table
+
+        table = Table(title=f"Bundles in {output}")
+        table.add_column("Repository", style="cyan")
+        table.add_column("Bundle")
+        table.add_column("Refs", justify="right")
+        table.add_column("Size", justify="right")
+        table.add_column("Status")
+
+        for r in results:
+            if not r.success:
+                status = f"[red]✗ {r.message}[/red]"
+            else:
+                status = f"✓ {r.action}"
+            size = f"{r.size / 1024 / 1024:.1f} MiB" if r.file else "—"
+            table.add_row(r.name, r.file or "—", str(r.refs), size, status)
+
+        console.print(table)
+
+    if any(not r.success for r in results):
+        raise typer.Exit(code=1)
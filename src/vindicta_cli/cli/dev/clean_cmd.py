@@ -5,18 +5,13 @@ Clean build artifacts and report disk space reclaimed.
 
 from __future__ import annotations
 
-import json
-
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from vindicta_cli.lib.clean_service import _format_size, clean_repo
+from vindicta_cli.cli.output import ResultOutput, check_json_flags, console
+from vindicta_cli.lib.clean_service import CleanResult, _format_size, clean_repo
 from vindicta_cli.lib.logger import setup_logging
 from vindicta_cli.lib.workspace import discover_workspace_root, scan_repos
 
-console = Console()
-
 
 def clean_cmd(
     dry_run: bool = typer.Option(False, "--dry-run", help="Report but don't delete"),
@@ -26,8 +21,12 @@ def clean_cmd(
     repo: list[str] = typer.Option(["all"], "-r", "--repo", help="Repos to clean"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
     json_output: bool = typer.Option(False, "--json", help="JSON output"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream one JSON object per repo as it completes"
+    ),
 ) -> None:
     """Clean build artifacts across workspace repositories."""
+    check_json_flags(json_output, ndjson)
     setup_logging()
     workspace_root = discover_workspace_root()
     if not workspace_root:
@@ -37,7 +36,9 @@ def clean_cmd(
     repos = scan_repos(workspace_root, names=repo if "all" not in repo else None)
     present = [r for r in repos if r.present and r.local_path]
 
-    all_results = []
+    out: ResultOutput[CleanResult] = ResultOutput(
+        lambda r: {"dry_run": dry_run, **_clean_record(r)}, json_output, ndjson
+    )
     total_reclaimed = 0
 
     for entry in present:
@@ -47,26 +48,20 @@ def clean_cmd(
             types=type_filter,
             dry_run=dry_run,
         )
-        all_results.append(result)
         total_reclaimed += result.bytes_reclaimed
+        out.add(result)
 
-    if json_output:
-        output = {
+    out.emit_json(
+        {
             "dry_run": dry_run,
             "total_reclaimed": total_reclaimed,
             "total_reclaimed_human": _format_size(total_reclaimed),
-            "repos": [
-                {
-                    "name": r.name,
-                    "items_found": r.items_found,
-                    "items_removed": r.items_removed,
-                    "bytes_reclaimed": r.bytes_reclaimed,
-                }
-                for r in all_results
-            ],
+            "repos": [_clean_record(r) for r in out.kept],
         }
-        typer.echo(json.dumps(output, indent=2))
-    else:
+    )
+    if out.human:
+        from rich.table import Table
+
         prefix = "[DRY RUN] " if dry_run else ""
         table = Table(title=f"{prefix}Cleanup Results")
         table.add_column("Repository", style="cyan")
@@ -74,7 +69,7 @@ def clean_cmd(
         table.add_column("Removed", justify="right")
         table.add_column("Space", justify="right")
 
-        for r in all_results:
+        for r in out.kept:
             if r.items_found > 0:
                 table.add_row(
                     r.name,
@@ -87,3 +82,13 @@ def clean_cmd(
         console.print(
             f"\n[bold]Total reclaimed:[/bold] {_format_size(total_reclaimed)}"
         )
+
+
+def _clean_record(result: CleanResult) -> dict:
+    """Machine-readable clean result for --json and --ndjson."""
+    return {
+        "name": result.name,
+        "items_found": result.items_found,
+        "items_removed": result.items_removed,
+        "bytes_reclaimed": result.bytes_reclaimed,
+    }
@@ -8,9 +8,8 @@ from __future__ import annotations
 import json
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
+from vindicta_cli.cli.output import console
 from vindicta_cli.lib.config_service import (
     get_config_value,
     list_config,
@@ -20,7 +19,6 @@ from vindicta_cli.lib.config_service import (
 from vindicta_cli.lib.logger import setup_logging
 from vindicta_cli.lib.workspace import discover_workspace_root
 
-console = Console()
 config_app = typer.Typer(help="Manage workspace configuration.")
 
 
@@ -87,6 +85,8 @@ def config_list(
     if json_output:
         typer.echo(json.dumps(config_data, indent=2))
     else:
+        from rich.table import Table
+
         table = Table(title="Configuration")
         table.add_column("Key", style="cyan")
         table.add_column("Value", style="green")
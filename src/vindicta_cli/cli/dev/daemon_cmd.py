@@ -0,0 +1,156 @@
+"""vindicta dev daemon.
+
+Run a background workspace daemon that keeps repo state warm so
+`status` (and editor/shell-prompt integrations) get instant answers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+from vindicta_cli.cli.output import console
+from vindicta_cli.lib.daemon import (
+    DAEMON_SUPPORTED,
+    WorkspaceDaemon,
+    request_daemon,
+    socket_path,
+)
+from vindicta_cli.lib.logger import setup_logging
+from vindicta_cli.lib.workspace import discover_workspace_root
+
+daemon_app = typer.Typer(help="Manage the workspace state daemon.")
+
+
+def _require_workspace() -> Path:
+    workspace_root = discover_workspace_root()
+    if not workspace_root:
+        console.print("[red]No workspace found.[/red] Run `vindicta dev init` first.")
+        raise typer.Exit(code=1)
+    return workspace_root
+
+
+@daemon_app.command("start")
+def daemon_start(
+    detach: bool = typer.Option(
+        False, "--detach", "-d", help="Run in the background and return"
+    ),
+    refresh_interval: float = typer.Option(
+        2.0, "--refresh-interval", help="Seconds between git metadata polls"
+    ),
+    max_age: float = typer.Option(
+        30.0, "--max-age", help="Recompute repo state older than this (seconds)"
+    ),
+    json_output: bool = typer.Option(False, "--json", help="JSON output"),
+) -> None:
+    """Start the workspace daemon."""
+    setup_logging()
+    if not DAEMON_SUPPORTED:
+        console.print("[red]The daemon requires Unix domain sockets.[/red]")
+        raise typer.Exit(code=1)
+
+    workspace_root = _require_workspace()
+    running = request_daemon(workspace_root, {"op": "ping"}, timeout=1.0)
+    if running:
+        if json_output:
+            typer.echo(json.dumps(running))
+        else:
+            console.print(f"Daemon already running (pid {running['pid']})")
+        return
+
+    if detach:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "vindicta_cli.main",
+                "dev",
+                "daemon",
+                "start",
+                "--refresh-interval",
+                str(refresh_interval),
+                "--max-age",
+                str(max_age),
+            ],
+            cwd=str(workspace_root),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            running = request_daemon(workspace_root, {"op": "ping"}, timeout=1.0)
+            if running:
+                break
+            time.sleep(0.1)
+        if not running:
+            console.print("[red]Daemon failed to start.[/red] See .vindicta/logs/")
+            raise typer.Exit(code=1)
+        if json_output:
+            typer.echo(json.dumps(running))
+        else:
+            console.print(
+                f"[green]✓[/green] Daemon started (pid {running['pid']}) "
+                f"on {socket_path(workspace_root)}"
+            )
+        return
+
+    daemon = WorkspaceDaemon(
+        workspace_root,
+        refresh_interval=refresh_interval,
+        max_age=max_age,
+    )
+    if not json_output:
+        console.print(f"Serving {workspace_root} on {socket_path(workspace_root)}")
+    try:
+        asyncio.run(daemon.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon_app.command("stop")
+def daemon_stop(
+    json_output: bool = typer.Option(False, "--json", help="JSON output"),
+) -> None:
+    """Stop the workspace daemon."""
+    setup_logging()
+    workspace_root = _require_workspace()
+    response = request_daemon(workspace_root, {"op": "shutdown"})
+    stopped = bool(response and response.get("ok"))
+
+    if json_output:
+        typer.echo(json.dumps({"stopped": stopped}))
+    elif stopped:
+        console.print("[green]✓[/green] Daemon stopped")
+    else:
+        console.print("[yellow]No daemon running.[/yellow]")
+
+
+@daemon_app.command("status")
+def daemon_status_cmd(
+    json_output: bool = typer.Option(False, "--json", help="JSON output"),
+) -> None:
+    """Show whether the workspace daemon is running."""
+    setup_logging()
+    workspace_root = _require_workspace()
+    response = request_daemon(workspace_root, {"op": "ping"}, timeout=1.0)
+
+    if json_output:
+        typer.echo(json.dumps(response or {"ok": False}))
+    elif response:
+        console.print(
+            f"[green]running[/green] pid={response['pid']} "
+            f"repos={response['repos']} uptime={response['uptime']}s"
+        )
+    else:
+        console.print("[yellow]not running[/yellow]")
+
+    if not response:
+        raise typer.Exit(code=1)
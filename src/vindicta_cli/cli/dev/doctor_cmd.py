@@ -8,15 +8,12 @@ from __future__ import annotations
 import json
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
+from vindicta_cli.cli.output import console
 from vindicta_cli.lib.doctor_service import run_diagnostics
 from vindicta_cli.lib.logger import setup_logging
 from vindicta_cli.lib.workspace import discover_workspace_root
 
-console = Console()
-
 
 def doctor_cmd(
     fix: bool = typer.Option(False, "--fix", help="Attempt auto-fixes"),
@@ -50,6 +47,8 @@ def doctor_cmd(
         }
         typer.echo(json.dumps(output, indent=2))
     else:
+        from rich.table import Table
+
         table = Table(title="Environment Diagnostics")
         table.add_column("Check", style="cyan")
         table.add_column("Status")
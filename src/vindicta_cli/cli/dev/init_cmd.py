@@ -8,19 +8,23 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
+from typing import Callable
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from vindicta_cli.cli.output import console, rich_console
+from vindicta_cli.lib.bundle_service import load_manifest
+from vindicta_cli.lib.gh_client import GhClient
+from vindicta_cli.lib.init_journal import InitJournal
 from vindicta_cli.lib.logger import setup_logging
+from vindicta_cli.lib.mirror import default_mirror_root
 from vindicta_cli.lib.registry import filter_by_name, filter_by_tier, get_registry
-from vindicta_cli.lib.repository import clone_repos
-from vindicta_cli.lib.setup_service import setup_repo
-from vindicta_cli.lib.workspace import save_config
-from vindicta_cli.models.workspace_config import WorkspaceConfig
-
-console = Console()
+from vindicta_cli.lib.repository import clone_repos, has_local_source
+from vindicta_cli.lib.scheduler import DurationHistory, schedule
+from vindicta_cli.lib.setup_service import SetupStage
+from vindicta_cli.lib.workspace import CONFIG_FILENAME, load_config, save_config
+from vindicta_cli.models.repo_info import VALID_TIERS, RepoEntry
+from vindicta_cli.models.workspace_config import CLONE_MODES, WorkspaceConfig
 
 
 def init_cmd(
@@ -36,6 +40,39 @@ def init_cmd(
     skip_setup: bool = typer.Option(
         False, "--skip-setup", help="Skip dependency installation"
     ),
+    setup_parallel: int | None = typer.Option(
+        None,
+        "--setup-parallel",
+        min=1,
+        help="Concurrent repo setups (default: half the CPUs, max 4)",
+    ),
+    clone_mode: list[str] = typer.Option(
+        [],
+        "--clone-mode",
+        help="full, blobless, single-branch or shallow; TIER=MODE for one tier",
+    ),
+    depth: int | None = typer.Option(
+        None, "--depth", min=1, help="Commits fetched by shallow clones"
+    ),
+    mirror: bool | None = typer.Option(
+        None,
+        "--mirror/--no-mirror",
+        help="Clone through the shared mirror store (default: mirror_cache)",
+    ),
+    from_workspace: Path | None = typer.Option(
+        None,
+        "--from",
+        exists=True,
+        file_okay=False,
+        help="Existing workspace to reuse repo objects from",
+    ),
+    from_bundles: Path | None = typer.Option(
+        None,
+        "--from-bundles",
+        exists=True,
+        file_okay=False,
+        help="Create repos offline from `vindicta dev bundle` output",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
     json_output: bool = typer.Option(False, "--json", help="JSON output"),
 ) -> None:
@@ -48,50 +85,157 @@ def init_cmd(
     repos = get_registry()
     repos = filter_by_tier(repos, tier)
     repos = filter_by_name(repos, repo)
+    # Re-running init keeps existing settings; overrides are saved with them
+    if (workspace / CONFIG_FILENAME).exists():
+        config = load_config(workspace)
+    else:
+        config = WorkspaceConfig(workspace_root=str(workspace))
+    _apply_clone_overrides(config, clone_mode, depth)
+    clone_modes = {e.name: config.clone_mode_for(e.name, e.tier) for e in repos}
+    if mirror is not None:
+        config.mirror_cache = mirror
+    mirror_root = default_mirror_root() if config.mirror_cache else None
+    seed_workspace = from_workspace.resolve() if from_workspace else None
+    bundle_dir = from_bundles.resolve() if from_bundles else None
+
+    history = DurationHistory(workspace)
+    history.load()
+    durations = history.durations("clone")
+    # Longest clones start first so they don't hold up the end of the run;
+    # without history, GitHub's repo sizes stand in for clone times
+    # (repos cloned from a mirror, seed workspace or bundle never ask GitHub)
+    bundled = load_manifest(bundle_dir) if bundle_dir else {}
+    unknown = [
+        r
+        for r in repos
+        if r.name not in durations
+        and not (workspace / r.name).exists()
+        and not has_local_source(r.name, mirror_root, seed_workspace, bundled)
+    ]
+    remote_sizes = _remote_sizes(unknown) if unknown else None
+    clone_order = schedule(repos, durations, remote_sizes)
+    # Stages finished by an earlier, interrupted run are not repeated
+    journal = InitJournal(workspace)
+    journal.load()
+
+    def _run(
+        on_progress: Callable[[str, str], None] | None = None,
+    ) -> tuple[dict[str, bool], dict[str, dict[str, bool]]]:
+        # Each repo moves on to setup as soon as its own clone finishes
+        setup = None
+        if not skip_setup:
+            setup = SetupStage(
+                setup_parallel,
+                on_progress=on_progress,
+                journal=journal,
+                skip_venv=not config.create_venvs,
+                skip_hooks=not config.install_hooks,
+            )
+        results = asyncio.run(
+            clone_repos(
+                clone_order,
+                workspace,
+                parallel_count=config.parallel_count,
+                on_progress=on_progress,
+                history=history,
+                clone_modes=clone_modes,
+                depth=config.clone_depth,
+                mirror_root=mirror_root,
+                seed_workspace=seed_workspace,
+                bundle_dir=bundle_dir,
+                on_cloned=setup,
+                journal=journal,
+            )
+        )
+        return results, setup.results if setup else {}
 
     if json_output:
-        results = asyncio.run(clone_repos(repos, workspace))
+        results, setup_results = _run()
         output = {
             "workspace": str(workspace),
             "repos_requested": len(repos),
             "repos_cloned": sum(1 for v in results.values() if v),
             "repos_failed": sum(1 for v in results.values() if not v),
             "results": results,
+            "clone_modes": clone_modes,
+            "setup": setup_results,
         }
         typer.echo(json.dumps(output, indent=2))
     else:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         console.print(f"[bold]Initializing workspace:[/bold] {workspace}")
         console.print(f"Repos: {len(repos)} | Tiers: {', '.join(tier)}\n")
 
+        # A repo is done after setup, or after its clone with --skip-setup
+        finished: tuple[str, ...]
+        if skip_setup:
+            finished = ("✓ cloned", "✗", "already exists")
+        else:
+            finished = ("✓ set up", "✗")
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=rich_console(),
         ) as progress:
             task = progress.add_task("Cloning repositories...", total=len(repos))
 
             def on_progress(name: str, status: str) -> None:
                 progress.update(task, description=f"{name}: {status}")
-                if "✓" in status or "skipping" in status:
+                if status.startswith(finished):
                     progress.advance(task)
 
-            results = asyncio.run(
-                clone_repos(repos, workspace, on_progress=on_progress)
-            )
+            results, setup_results = _run(on_progress)
 
         succeeded = sum(1 for v in results.values() if v)
-        failed = sum(1 for v in results.values() if not v)
-        console.print(f"\n✓ Cloned: {succeeded} | ✗ Failed: {failed}")
+        console.print(f"\n✓ Cloned: {succeeded} | ✗ Failed: {len(results) - succeeded}")
+        if setup_results:
+            set_up = sum(1 for steps in setup_results.values() if all(steps.values()))
+            setup_failed = len(setup_results) - set_up
+            console.print(f"✓ Set up: {set_up} | ✗ Setup failed: {setup_failed}")
 
-    # Create workspace config
-    config = WorkspaceConfig(workspace_root=str(workspace))
-    save_config(config, workspace)
+    history.save()
+    failed = sum(1 for v in results.values() if not v)
 
-    # Run setup if not skipped
-    if not skip_setup:
-        for entry in repos:
-            if entry.present and entry.local_path:
-                setup_repo(entry.local_path, entry.repo_type)
+    # Create or update workspace config
+    config.workspace_root = str(workspace)
+    save_config(config, workspace)
 
     if failed > 0:
         raise typer.Exit(code=1)
+
+
+def _remote_sizes(repos: list[RepoEntry]) -> dict[str, int]:
+    """Repo name → size on GitHub, for ordering clones without history."""
+    by_slug = {r.slug: r.name for r in repos}
+    sizes = asyncio.run(GhClient().get_repo_sizes(list(by_slug)))
+    return {by_slug[slug]: size for slug, size in sizes.items()}
+
+
+def _apply_clone_overrides(
+    config: WorkspaceConfig, clone_mode: list[str], depth: int | None
+) -> None:
+    """Apply `--clone-mode` / `--depth` to the workspace config.
+
+    A bare MODE replaces the default and clears per-tier modes; TIER=MODE
+    sets the mode for one tier and wins over a bare MODE.
+    """
+    for value in sorted(clone_mode, key=lambda v: "=" in v):
+        tier, _, mode = value.rpartition("=")
+        if mode not in CLONE_MODES:
+            raise typer.BadParameter(
+                f"{mode!r} is not one of {', '.join(CLONE_MODES)}",
+                param_hint="--clone-mode",
+            )
+        if not tier:
+            config.clone_mode = mode
+            config.tier_clone_modes = {}
+        elif tier.upper() in VALID_TIERS:
+            config.tier_clone_modes[tier.upper()] = mode
+        else:
+            raise typer.BadParameter(
+                f"unknown tier {tier!r}", param_hint="--clone-mode"
+            )
+    if depth is not None:
+        config.clone_depth = depth
@@ -0,0 +1,99 @@
+"""vindicta dev optimize.
+
+Run git maintenance (loose objects, repack, commit-graph) on all repos.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import typer
+
+from vindicta_cli.cli.output import ResultOutput, check_json_flags, console
+from vindicta_cli.lib.logger import setup_logging
+from vindicta_cli.lib.optimize_service import OptimizeResult, optimize_repos
+from vindicta_cli.lib.workspace import discover_workspace_root, load_config, scan_repos
+
+
+def optimize_cmd(
+    repo: list[str] = typer.Option(["all"], "-r", "--repo", help="Repos to optimize"),
+    tier: list[str] = typer.Option(["all"], "-t", "--tier", help="Filter by tier"),
+    parallel: int | None = typer.Option(
+        None, "--parallel", "-p", help="Concurrent repos (default: parallel_count)"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    json_output: bool = typer.Option(False, "--json", help="JSON output"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream one JSON object per repo as it completes"
+    ),
+) -> None:
+    """Pack loose objects, repack and write commit-graphs in every repo."""
+    check_json_flags(json_output, ndjson)
+    setup_logging()
+    workspace_root = discover_workspace_root()
+    if not workspace_root:
+        console.print("[red]No workspace found.[/red] Run `vindicta dev init` first.")
+        raise typer.Exit(code=1)
+
+    repos = scan_repos(
+        workspace_root, tiers=tier, names=repo if "all" not in repo else None
+    )
+    present = [(r.name, r.local_path) for r in repos if r.present and r.local_path]
+    if not present:
+        console.print("[yellow]No repos found in workspace.[/yellow]")
+        raise typer.Exit(code=0)
+
+    config = load_config(workspace_root)
+    out = ResultOutput(_optimize_record, json_output, ndjson)
+    results = optimize_repos(
+        present,
+        parallel_count=parallel or config.parallel_count,
+        on_result=out.stream,
+    )
+
+    out.emit_json(out.records(results))
+    if out.human:
+        from rich.table import Table
+
+        table = Table(title="Optimize Results")
+        table.add_column("Repository", style="cyan")
+        table.add_column("Loose objects", justify="right")
+        table.add_column("Packs", justify="right")
+        table.add_column("Pack size", justify="right")
+        table.add_column("Time", justify="right")
+        table.add_column("Status")
+
+        for r in results:
+            before, after = r.before, r.after
+            status = "✓" if r.success else f"[red]✗ {r.message}[/red]"
+            if before is None or after is None:
+                table.add_row(r.name, "—", "—", "—", "—", status)
+                continue
+            table.add_row(
+                r.name,
+                f"{before.loose_objects} → {after.loose_objects}",
+                f"{before.packs} → {after.packs}",
+                f"{before.pack_kib} → {after.pack_kib} KiB",
+                f"{sum(r.timings.values()):.1f}s",
+                status,
+            )
+            if verbose:
+                steps = ", ".join(f"{k} {v:.2f}s" for k, v in r.timings.items())
+                table.add_row("", f"[dim]{steps}[/dim]", "", "", "", "")
+
+        console.print(table)
+
+    if any(not r.success for r in results):
+        raise typer.Exit(code=1)
+
+
+def _optimize_record(result: OptimizeResult) -> dict:
+    """Machine-readable optimize result for --json and --ndjson."""
+    return {
+        "name": result.name,
+        "success": result.success,
+        "message": result.message,
+        "before": asdict(result.before) if result.before else None,
+        "after": asdict(result.after) if result.after else None,
+        "timings": {step: round(secs, 3) for step, secs in result.timings.items()},
+    }
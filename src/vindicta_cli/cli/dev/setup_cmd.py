@@ -5,18 +5,13 @@ Run setup for workspace repositories (deps, venvs, hooks).
 
 from __future__ import annotations
 
-import json
-
 import typer
-from rich.console import Console
-from rich.table import Table
 
+from vindicta_cli.cli.output import ResultOutput, check_json_flags, console
 from vindicta_cli.lib.logger import setup_logging
 from vindicta_cli.lib.setup_service import setup_repo
 from vindicta_cli.lib.workspace import discover_workspace_root, scan_repos
 
-console = Console()
-
 
 def setup_cmd(
     repo: list[str] = typer.Option(
@@ -25,10 +20,17 @@ def setup_cmd(
     skip_hooks: bool = typer.Option(False, "--skip-hooks", help="Skip hook install"),
     skip_venv: bool = typer.Option(False, "--skip-venv", help="Skip venv creation"),
     skip_node: bool = typer.Option(False, "--skip-node", help="Skip npm install"),
+    skip_git_tuning: bool = typer.Option(
+        False, "--skip-git-tuning", help="Skip untracked cache / fsmonitor setup"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
     json_output: bool = typer.Option(False, "--json", help="JSON output"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream one JSON object per repo as it completes"
+    ),
 ) -> None:
     """Set up dependencies and tooling for repositories."""
+    check_json_flags(json_output, ndjson)
     setup_logging()
     workspace_root = discover_workspace_root()
     if not workspace_root:
@@ -38,7 +40,7 @@ def setup_cmd(
     repos = scan_repos(workspace_root, names=repo if "all" not in repo else None)
     present = [r for r in repos if r.present and r.local_path]
 
-    all_results = {}
+    out = ResultOutput(_setup_record, json_output, ndjson)
     for entry in present:
         results = setup_repo(
             entry.local_path,
@@ -46,20 +48,28 @@ def setup_cmd(
             skip_venv=skip_venv,
             skip_hooks=skip_hooks,
             skip_node=skip_node,
+            skip_git_tuning=skip_git_tuning,
         )
-        all_results[entry.name] = results
+        out.add((entry.name, results))
+
+    out.emit_json(dict(out.kept))
+    if out.human:
+        from rich.table import Table
 
-    if json_output:
-        typer.echo(json.dumps(all_results, indent=2))
-    else:
         table = Table(title="Setup Results")
         table.add_column("Repository", style="cyan")
         table.add_column("Steps", style="green")
         table.add_column("Status")
 
-        for name, results in all_results.items():
+        for name, results in out.kept:
             steps = ", ".join(f"{k}={'✓' if v else '✗'}" for k, v in results.items())
             all_ok = all(results.values())
             table.add_row(name, steps, "✓" if all_ok else "[red]✗[/red]")
 
         console.print(table)
+
+
+def _setup_record(result: tuple[str, dict[str, bool]]) -> dict:
+    """Machine-readable setup result for --ndjson."""
+    name, steps = result
+    return {"name": name, "steps": steps}
@@ -6,20 +6,33 @@ Display workspace health dashboard.
 from __future__ import annotations
 
 import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
+from vindicta_cli.cli.output import check_json_flags, console, emit_ndjson, rich_console
+from vindicta_cli.lib.daemon import daemon_status
 from vindicta_cli.lib.logger import setup_logging
+from vindicta_cli.lib.status_cache import RepoStateTracker, collect_cached_repo_infos
 from vindicta_cli.lib.workspace import (
     discover_workspace_root,
-    get_repo_info,
+    load_config,
     scan_repos,
 )
+from vindicta_cli.models.repo_info import RepoEntry, RepoInfo
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Group
+
+    from vindicta_cli.lib.gh_client import RepoCiSummary
+
+_CI_LABELS = {
+    "passing": "[green]passing[/green]",
+    "failing": "[red]failing[/red]",
+    "pending": "[yellow]pending[/yellow]",
+}
 
 
 def status_cmd(
@@ -29,85 +42,254 @@ def status_cmd(
     ),
     ci: bool = typer.Option(False, "--ci", help="Include CI status (slower)"),
     detailed: bool = typer.Option(False, "--detailed", help="Show full details"),
+    watch: bool = typer.Option(
+        False, "--watch", "-w", help="Live dashboard that refreshes changed repos"
+    ),
+    interval: float = typer.Option(
+        2.0, "--interval", min=0.1, help="Seconds between --watch polls"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore cached repo and CI state"
+    ),
+    no_daemon: bool = typer.Option(
+        False, "--no-daemon", help="Don't use a running workspace daemon"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
     json_output: bool = typer.Option(False, "--json", help="JSON output"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream one JSON object per repo as it completes"
+    ),
 ) -> None:
     """Show workspace repository status dashboard."""
+    check_json_flags(json_output, ndjson)
     setup_logging()
     workspace_root = discover_workspace_root()
     if not workspace_root:
         console.print("[red]No workspace found.[/red] Run `vindicta dev init` first.")
         raise typer.Exit(code=1)
 
+    if watch:
+        if json_output or ndjson:
+            console.print("[red]--watch cannot be combined with JSON output[/red]")
+            raise typer.Exit(code=2)
+        _watch(workspace_root, tier, failing, interval)
+        return
+
     repos = scan_repos(workspace_root, tiers=tier)
     present = [r for r in repos if r.present and r.local_path]
 
-    # Gather repo info
-    infos = [get_repo_info(r.local_path, r) for r in present]
-
-    # Filter failing
-    if failing:
-        infos = [i for i in infos if i.is_dirty or not i.is_on_default]
-
-    if json_output:
-        output = [
-            {
-                "name": i.name,
-                "tier": i.tier,
-                "branch": i.current_branch,
-                "dirty": i.is_dirty,
-                "ahead": i.ahead,
-                "behind": i.behind,
-                "on_default": i.is_on_default,
-            }
-            for i in infos
-        ]
-        typer.echo(json.dumps(output, indent=2))
-    else:
-        # Group by tier
-        tiers_found: dict[str, list] = {}
+    # CI data is fetched up front so each row can be completed on its own
+    ci_summaries, stale_ci = (
+        _fetch_ci(present, workspace_root, refresh) if ci else ({}, [])
+    )
+
+    def _stream(info: RepoInfo) -> None:
+        _apply_ci(info, ci_summaries)
+        if not failing or _is_failing(info):
+            emit_ndjson(_status_record(info, ci))
+
+    on_result = _stream if ndjson else None
+
+    # Prefer warm state from a running daemon, else recompute changed repos
+    infos = None if no_daemon or refresh else daemon_status(workspace_root, tier)
+    if infos is not None and on_result:
         for info in infos:
-            tiers_found.setdefault(info.tier, []).append(info)
-
-        for tier_name in sorted(tiers_found.keys()):
-            tier_infos = tiers_found[tier_name]
-            table = Table(title=f"Tier {tier_name}")
-            table.add_column("Repository", style="cyan")
-            table.add_column("Branch", style="green")
-            table.add_column("Status")
-            table.add_column("Ahead", justify="right")
-            table.add_column("Behind", justify="right")
-
-            for info in tier_infos:
-                status_parts = []
-                if info.is_dirty:
-                    status_parts.append("[red]dirty[/red]")
-                if not info.is_on_default:
-                    status_parts.append("[yellow]off-default[/yellow]")
-                if not status_parts:
-                    status_parts.append("[green]clean[/green]")
-
-                table.add_row(
-                    info.name,
-                    info.current_branch,
-                    " ".join(status_parts),
-                    str(info.ahead),
-                    str(info.behind),
-                )
-
-            console.print(table)
-            console.print()
-
-        # Summary
-        total = len(infos)
-        dirty = sum(1 for i in infos if i.is_dirty)
-        off_default = sum(1 for i in infos if not i.is_on_default)
-        console.print(
-            Panel(
-                f"[bold]Total:[/bold] {total} repos | "
-                f"[bold green]Clean:[/bold green] {total - dirty} | "
-                f"[bold red]Dirty:[/bold red] {dirty} | "
-                f"[bold yellow]Off-default:[/bold yellow] {off_default}",
-                title="Summary",
-            )
+            on_result(info)
+    if infos is None:
+        config = load_config(workspace_root)
+        infos = collect_cached_repo_infos(
+            workspace_root,
+            present,
+            parallel_count=config.parallel_count,
+            ttl=config.status_cache_ttl,
+            refresh=refresh,
+            on_result=on_result,
+        )
+
+    if not ndjson:
+        for info in infos:
+            _apply_ci(info, ci_summaries)
+        if failing:
+            infos = [i for i in infos if _is_failing(i)]
+
+        if json_output:
+            output = [_status_record(i, ci) for i in infos]
+            typer.echo(json.dumps(output, indent=2))
+        else:
+            console.print(_render_dashboard(infos, ci=ci))
+
+    # Output is already on screen; refresh stale CI entries for next time
+    if stale_ci:
+        from vindicta_cli.lib.remote_cache import revalidate_detached
+
+        revalidate_detached(workspace_root, stale_ci)
+
+
+def _status_record(info: RepoInfo, ci: bool = False) -> dict:
+    """Machine-readable status row for --json and --ndjson."""
+    record = {
+        "name": info.name,
+        "tier": info.tier,
+        "branch": info.current_branch,
+        "upstream": info.upstream,
+        "dirty": info.is_dirty,
+        "ahead": info.ahead,
+        "behind": info.behind,
+        "staged": info.staged_count,
+        "unstaged": info.unstaged_count,
+        "untracked": info.untracked_count,
+        "conflicts": info.conflict_count,
+        "on_default": info.is_on_default,
+    }
+    if ci:
+        record["ci_status"] = info.ci_status
+        record["open_prs"] = info.open_pr_count
+    return record
+
+
+def _watch(
+    workspace_root: Path,
+    tier: list[str],
+    failing: bool,
+    interval: float,
+) -> None:
+    """Keep a live dashboard on screen, re-running git only for changed repos."""
+    from rich.live import Live
+
+    config = load_config(workspace_root)
+    tracker = RepoStateTracker()
+    # Edits to tracked files change the fingerprint and show up on the next
+    # poll; rows also age out like the cache for files in untracked dirs
+    max_age = config.status_cache_ttl or None
+
+    def _frame() -> Group:
+        repos = scan_repos(workspace_root, tiers=tier)
+        present = [r for r in repos if r.present and r.local_path]
+        tracker.refresh(present, parallel_count=config.parallel_count, max_age=max_age)
+        infos = [tracker.infos[r.name] for r in present if r.name in tracker.infos]
+        if failing:
+            infos = [i for i in infos if _is_failing(i)]
+        return _render_dashboard(
+            infos,
+            footer=(
+                f"Updated {time.strftime('%H:%M:%S')} — "
+                f"polling every {interval:g}s, Ctrl+C to exit"
+            ),
+        )
+
+    try:
+        with Live(_frame(), console=rich_console(), auto_refresh=False) as live:
+            while True:
+                time.sleep(interval)
+                live.update(_frame(), refresh=True)
+    except KeyboardInterrupt:
+        pass
+
+
+def _fetch_ci(
+    entries: list[RepoEntry], workspace_root: Path, refresh: bool = False
+) -> tuple[dict[str, RepoCiSummary], list[str]]:
+    """Get CI state and open PR counts from the remote cache or GitHub.
+
+    Returns:
+        Tuple of (repo name → summary, stale owner/name slugs to revalidate).
+    """
+    from vindicta_cli.lib.remote_cache import (
+        RemoteCache,
+        cached_check_auth,
+        get_cached_repo_summaries,
+    )
+
+    config = load_config(workspace_root)
+    cache = RemoteCache(workspace_root, ttl=config.remote_cache_ttl)
+    cache.load()
+    if not cached_check_auth(cache):
+        typer.echo("gh is not authenticated; skipping CI status", err=True)
+        return {}, []
+
+    summaries, stale = get_cached_repo_summaries(
+        cache, [e.slug for e in entries], refresh=refresh
+    )
+    by_name = {e.name: summaries[e.slug] for e in entries if e.slug in summaries}
+    return by_name, stale
+
+
+def _apply_ci(info: RepoInfo, summaries: dict[str, RepoCiSummary]) -> None:
+    """Copy a repo's CI summary onto its RepoInfo, if there is one."""
+    summary = summaries.get(info.name)
+    if summary:
+        info.ci_status = summary.ci_status
+        info.open_pr_count = summary.open_pr_count
+
+
+def _is_failing(info: RepoInfo) -> bool:
+    """Whether a repo is dirty, off its default branch, or failing CI."""
+    return info.is_dirty or not info.is_on_default or info.ci_status == "failing"
+
+
+def _render_dashboard(
+    infos: list[RepoInfo], footer: str | None = None, ci: bool = False
+) -> Group:
+    """Build tier tables and the summary panel as one renderable."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    renderables: list = []
+
+    # Group by tier
+    tiers_found: dict[str, list] = {}
+    for info in infos:
+        tiers_found.setdefault(info.tier, []).append(info)
+
+    for tier_name in sorted(tiers_found.keys()):
+        tier_infos = tiers_found[tier_name]
+        table = Table(title=f"Tier {tier_name}")
+        table.add_column("Repository", style="cyan")
+        table.add_column("Branch", style="green")
+        table.add_column("Status")
+        table.add_column("Ahead", justify="right")
+        table.add_column("Behind", justify="right")
+        if ci:
+            table.add_column("CI")
+            table.add_column("PRs", justify="right")
+
+        for info in tier_infos:
+            status_parts = []
+            if info.conflict_count:
+                status_parts.append("[bold red]conflicts[/bold red]")
+            if info.is_dirty:
+                status_parts.append("[red]dirty[/red]")
+            if not info.is_on_default:
+                status_parts.append("[yellow]off-default[/yellow]")
+            if not status_parts:
+                status_parts.append("[green]clean[/green]")
+
+            row = [
+                info.name,
+                info.current_branch,
+                " ".join(status_parts),
+                str(info.ahead),
+                str(info.behind),
+            ]
+            if ci:
+                row += [_CI_LABELS.get(info.ci_status, "-"), str(info.open_pr_count)]
+            table.add_row(*row)
+
+        renderables.extend([table, ""])
+
+    # Summary
+    total = len(infos)
+    dirty = sum(1 for i in infos if i.is_dirty)
+    off_default = sum(1 for i in infos if not i.is_on_default)
+    renderables.append(
+        Panel(
+            f"[bold]Total:[/bold] {total} repos | "
+            f"[bold green]Clean:[/bold green] {total - dirty} | "
+            f"[bold red]Dirty:[/bold red] {dirty} | "
+            f"[bold yellow]Off-default:[/bold yellow] {off_default}",
+            title="Summary",
+            subtitle=footer,
         )
+    )
+    return Group(*renderables)
@@ -7,27 +7,81 @@ from __future__ import annotations
 
 import asyncio
 import json
+import subprocess
+import sys
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
+from vindicta_cli.cli.output import ResultOutput, check_json_flags, console
+from vindicta_cli.lib.concurrency import AdaptiveLimiter
+from vindicta_cli.lib.daemon import notify_daemon
 from vindicta_cli.lib.logger import setup_logging
-from vindicta_cli.lib.sync_service import sync_repos
-from vindicta_cli.lib.workspace import discover_workspace_root, scan_repos
+from vindicta_cli.lib.prefetch import (
+    consume_prefetches,
+    fresh_prefetches,
+    prefetch_workspace,
+    used_prefetches,
+)
+from vindicta_cli.lib.remote_cache import invalidate_repo_summaries
+from vindicta_cli.lib.scheduler import schedule
+from vindicta_cli.lib.sync_history import (
+    PHASES,
+    append_run,
+    load_runs,
+    summarize,
+    typical,
+)
+from vindicta_cli.lib.sync_service import SyncResult, sync_repos
+from vindicta_cli.lib.workspace import (
+    discover_workspace_root,
+    load_config,
+    scan_repos,
+)
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.table import Table
 
 
 def sync_cmd(
     pull: bool = typer.Option(False, "--pull", help="Also pull changes"),
     parallel: int = typer.Option(4, "--parallel", "-p", help="Concurrent ops"),
+    adaptive: bool = typer.Option(
+        False,
+        "--adaptive",
+        help="Tune concurrency from fetch latency and errors (starts at --parallel)",
+    ),
+    skip_unchanged: bool = typer.Option(
+        False,
+        "--skip-unchanged",
+        help="Check remotes with ls-remote and skip fetches that would be no-ops",
+    ),
+    deadline: float | None = typer.Option(
+        None,
+        "--deadline",
+        help="Overall time budget in seconds; unfinished repos are timed_out",
+    ),
+    prefetch: bool = typer.Option(
+        False,
+        "--prefetch",
+        help="Only download remote changes into refs/prefetch/ for a later sync",
+    ),
+    background: bool = typer.Option(
+        False, "--background", help="Run --prefetch detached and return immediately"
+    ),
     tier: list[str] = typer.Option(["all"], "-t", "--tier", help="Filter by tier"),
     force: bool = typer.Option(False, "--force", help="Sync dirty repos too"),
+    timings: bool = typer.Option(
+        False, "--timings", help="Show per-repo phase timings with p50/p95 history"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
     json_output: bool = typer.Option(False, "--json", help="JSON output"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream one JSON object per repo as it completes"
+    ),
 ) -> None:
     """Synchronize all repositories with remote."""
+    check_json_flags(json_output, ndjson)
     setup_logging()
     workspace_root = discover_workspace_root()
     if not workspace_root:
@@ -35,37 +89,103 @@ def sync_cmd(
         raise typer.Exit(code=1)
 
     repos = scan_repos(workspace_root, tiers=tier)
+    config = load_config(workspace_root)
+    past = summarize(load_runs(workspace_root))
+    # Longest repos start first so they don't hold up the end of the run
     present_repos = [
-        (r.name, r.local_path) for r in repos if r.present and r.local_path
+        (r.name, r.local_path)
+        for r in schedule(repos, typical(past, "total"))
+        if r.present and r.local_path
     ]
 
     if not present_repos:
         console.print("[yellow]No repos found in workspace.[/yellow]")
         raise typer.Exit(code=0)
 
+    profiles = {r.name: config.fetch_profile_for(r.name) for r in repos}
+
+    if background:
+        # Fetch profiles and timeouts come from the workspace config
+        args = ["--prefetch", "--parallel", str(parallel)]
+        args += [arg for t in tier for arg in ("-t", t)]
+        if deadline is not None:
+            args += ["--deadline", str(deadline)]
+        process = subprocess.Popen(
+            [sys.executable, "-m", "vindicta_cli.main", "dev", "sync", *args],
+            cwd=str(workspace_root),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        if json_output:
+            typer.echo(json.dumps({"background": True, "pid": process.pid}))
+        else:
+            console.print(
+                f"Prefetching {len(present_repos)} repos in the background "
+                f"(pid {process.pid})"
+            )
+        return
+
+    if prefetch:
+        outcomes = asyncio.run(
+            prefetch_workspace(
+                workspace_root,
+                present_repos,
+                profiles=profiles,
+                parallel_count=parallel,
+                timeout=config.sync_timeout,
+                deadline=deadline,
+            )
+        )
+        if json_output:
+            output = [{"name": n, "success": ok} for n, ok in outcomes.items()]
+            typer.echo(json.dumps(output, indent=2))
+        else:
+            console.print(
+                f"Prefetched {sum(outcomes.values())}/{len(outcomes)} repos "
+                "into refs/prefetch/"
+            )
+        if not all(outcomes.values()):
+            raise typer.Exit(code=1)
+        return
+
+    # Recent prefetches turn the network fetch into a local ref update
+    fresh = fresh_prefetches(workspace_root, config.prefetch_max_age)
+
+    out = ResultOutput(_sync_record, json_output, ndjson)
+    limiter = None
+    if adaptive:
+        limiter = AdaptiveLimiter(initial=max(1, min(parallel, 16)), maximum=16)
+
     results = asyncio.run(
         sync_repos(
             repos=present_repos,
             pull=pull,
             force=force,
             parallel_count=parallel,
+            limiter=limiter,
+            skip_unchanged=skip_unchanged,
+            deadline=deadline,
+            fetch_profiles=profiles,
+            prefetched=fresh,
+            fetch_baselines=typical(past, "fetch"),
+            on_result=out.stream,
         )
     )
+    append_run(workspace_root, results)
+    consume_prefetches(workspace_root, used_prefetches(results, fresh))
+    registry_order = {r.name: i for i, r in enumerate(repos)}
+    results.sort(key=lambda r: registry_order[r.name])
+    notify_daemon(workspace_root, [r.name for r in results])
+    slugs = {r.name: r.slug for r in repos}
+    moved = [slugs[r.name] for r in results if r.refs_moved]
+    invalidate_repo_summaries(workspace_root, moved)
+
+    out.emit_json(out.records(results))
+    if out.human:
+        from rich.table import Table
 
-    if json_output:
-        output = [
-            {
-                "name": r.name,
-                "action": r.action,
-                "success": r.success,
-                "ahead": r.ahead,
-                "behind": r.behind,
-                "message": r.message,
-            }
-            for r in results
-        ]
-        typer.echo(json.dumps(output, indent=2))
-    else:
         table = Table(title="Sync Results")
         table.add_column("Repository", style="cyan")
         table.add_column("Action", style="green")
@@ -78,7 +198,56 @@ def sync_cmd(
             table.add_row(r.name, r.action, str(r.ahead), str(r.behind), status)
 
         console.print(table)
+        if timings:
+            console.print(_timings_table(results, summarize(load_runs(workspace_root))))
+
+    if limiter is not None:
+        # stderr, so --json and --ndjson output keep their schema
+        typer.echo(
+            f"Adaptive concurrency settled at {limiter.limit} (peak {limiter.peak})",
+            err=True,
+        )
 
     failed = sum(1 for r in results if not r.success)
     if failed:
         raise typer.Exit(code=1)
+
+
+def _sync_record(result: SyncResult) -> dict:
+    """Machine-readable sync result for --json and --ndjson."""
+    return {
+        "name": result.name,
+        "action": result.action,
+        "success": result.success,
+        "ahead": result.ahead,
+        "behind": result.behind,
+        "message": result.message,
+        "timings": {phase: round(secs, 3) for phase, secs in result.timings.items()},
+    }
+
+
+def _timings_table(results: list[SyncResult], summary: dict[str, dict]) -> Table:
+    """Rich table of this run's phase timings and total p50/p95 history."""
+    from rich.table import Table
+
+    def _fmt(secs: float | None) -> str:
+        return "—" if secs is None else f"{secs:.2f}s"
+
+    table = Table(title="Sync Timings")
+    table.add_column("Repository", style="cyan")
+    for phase in PHASES:
+        table.add_column(phase.capitalize(), justify="right")
+    table.add_column("Total p50", justify="right")
+    table.add_column("Total p95", justify="right")
+    table.add_column("Runs", justify="right")
+
+    for r in sorted(results, key=lambda r: -r.timings.get("total", 0)):
+        total = summary.get(r.name, {}).get("total", {})
+        table.add_row(
+            r.name,
+            *(_fmt(r.timings.get(phase)) for phase in PHASES),
+            _fmt(total.get("p50")),
+            _fmt(total.get("p95")),
+            str(total.get("runs", 0)),
+        )
+    return table
@@ -5,17 +5,13 @@ Validate Platform Constitution compliance.
 
 from __future__ import annotations
 
-import json
-
 import typer
-from rich.console import Console
-from rich.table import Table
 
+from vindicta_cli.cli.output import ResultOutput, check_json_flags, console
 from vindicta_cli.lib.logger import setup_logging
 from vindicta_cli.lib.validate_service import validate_repo
 from vindicta_cli.lib.workspace import discover_workspace_root, scan_repos
-
-console = Console()
+from vindicta_cli.models.validation_result import ValidationResult
 
 
 def validate_cmd(
@@ -26,8 +22,12 @@ def validate_cmd(
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
     json_output: bool = typer.Option(False, "--json", help="JSON output"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Stream one JSON object per repo as it completes"
+    ),
 ) -> None:
     """Validate Platform Constitution compliance across repos."""
+    check_json_flags(json_output, ndjson)
     setup_logging()
     workspace_root = discover_workspace_root()
     if not workspace_root:
@@ -37,7 +37,8 @@ def validate_cmd(
     repos = scan_repos(workspace_root, names=repo if "all" not in repo else None)
     present = [r for r in repos if r.present and r.local_path]
 
-    all_results = []
+    out = ResultOutput(_validation_record, json_output, ndjson)
+    has_failures = False
     for entry in present:
         result = validate_repo(
             entry.local_path,
@@ -45,26 +46,14 @@ def validate_cmd(
             auto_fix=fix,
             checks=check,
         )
-        all_results.append(result)
-
-    if json_output:
-        output = [
-            {
-                "repo": r.repo_name,
-                "compliance_score": round(r.compliance_score, 1),
-                "passed": r.total_passed,
-                "failed": r.total_failed,
-                "fixed": r.total_fixed,
-                "checks": [
-                    {"name": c.name, "passed": c.passed, "message": c.message}
-                    for c in r.checks
-                ],
-            }
-            for r in all_results
-        ]
-        typer.echo(json.dumps(output, indent=2))
-    else:
-        for result in all_results:
+        has_failures = has_failures or result.total_failed > 0
+        out.add(result)
+
+    out.emit_json()
+    if out.human:
+        from rich.table import Table
+
+        for result in out.kept:
             table = Table(title=f"{result.repo_name} ({result.compliance_score:.0f}%)")
             table.add_column("Check", style="cyan")
             table.add_column("Status")
@@ -78,10 +67,24 @@ def validate_cmd(
             console.print()
 
         # Summary
-        total_score = sum(r.compliance_score for r in all_results)
-        avg_score = total_score / len(all_results) if all_results else 0
+        total_score = sum(r.compliance_score for r in out.kept)
+        avg_score = total_score / len(out.kept) if out.kept else 0
         console.print(f"[bold]Average compliance:[/bold] {avg_score:.0f}%")
 
-    has_failures = any(r.total_failed > 0 for r in all_results)
     if has_failures:
         raise typer.Exit(code=1)
+
+
+def _validation_record(result: ValidationResult) -> dict:
+    """Machine-readable validation result for --json and --ndjson."""
+    return {
+        "repo": result.repo_name,
+        "compliance_score": round(result.compliance_score, 1),
+        "passed": result.total_passed,
+        "failed": result.total_failed,
+        "fixed": result.total_fixed,
+        "checks": [
+            {"name": c.name, "passed": c.passed, "message": c.message}
+            for c in result.checks
+        ],
+    }
@@ -0,0 +1,53 @@
+"""Lazy command registry.
+
+Maps subcommand names to ``module:attribute`` import paths so a command
+module (and everything it imports) is only loaded when that command is
+invoked or its help text is rendered.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+import typer
+from typer.core import TyperGroup
+
+if TYPE_CHECKING:
+    import click
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup that resolves registered commands on first use.
+
+    Subclasses declare ``lazy_commands`` as ``{name: "module:attr"}`` where
+    ``attr`` is either a command function or a ``typer.Typer`` sub-app.
+    """
+
+    lazy_commands: dict[str, str] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        eager = super().list_commands(ctx)
+        return eager + [name for name in self.lazy_commands if name not in eager]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = _load_command(cmd_name, self.lazy_commands[cmd_name])
+            self.commands[cmd_name] = command
+        return command
+
+
+def _load_command(name: str, import_path: str) -> Any:
+    """Import ``module:attr`` and convert it into a Click command."""
+    module_name, _, attr = import_path.partition(":")
+    target = getattr(importlib.import_module(module_name), attr)
+
+    if isinstance(target, typer.Typer):
+        group = typer.main.get_group(target)
+        group.name = name
+        return group
+
+    single = typer.Typer()
+    single.command(name)(target)
+    return typer.main.get_command(single)
@@ -0,0 +1,101 @@
+"""Shared console for CLI commands.
+
+Rich is only imported the first time something is printed through the
+console, so machine-readable (``--json``) invocations never load it.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+
+import typer
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+T = TypeVar("T")
+
+
+class _LazyConsole:
+    """Proxy that creates the Rich console on first attribute access."""
+
+    def __init__(self) -> None:
+        self._console: Console | None = None
+
+    def _get(self) -> Console:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+
+console = _LazyConsole()
+
+
+def rich_console() -> Console:
+    """Return the real Rich console for APIs that need an instance (e.g. Live)."""
+    return console._get()
+
+
+def emit_ndjson(record: dict[str, Any]) -> None:
+    """Write one compact JSON object per line and flush it immediately."""
+    typer.echo(json.dumps(record, separators=(",", ":")))
+
+
+def check_json_flags(json_output: bool, ndjson: bool) -> None:
+    """Exit with a usage error if both --json and --ndjson were passed."""
+    if json_output and ndjson:
+        console.print("[red]--json and --ndjson cannot be combined[/red]")
+        raise typer.Exit(code=2)
+
+
+class ResultOutput(Generic[T]):
+    """Per-repo results of a command with --json and --ndjson.
+
+    With --ndjson each result is written as soon as its repo finishes;
+    otherwise results are kept for the --json document or the table the
+    command prints at the end.
+    """
+
+    def __init__(
+        self,
+        to_record: Callable[[T], dict[str, Any]],
+        json_output: bool = False,
+        ndjson: bool = False,
+    ) -> None:
+        self.kept: list[T] = []
+        self._to_record = to_record
+        self._json_output = json_output
+        self._ndjson = ndjson
+
+    @property
+    def human(self) -> bool:
+        """Whether the command should print human-readable output."""
+        return not (self._json_output or self._ndjson)
+
+    @property
+    def stream(self) -> Callable[[T], None] | None:
+        """`on_result` callback for services: `add` with --ndjson, else None."""
+        return self.add if self._ndjson else None
+
+    def add(self, result: T) -> None:
+        """Stream `result` with --ndjson, else keep it for the final output."""
+        if self._ndjson:
+            emit_ndjson(self._to_record(result))
+        else:
+            self.kept.append(result)
+
+    def records(self, results: list[T] | None = None) -> list[dict[str, Any]]:
+        """Records for `results`, or for the kept results."""
+        return [self._to_record(r) for r in (self.kept if results is None else results)]
+
+    def emit_json(self, payload: Any = None) -> None:
+        """With --json, print `payload` (default: the kept results' records)."""
+        if self._json_output:
+            output = self.records() if payload is None else payload
+            typer.echo(json.dumps(output, indent=2))
@@ -0,0 +1,252 @@
+"""Bundle service — offline workspace bootstrap from git bundles.
+
+`vindicta dev bundle` writes one git bundle per workspace repo into a
+directory that can be copied to CI runners or air-gapped machines, and
+`vindicta dev init --from-bundles DIR` seeds a workspace from it without
+touching the network.
+
+Bundles carry each repo's remote-tracking branches (under their
+`refs/remotes/origin/` names) and tags, so a seeded repo looks like a
+fresh clone. `manifest.json` lists every repo's bundle chain: a full
+bundle followed by any incremental bundles holding only the commits
+added since the previous one.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from vindicta_cli.lib import git_refs
+from vindicta_cli.lib.git_exec import run_git
+from vindicta_cli.lib.json_store import atomic_write_json, load_versioned_json
+from vindicta_cli.lib.logger import get_logger
+
+logger = get_logger("bundle_service")
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Refs written to bundles: branches as the remote has them, and tags
+BUNDLE_REF_PREFIXES = ("refs/remotes/origin/", "refs/tags/")
+
+# Config git sets on partial clones: the filter extension and promisor remotes
+PARTIAL_CLONE_CONFIG = r"^(extensions\.partialclone|remote\..*\.promisor)$"
+
+
+@dataclass
+class BundleResult:
+    """Result of bundling a single repository."""
+
+    name: str
+    success: bool
+    action: str = ""  # "full", "incremental", "up-to-date", "failed"
+    file: str | None = None
+    refs: int = 0
+    size: int = 0  # bytes
+    message: str = ""
+
+
+def load_manifest(bundle_dir: Path) -> dict[str, Any]:
+    """Return the manifest's repo name → entry mapping ({} if unusable)."""
+    return load_versioned_json(bundle_dir / MANIFEST_NAME, MANIFEST_VERSION, "repos")
+
+
+def _save_manifest(bundle_dir: Path, repos: dict[str, Any]) -> None:
+    data = {"version": MANIFEST_VERSION, "repos": repos}
+    atomic_write_json(bundle_dir / MANIFEST_NAME, data, indent=2)
+
+
+def bundle_repos(
+    repos: list[tuple[str, Path]],
+    bundle_dir: Path,
+    incremental: bool = False,
+    parallel_count: int = 4,
+    on_result: Callable[[BundleResult], None] | None = None,
+) -> list[BundleResult]:
+    """Write a bundle for each repository and update the manifest.
+
+    Args:
+        repos: List of (name, path) tuples.
+        bundle_dir: Output directory (created if missing).
+        incremental: Only bundle commits added since each repo's last
+            bundle in `bundle_dir`; repos without one get a full bundle.
+        parallel_count: Max repos bundled at once.
+        on_result: Called with each result as soon as its repo finishes.
+
+    Returns:
+        BundleResult list in the same order as `repos`.
+    """
+    if not repos:
+        return []
+
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(bundle_dir)
+
+    workers = max(1, min(parallel_count, len(repos)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                bundle_repo,
+                path,
+                name,
+                bundle_dir,
+                manifest.get(name) if incremental else None,
+            )
+            for name, path in repos
+        ]
+        if on_result:
+            for future in as_completed(futures):
+                on_result(future.result()[0])
+        outcomes = [future.result() for future in futures]
+
+    for result, entry in outcomes:
+        if entry is None:
+            continue
+        # A new full bundle replaces the old chain; drop its files
+        kept = {bundle["file"] for bundle in entry["bundles"]}
+        for bundle in manifest.get(result.name, {}).get("bundles", []):
+            if bundle["file"] not in kept:
+                (bundle_dir / bundle["file"]).unlink(missing_ok=True)
+        manifest[result.name] = entry
+    _save_manifest(bundle_dir, manifest)
+    return [result for result, _ in outcomes]
+
+
+def bundle_repo(
+    repo_path: Path,
+    name: str,
+    bundle_dir: Path,
+    previous: dict[str, Any] | None = None,
+) -> tuple[BundleResult, dict[str, Any] | None]:
+    """Bundle one repository.
+
+    Args:
+        repo_path: Repository to bundle.
+        name: Repo name, used for bundle file names.
+        bundle_dir: Output directory.
+        previous: The repo's existing manifest entry to build an
+            incremental bundle on, or None for a full bundle.
+
+    Returns:
+        Tuple of (result, new manifest entry or None if unchanged/failed).
+    """
+    git_dir = git_refs.resolve_git_dir(repo_path)
+    if git_dir is None:
+        return BundleResult(name, False, "failed", message="Not a git repository"), None
+    incomplete = _incomplete_history(repo_path, git_dir)
+    if incomplete:
+        message = f"{incomplete}; bundles need full history"
+        return BundleResult(name, False, "failed", message=message), None
+
+    refs: dict[str, str] = {}
+    for prefix in BUNDLE_REF_PREFIXES:
+        refs.update(git_refs.list_refs(git_dir, prefix))
+    default = git_refs.default_branch(git_dir)
+    if not refs or default is None:
+        message = "No remote-tracking branches to bundle"
+        return BundleResult(name, False, "failed", message=message), None
+
+    chain = list(previous["bundles"]) if previous else []
+    known = {sha for bundle in chain for sha in bundle["refs"].values()}
+    if chain and refs == chain[-1]["refs"]:
+        return BundleResult(name, True, "up-to-date", refs=len(refs)), None
+
+    filename = f"{name}.bundle" if not chain else f"{name}.{len(chain)}.bundle"
+    target = bundle_dir / filename
+    tmp = target.with_name(f"{filename}.{os.getpid()}.tmp")
+    cmd = ["bundle", "create", "--quiet", str(tmp), *sorted(refs)]
+    if known:
+        cmd += ["--not", *sorted(known)]
+
+    try:
+        completed = run_git(cmd, repo_path)
+        if completed.returncode != 0 and "empty bundle" in completed.stderr:
+            # Refs moved (e.g. a branch was deleted) without new commits
+            return BundleResult(name, True, "up-to-date", refs=len(refs)), None
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip() or "git bundle failed")
+        os.replace(tmp, target)
+    except (subprocess.TimeoutExpired, OSError, RuntimeError) as e:
+        tmp.unlink(missing_ok=True)
+        logger.warning("Bundling %s failed: %s", name, e)
+        return BundleResult(name, False, "failed", message=str(e)), None
+
+    chain.append({"file": filename, "refs": refs, "created": time.time()})
+    result = BundleResult(
+        name,
+        True,
+        "incremental" if len(chain) > 1 else "full",
+        file=filename,
+        refs=len(refs),
+        size=target.stat().st_size,
+    )
+    return result, {"default_branch": default, "bundles": chain}
+
+
+def _incomplete_history(repo_path: Path, git_dir: Path) -> str | None:
+    """Describe why a repo is missing objects a bundle needs, if it is.
+
+    Shallow clones lack the commits behind their grafts and partial
+    clones lack blobs or trees, so a bundle made from either could not
+    be unbundled on its own.
+    """
+    if (git_refs.common_dir(git_dir) / "shallow").exists():
+        return "Shallow clone (run `git fetch --unshallow`)"
+    try:
+        completed = run_git(
+            ["config", "--get-regexp", PARTIAL_CLONE_CONFIG], repo_path, timeout=10
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    for line in completed.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        if key == "extensions.partialclone" or value.lower() == "true":
+            return "Partial clone"
+    return None
+
+
+def clone_from_bundles(bundle_dir: Path, name: str, target: Path, url: str) -> None:
+    """Create `target` from a repo's bundle chain, without the network.
+
+    Args:
+        bundle_dir: Directory holding the bundles and manifest.
+        name: Repo name in the manifest.
+        target: Directory to create.
+        url: Remote URL `origin` should point at.
+
+    Raises:
+        LookupError: If the manifest has no bundles for `name`.
+        RuntimeError: If a git step fails.
+    """
+    entry = load_manifest(bundle_dir).get(name)
+    if not entry or not entry.get("bundles"):
+        raise LookupError(f"No bundle for {name} in {bundle_dir}")
+    default = entry["default_branch"]
+
+    target.mkdir(parents=True)
+    steps = [["init", "--quiet"], ["remote", "add", "origin", url]]
+    # Each incremental bundle's prerequisites come from the one before it
+    for bundle in entry["bundles"]:
+        steps.append(
+            [
+                "fetch",
+                "--quiet",
+                str(bundle_dir / bundle["file"]),
+                "+refs/remotes/origin/*:refs/remotes/origin/*",
+                "+refs/tags/*:refs/tags/*",
+            ]
+        )
+    steps += [
+        ["remote", "set-head", "origin", default],
+        ["checkout", "--quiet", "-B", default, "--track", f"origin/{default}"],
+    ]
+    for args in steps:
+        completed = run_git(args, target)
+        if completed.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {completed.stderr.strip()}")
@@ -0,0 +1,129 @@
+"""Adaptive concurrency control.
+
+`AdaptiveLimiter` bounds in-flight async tasks like a semaphore whose size
+follows AIMD (additive increase, multiplicative decrease), the scheme TCP
+uses for congestion control: the limit grows while operations succeed at
+a steady latency and is cut when timeouts, transport errors or latency
+spikes show the network (or remote) is saturated.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from vindicta_cli.lib.logger import get_logger
+
+logger = get_logger("concurrency")
+
+
+@dataclass
+class Slot:
+    """Handle for one acquired unit of concurrency."""
+
+    started: float
+
+
+class AdaptiveLimiter:
+    """AIMD-controlled concurrency limit for asyncio tasks.
+
+    Starts in slow start (the limit grows by one per success, roughly
+    doubling each round) until the first congestion signal, then grows by
+    about one per round of `limit` successes. A congestion signal
+    multiplies the limit by `backoff`; signals from tasks that started
+    before the last cut are ignored so one bad burst only counts once.
+
+    Latency varies a lot between repos, so each task is compared with
+    its own baseline (e.g. that repo's typical fetch time): a spike is
+    declared when it takes more than `latency_tolerance` times that.
+    Tasks without a baseline never count as spikes.
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 16,
+        backoff: float = 0.5,
+        latency_tolerance: float = 4.0,
+    ) -> None:
+        if not (1 <= minimum <= initial <= maximum):
+            raise ValueError(
+                f"Need 1 <= minimum <= initial <= maximum, "
+                f"got {minimum}, {initial}, {maximum}"
+            )
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.peak = initial
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._slow_start = True
+        self._last_decrease = float("-inf")
+        self._condition: asyncio.Condition | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of tasks allowed to run at once."""
+        return int(self._limit)
+
+    def _cond(self) -> asyncio.Condition:
+        # Created lazily so the limiter can be built outside a running loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self) -> Slot:
+        """Wait until the task may run under the current limit."""
+        async with self._cond():
+            await self._cond().wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return Slot(started=time.monotonic())
+
+    async def release(
+        self,
+        slot: Slot,
+        latency: float | None = None,
+        ok: bool = True,
+        baseline: float | None = None,
+    ) -> None:
+        """Finish a task and feed its outcome into the controller.
+
+        Args:
+            slot: Handle returned by `acquire`.
+            latency: Duration of the measured operation, or None if the
+                task didn't complete one (e.g. it was skipped or failed
+                for reasons unrelated to load).
+            ok: False for timeouts and transport errors. Other failures,
+                such as bad credentials, should pass True with no latency.
+            baseline: Usual duration of this task's operation, if known.
+        """
+        async with self._cond():
+            self._in_flight -= 1
+            if not ok or self._is_spike(latency, baseline):
+                self._decrease(slot)
+            elif latency is not None:
+                self._increase()
+            self._cond().notify_all()
+
+    def _is_spike(self, latency: float | None, baseline: float | None) -> bool:
+        return (
+            latency is not None
+            and baseline is not None
+            and latency > baseline * self.latency_tolerance
+        )
+
+    def _increase(self) -> None:
+        step = 1.0 if self._slow_start else 1.0 / max(self._limit, 1.0)
+        self._limit = min(float(self.maximum), self._limit + step)
+        self.peak = max(self.peak, self.limit)
+
+    def _decrease(self, slot: Slot) -> None:
+        self._slow_start = False
+        if slot.started <= self._last_decrease:
+            return
+        self._limit = max(float(self.minimum), self._limit * self.backoff)
+        self._last_decrease = time.monotonic()
+        logger.debug("Concurrency backed off to %d", self.limit)
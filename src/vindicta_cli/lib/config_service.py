@@ -6,16 +6,34 @@ Workspace configuration management operations.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
 
 from vindicta_cli.lib.logger import get_logger
 from vindicta_cli.lib.workspace import load_config, save_config
-from vindicta_cli.models.workspace_config import WorkspaceConfig
+from vindicta_cli.models.workspace_config import (
+    CLONE_MODES,
+    FETCH_PROFILES,
+    WorkspaceConfig,
+)
 
 logger = get_logger("config_service")
 
+
+class _RequiredKeySpec(TypedDict):
+    type: type
+    desc: str
+
+
+class KeySpec(_RequiredKeySpec, total=False):
+    """Type, description and allowed values of a configuration key."""
+
+    min: int
+    max: int
+    choices: tuple[str, ...]
+
+
 # Valid configuration keys with types and descriptions
-CONFIG_KEYS = {
+CONFIG_KEYS: dict[str, KeySpec] = {
     "parallel_count": {
         "type": int,
         "min": 1,
@@ -29,11 +47,55 @@ CONFIG_KEYS = {
         "max": 600,
         "desc": "Sync timeout (seconds)",
     },
+    "fetch_profile": {
+        "type": str,
+        "choices": FETCH_PROFILES,
+        "desc": "Default sync fetch profile",
+    },
+    "prefetch_max_age": {
+        "type": int,
+        "min": 0,
+        "max": 86400,
+        "desc": "Use background prefetches younger than this (seconds, 0 disables)",
+    },
+    "prefetch_interval": {
+        "type": int,
+        "min": 0,
+        "max": 86400,
+        "desc": "Daemon prefetch interval (seconds, 0 disables)",
+    },
+    "clone_mode": {
+        "type": str,
+        "choices": CLONE_MODES,
+        "desc": "Default init clone mode (tier_clone_modes overrides)",
+    },
+    "clone_depth": {
+        "type": int,
+        "min": 1,
+        "max": 100000,
+        "desc": "Commits fetched by shallow clones",
+    },
+    "mirror_cache": {
+        "type": bool,
+        "desc": "Clone through the shared user-level mirror store",
+    },
     "auto_fix": {"type": bool, "desc": "Auto-fix validation issues"},
     "constitution_check": {"type": bool, "desc": "Enable constitution checks"},
     "link_check": {"type": bool, "desc": "Enable markdown link checks"},
     "install_hooks": {"type": bool, "desc": "Install pre-commit hooks on setup"},
     "create_venvs": {"type": bool, "desc": "Create virtual environments on setup"},
+    "status_cache_ttl": {
+        "type": int,
+        "min": 0,
+        "max": 86400,
+        "desc": "Status cache lifetime (seconds, 0 disables)",
+    },
+    "remote_cache_ttl": {
+        "type": int,
+        "min": 0,
+        "max": 86400,
+        "desc": "GitHub PR/CI cache lifetime (seconds, 0 disables)",
+    },
     "verbose": {"type": bool, "desc": "Enable verbose output"},
     "json_output": {"type": bool, "desc": "Default to JSON output"},
 }
@@ -84,6 +146,8 @@ def set_config_value(workspace_root: Path, key: str, value: str) -> Any:
         raise ValueError(f"{key} must be >= {spec['min']}")
     if "max" in spec and coerced > spec["max"]:
         raise ValueError(f"{key} must be <= {spec['max']}")
+    if "choices" in spec and coerced not in spec["choices"]:
+        raise ValueError(f"{key} must be one of: {', '.join(spec['choices'])}")
 
     config = load_config(workspace_root)
     setattr(config, key, coerced)
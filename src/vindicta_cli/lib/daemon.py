@@ -0,0 +1,315 @@
+"""Workspace daemon — keeps workspace state warm between commands.
+
+The daemon holds the workspace config, the scanned registry and the last
+computed `RepoInfo` for every present repo, and answers newline-delimited
+JSON requests over a Unix domain socket. Repo state is recomputed when a
+repo's git metadata or tracked files change, and in the background once
+it gets older than `max_age` so files in untracked directories are
+eventually picked up. When
+`prefetch_interval` is set it also prefetches all repos on that schedule
+so the next `sync` doesn't wait on the network.
+
+Only `status` reads state from the daemon. `sync` needs the live dirty
+state of each repo, not a copy that may lag by up to `max_age`, so it
+only tells the daemon which repos it changed. `validate` and `doctor`
+check files, hooks and tooling that the daemon doesn't hold.
+
+Commands talk to it through `request_daemon`, which returns None when no
+daemon is running so callers can fall back to computing state directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.lib.prefetch import prefetch_workspace
+from vindicta_cli.lib.status_cache import RepoStateTracker
+from vindicta_cli.lib.workspace import (
+    CONFIG_FILENAME,
+    load_config,
+    scan_repos,
+)
+from vindicta_cli.models.repo_info import RepoEntry, RepoInfo
+from vindicta_cli.models.workspace_config import WorkspaceConfig
+
+logger = get_logger("daemon")
+
+DAEMON_SUPPORTED = sys.platform != "win32" and hasattr(socket, "AF_UNIX")
+
+# AF_UNIX paths are limited to ~104-108 bytes depending on the platform
+_MAX_SOCKET_PATH = 100
+
+
+def socket_path(workspace_root: Path) -> Path:
+    """Return the daemon socket path for a workspace.
+
+    Uses `.vindicta/daemon.sock` inside the workspace, falling back to a
+    hashed name in the temp dir when that path is too long for AF_UNIX.
+    """
+    path = workspace_root / ".vindicta" / "daemon.sock"
+    if len(str(path)) <= _MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha1(str(workspace_root).encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"vindicta-{digest}.sock"
+
+
+def pid_path(workspace_root: Path) -> Path:
+    """Return the daemon PID file path for a workspace."""
+    return workspace_root / ".vindicta" / "daemon.pid"
+
+
+class WorkspaceDaemon:
+    """In-memory workspace state served over a Unix domain socket."""
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        refresh_interval: float = 2.0,
+        max_age: float = 30.0,
+    ) -> None:
+        self.workspace_root = workspace_root
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.config: WorkspaceConfig = WorkspaceConfig()
+        self.repos: list[RepoEntry] = []
+        self._config_mtime: int | None = None
+        self._state = RepoStateTracker()
+        self._lock = threading.Lock()
+        self._stop: asyncio.Event | None = None
+        self.started_at = time.time()
+
+    # -- state ------------------------------------------------------------
+
+    def _reload_config(self) -> None:
+        """Reload config and rescan repos if the config file changed."""
+        try:
+            mtime = (self.workspace_root / CONFIG_FILENAME).stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._config_mtime or not self.repos:
+            self.config = load_config(self.workspace_root)
+            self._config_mtime = mtime
+        # Rescanning is only a handful of stat calls
+        self.repos = scan_repos(self.workspace_root)
+
+    def refresh(self, max_age: float | None = None, force: bool = False) -> int:
+        """Recompute repo state whose git metadata changed.
+
+        Args:
+            max_age: Also recompute entries older than this many seconds.
+            force: Recompute every present repo.
+
+        Returns:
+            Number of repos recomputed.
+        """
+        with self._lock:
+            self._reload_config()
+            present = [r for r in self.repos if r.present and r.local_path]
+            changed = self._state.refresh(
+                present,
+                parallel_count=self.config.parallel_count,
+                max_age=max_age,
+                force=force,
+            )
+            return len(changed)
+
+    def invalidate(self, names: list[str] | None = None) -> None:
+        """Drop cached state so it is recomputed on the next request."""
+        with self._lock:
+            self._state.invalidate(names)
+
+    def snapshot(self, tiers: list[str] | None = None) -> list[RepoInfo]:
+        """Return cached repo state in registry order."""
+        with self._lock:
+            wanted = None if not tiers or "all" in tiers else set(tiers)
+            infos = self._state.infos
+            return [
+                infos[r.name]
+                for r in self.repos
+                if r.name in infos and (wanted is None or r.tier in wanted)
+            ]
+
+    async def prefetch(self) -> dict[str, bool]:
+        """Prefetch every present repo into `refs/prefetch/`."""
+        with self._lock:
+            repos = [
+                (r.name, r.local_path)
+                for r in self.repos
+                if r.present and r.local_path is not None
+            ]
+            config = self.config
+        profiles = {name: config.fetch_profile_for(name) for name, _ in repos}
+        return await prefetch_workspace(
+            self.workspace_root,
+            repos,
+            profiles=profiles,
+            parallel_count=config.parallel_count,
+            timeout=config.sync_timeout,
+        )
+
+    # -- protocol ---------------------------------------------------------
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch a single decoded request."""
+        op = request.get("op")
+
+        if op == "ping":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "workspace": str(self.workspace_root),
+                "repos": len(self._state.infos),
+                "uptime": round(time.time() - self.started_at, 1),
+            }
+
+        if op == "status":
+            await asyncio.to_thread(self.refresh)
+            infos = self.snapshot(request.get("tiers"))
+            return {"ok": True, "repos": [i.to_dict() for i in infos]}
+
+        if op == "invalidate":
+            self.invalidate(request.get("names"))
+            return {"ok": True}
+
+        if op == "shutdown":
+            if self._stop is not None:
+                self._stop.set()
+            return {"ok": True}
+
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line)
+                response = await self.handle_request(request)
+            except (json.JSONDecodeError, UnicodeDecodeError, AttributeError) as e:
+                response = {"ok": False, "error": f"Bad request: {e}"}
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        except Exception as e:
+            logger.error("Daemon request failed: %s", e)
+        finally:
+            writer.close()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await asyncio.to_thread(self.refresh, self.max_age)
+            except Exception as e:
+                logger.warning("Background refresh failed: %s", e)
+
+    async def _prefetch_loop(self) -> None:
+        last_run = float("-inf")
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            # Read on every tick so `config set prefetch_interval` applies live
+            interval = self.config.prefetch_interval
+            if interval <= 0 or time.monotonic() - last_run < interval:
+                continue
+            last_run = time.monotonic()
+            try:
+                await self.prefetch()
+            except Exception as e:
+                logger.warning("Scheduled prefetch failed: %s", e)
+
+    async def serve(self) -> None:
+        """Serve requests until a shutdown request arrives."""
+        if not DAEMON_SUPPORTED:
+            raise RuntimeError("The workspace daemon requires Unix domain sockets")
+
+        sock = socket_path(self.workspace_root)
+        sock.parent.mkdir(parents=True, exist_ok=True)
+        if sock.exists():
+            sock.unlink()
+
+        self._stop = asyncio.Event()
+        await asyncio.to_thread(self.refresh, None, True)
+
+        server = await asyncio.start_unix_server(self._handle_connection, str(sock))
+        pid_file = pid_path(self.workspace_root)
+        pid_file.parent.mkdir(parents=True, exist_ok=True)
+        pid_file.write_text(str(os.getpid()))
+        logger.info("Daemon serving %s on %s", self.workspace_root, sock)
+
+        refresher = asyncio.create_task(self._refresh_loop())
+        prefetcher = asyncio.create_task(self._prefetch_loop())
+        try:
+            async with server:
+                await self._stop.wait()
+        finally:
+            refresher.cancel()
+            prefetcher.cancel()
+            server.close()
+            for path in (sock, pid_file):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            logger.info("Daemon stopped")
+
+
+def request_daemon(
+    workspace_root: Path,
+    payload: dict[str, Any],
+    timeout: float = 5.0,
+) -> dict[str, Any] | None:
+    """Send a request to the workspace daemon.
+
+    Returns:
+        Decoded response, or None if no daemon is reachable.
+    """
+    if not DAEMON_SUPPORTED:
+        return None
+
+    path = socket_path(workspace_root)
+    if not path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        return json.loads(b"".join(chunks))
+    except (OSError, ValueError) as e:
+        logger.debug("Daemon unreachable at %s: %s", path, e)
+        return None
+
+
+def daemon_status(
+    workspace_root: Path, tiers: list[str] | None = None
+) -> list[RepoInfo] | None:
+    """Fetch repo state from the daemon, or None if it isn't running."""
+    response = request_daemon(workspace_root, {"op": "status", "tiers": tiers})
+    if not response or not response.get("ok"):
+        return None
+    return [RepoInfo.from_dict(d) for d in response.get("repos", [])]
+
+
+def notify_daemon(workspace_root: Path, names: list[str] | None = None) -> None:
+    """Tell a running daemon that repo state changed behind its back."""
+    request_daemon(workspace_root, {"op": "invalidate", "names": names}, timeout=1.0)
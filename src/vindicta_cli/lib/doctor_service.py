@@ -8,10 +8,14 @@ from __future__ import annotations
 
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
+from vindicta_cli.lib.git_tuning import enable_tuning, read_tuning
 from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.lib.workspace import scan_repos
 
 logger = get_logger("doctor")
 
@@ -84,6 +88,9 @@ def run_diagnostics(
         lock_result = _check_stale_locks(workspace_root)
         report.checks.append(lock_result)
 
+        # Check each repo's git status tuning
+        report.checks.extend(_check_git_tuning(workspace_root, auto_fix))
+
     return report
 
 
@@ -180,3 +187,57 @@ def _check_stale_locks(workspace_root: Path) -> DiagnosticResult:
         status="ok",
         message="No stale lock files found",
     )
+
+
+def _check_git_tuning(
+    workspace_root: Path, auto_fix: bool = False, parallel_count: int = 4
+) -> list[DiagnosticResult]:
+    """Check untracked cache, manyFiles and fsmonitor for each present repo.
+
+    Each repo needs several git calls, so repos are fanned out over a
+    thread pool; results keep registry order.
+    """
+    names: list[str] = []
+    paths: list[Path] = []
+    for entry in scan_repos(workspace_root):
+        if entry.present and entry.local_path is not None:
+            names.append(entry.name)
+            paths.append(entry.local_path)
+    if not names:
+        return []
+    check = partial(_check_repo_tuning, auto_fix=auto_fix)
+    workers = max(1, min(parallel_count, len(names)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(check, names, paths))
+
+
+def _check_repo_tuning(
+    repo_name: str, repo_path: Path, auto_fix: bool
+) -> DiagnosticResult:
+    """Check (and with `auto_fix`, enable) git status tuning for one repo."""
+    name = f"git tuning: {repo_name}"
+    tuning = read_tuning(repo_path)
+    if tuning is None:
+        return DiagnosticResult(
+            name=name, status="warning", message="git config unreadable"
+        )
+
+    if not tuning.complete and auto_fix and enable_tuning(repo_path):
+        tuning = read_tuning(repo_path) or tuning
+
+    fsmonitor = "fsmonitor unsupported"
+    if tuning.fsmonitor_supported:
+        fsmonitor = "fsmonitor on" if tuning.fsmonitor else "fsmonitor off"
+    if tuning.complete:
+        return DiagnosticResult(
+            name=name,
+            status="ok",
+            message=f"untracked cache and manyFiles on, {fsmonitor}",
+        )
+    return DiagnosticResult(
+        name=name,
+        status="warning",
+        message=f"Not enabled: {', '.join(tuning.missing)}",
+        fixable=True,
+        fix_command="vindicta dev doctor --fix",
+    )
@@ -10,13 +10,54 @@ from __future__ import annotations
 import asyncio
 import json
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Awaitable, Callable, TypeVar
 
 from vindicta_cli.lib.logger import get_logger
 from vindicta_cli.lib.retry import with_retry
 
 logger = get_logger("gh_client")
 
+T = TypeVar("T")
+
+# Repositories per GraphQL request, keeping each query's node cost small
+GRAPHQL_BATCH_SIZE = 25
+
+# Fields fetched for every repository alias in a summary query
+_REPO_SUMMARY_FIELDS = """
+    pullRequests(states: OPEN) { totalCount }
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          statusCheckRollup { state }
+          checkSuites(last: 1) { nodes { status conclusion } }
+        }
+      }
+    }
+"""
+
+# Fields fetched per repository alias to estimate clone times; GitHub
+# reports diskUsage in KiB
+_REPO_SIZE_FIELDS = " diskUsage "
+
+# statusCheckRollup.state → ci_status
+_ROLLUP_STATES = {
+    "SUCCESS": "passing",
+    "FAILURE": "failing",
+    "ERROR": "failing",
+    "PENDING": "pending",
+    "EXPECTED": "pending",
+}
+
+
+@dataclass
+class RepoCiSummary:
+    """Open PR count and default-branch CI state of one repository."""
+
+    open_pr_count: int = 0
+    ci_status: str | None = None  # "passing", "failing", "pending" or None
+
 
 class GhClient:
     """Wrapper around the GitHub CLI (gh)."""
@@ -38,14 +79,20 @@ class GhClient:
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
-    def _build_clone_command(self, repo: str, target_dir: str) -> list[str]:
+    def _build_clone_command(
+        self, repo: str, target_dir: str, git_args: list[str] | None = None
+    ) -> list[str]:
         """Build gh repo clone command.
 
         Args:
             repo: Repo in owner/name format.
             target_dir: Local directory to clone into.
+            git_args: Extra `git clone` flags, passed through after `--`.
         """
-        return ["gh", "repo", "clone", repo, target_dir]
+        cmd = ["gh", "repo", "clone", repo, target_dir]
+        if git_args:
+            cmd.extend(["--", *git_args])
+        return cmd
 
     def _build_pr_list_command(self, repo: str) -> list[str]:
         """Build gh PR list command.
@@ -83,18 +130,164 @@ class GhClient:
             "5",
         ]
 
+    def _build_repo_summary_query(
+        self, repos: list[str], fields: str = _REPO_SUMMARY_FIELDS
+    ) -> str:
+        """Build one GraphQL query covering several repositories.
+
+        Each repository is fetched under an alias (`r0`, `r1`, ...) in
+        the order given.
+
+        Args:
+            repos: Repos in owner/name format.
+            fields: Selection set requested for every repository.
+        """
+        parts = []
+        for i, repo in enumerate(repos):
+            owner, _, name = repo.partition("/")
+            parts.append(
+                f"r{i}: repository(owner: {json.dumps(owner)}, "
+                f"name: {json.dumps(name)}) {{{fields}}}"
+            )
+        return "query {\n" + "\n".join(parts) + "\n}"
+
+    def _build_graphql_command(self, query: str) -> list[str]:
+        """Build gh api graphql command.
+
+        Args:
+            query: GraphQL query document.
+        """
+        return ["gh", "api", "graphql", "-f", f"query={query}"]
+
+    async def get_repo_summaries(
+        self,
+        repos: list[str],
+        batch_size: int = GRAPHQL_BATCH_SIZE,
+    ) -> dict[str, RepoCiSummary]:
+        """Fetch open PR counts and CI state for many repos at once.
+
+        Repos are queried in chunks of `batch_size`, one `gh api graphql`
+        process per chunk, with chunks running concurrently.
+
+        Args:
+            repos: Repos in owner/name format.
+            batch_size: Repositories per GraphQL request.
+
+        Returns:
+            Mapping of owner/name → summary. Repos that couldn't be read
+            (missing, no access, failed request) are omitted.
+        """
+        summaries: dict[str, RepoCiSummary] = {}
+        for result in await self._gather_batches(
+            repos, batch_size, self._query_repo_summaries
+        ):
+            summaries.update(result)
+        return summaries
+
+    async def get_repo_sizes(
+        self,
+        repos: list[str],
+        batch_size: int = GRAPHQL_BATCH_SIZE,
+    ) -> dict[str, int]:
+        """Fetch how large many repos are on GitHub, batched like summaries.
+
+        Sizes only order clones, so failed requests are not retried.
+
+        Args:
+            repos: Repos in owner/name format.
+            batch_size: Repositories per GraphQL request.
+
+        Returns:
+            Mapping of owner/name → size in bytes. Repos that couldn't be
+            read are omitted.
+        """
+        sizes: dict[str, int] = {}
+        for result in await self._gather_batches(
+            repos, batch_size, self._query_repo_sizes
+        ):
+            sizes.update(result)
+        return sizes
+
+    async def _gather_batches(
+        self,
+        repos: list[str],
+        batch_size: int,
+        query: Callable[[list[str]], Awaitable[dict[str, T]]],
+    ) -> list[dict[str, T]]:
+        """Run `query` on chunks of `batch_size` repos concurrently.
+
+        Returns:
+            Results of the chunks that succeeded; failures are logged.
+        """
+        chunks = [repos[i : i + batch_size] for i in range(0, len(repos), batch_size)]
+        results = await asyncio.gather(
+            *(query(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        succeeded: list[dict[str, T]] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "GraphQL query for %d repos failed: %s", len(chunk), result
+                )
+                continue
+            succeeded.append(result)
+        return succeeded
+
     @with_retry
-    async def clone_repo(self, repo: str, target_dir: Path) -> bool:
+    async def _query_repo_summaries(self, repos: list[str]) -> dict[str, RepoCiSummary]:
+        """Run one summary query and parse its aliased results."""
+        payload = await self._run_graphql(self._build_repo_summary_query(repos))
+        return parse_repo_summaries(repos, payload)
+
+    async def _query_repo_sizes(self, repos: list[str]) -> dict[str, int]:
+        """Run one size query and parse its aliased results."""
+        payload = await self._run_graphql(
+            self._build_repo_summary_query(repos, _REPO_SIZE_FIELDS)
+        )
+        data = payload.get("data") or {}
+        sizes = {}
+        for i, repo in enumerate(repos):
+            disk_usage = (data.get(f"r{i}") or {}).get("diskUsage")
+            if isinstance(disk_usage, int):
+                sizes[repo] = disk_usage * 1024
+        return sizes
+
+    async def _run_graphql(self, query: str) -> dict:
+        """Run a GraphQL query through gh and decode the response body."""
+        cmd = self._build_graphql_command(query)
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+
+        # gh exits non-zero when any alias errors but still prints the
+        # partial data, so the body is parsed regardless of the exit code
+        try:
+            payload = json.loads(stdout.decode())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ConnectionError(
+                f"gh api graphql failed: {stderr.decode().strip()}"
+            ) from None
+        return payload
+
+    @with_retry
+    async def clone_repo(
+        self, repo: str, target_dir: Path, git_args: list[str] | None = None
+    ) -> bool:
         """Clone a repository using gh CLI.
 
         Args:
             repo: Repo in owner/name format.
             target_dir: Local directory to clone into.
+            git_args: Extra `git clone` flags (e.g. `--filter=blob:none`).
 
         Returns:
             True if clone succeeded.
         """
-        cmd = self._build_clone_command(repo, str(target_dir))
+        cmd = self._build_clone_command(repo, str(target_dir), git_args)
         logger.info("Cloning %s → %s", repo, target_dir)
 
         process = await asyncio.create_subprocess_exec(
@@ -169,3 +362,48 @@ class GhClient:
             return "pending"
         except (json.JSONDecodeError, UnicodeDecodeError, IndexError):
             return None
+
+
+def parse_repo_summaries(repos: list[str], payload: dict) -> dict[str, RepoCiSummary]:
+    """Parse the response of a `_build_repo_summary_query` query.
+
+    Args:
+        repos: The repos passed to the query builder, in the same order.
+        payload: Decoded GraphQL response body.
+
+    Returns:
+        Mapping of owner/name → summary for every alias with data.
+    """
+    data = payload.get("data") or {}
+    for error in payload.get("errors") or []:
+        logger.debug("GraphQL error: %s", error.get("message"))
+
+    summaries: dict[str, RepoCiSummary] = {}
+    for i, repo in enumerate(repos):
+        node = data.get(f"r{i}")
+        if not node:
+            continue
+        summaries[repo] = RepoCiSummary(
+            open_pr_count=(node.get("pullRequests") or {}).get("totalCount", 0),
+            ci_status=_ci_status_from_commit(
+                ((node.get("defaultBranchRef") or {}).get("target")) or {}
+            ),
+        )
+    return summaries
+
+
+def _ci_status_from_commit(commit: dict) -> str | None:
+    """Derive ci_status from a commit's check rollup or latest check suite."""
+    rollup = commit.get("statusCheckRollup")
+    if rollup and rollup.get("state") in _ROLLUP_STATES:
+        return _ROLLUP_STATES[rollup["state"]]
+
+    suites = (commit.get("checkSuites") or {}).get("nodes") or []
+    if not suites:
+        return None
+    latest = suites[-1]
+    if latest.get("status") != "COMPLETED":
+        return "pending"
+    if latest.get("conclusion") in ("SUCCESS", "NEUTRAL", "SKIPPED"):
+        return "passing"
+    return "failing"
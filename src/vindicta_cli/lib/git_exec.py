@@ -0,0 +1,103 @@
+"""Git subprocess helpers shared by the services.
+
+`run_git` is for worker threads; `communicate` is for the event loop and
+makes sure a git process never outlives the task that started it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def run_git(
+    args: list[str], repo_path: Path, timeout: float = 600
+) -> subprocess.CompletedProcess:
+    """Run git in `repo_path`, capturing text output.
+
+    Raises:
+        subprocess.TimeoutExpired: If git runs longer than `timeout`.
+        FileNotFoundError: If git is not installed.
+    """
+    return subprocess.run(
+        ["git", *args],
+        cwd=str(repo_path),
+        capture_output=True,
+        text=True,
+        errors="replace",
+        timeout=timeout,
+    )
+
+
+async def communicate(
+    cmd: list[str],
+    cwd: Path,
+    timeout: float,
+    input: str | None = None,
+    own_group: bool = False,
+) -> tuple[int, str, str]:
+    """Run a command without blocking the event loop.
+
+    The child process is killed and reaped if the timeout expires or the
+    awaiting task is cancelled, so no git processes outlive their task.
+
+    Args:
+        cmd: Command and arguments.
+        cwd: Working directory.
+        timeout: Seconds before the child is killed.
+        input: Text written to the child's stdin.
+        own_group: Start the child in its own process group and kill the
+            whole group, taking helpers it spawned (ssh, credential
+            helpers) with it. POSIX only.
+
+    Returns:
+        Tuple of (return code, decoded stdout, decoded stderr).
+
+    Raises:
+        asyncio.TimeoutError: If the timeout expires.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=str(cwd),
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        **(_process_group_kwargs() if own_group else {}),
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(input.encode() if input is not None else None),
+            timeout=timeout,
+        )
+    except BaseException:
+        # Timeout or cancellation: don't leave the child running
+        if process.returncode is None:
+            _kill_group(process, own_group)
+            await process.wait()
+        raise
+    returncode = await process.wait()
+    return returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+def _process_group_kwargs() -> dict[str, Any]:
+    """Subprocess arguments that start the child in a new process group."""
+    if sys.version_info >= (3, 11):
+        # Keeps the terminal session, unlike setsid
+        return {"process_group": 0}
+    return {"start_new_session": True}
+
+
+def _kill_group(process: asyncio.subprocess.Process, own_group: bool) -> None:
+    """Kill a child and, if it leads its own process group, the group."""
+    try:
+        if own_group:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
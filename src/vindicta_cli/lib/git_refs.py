@@ -0,0 +1,311 @@
+"""In-process git metadata reader.
+
+Answers cheap questions — which branch HEAD is on, what a ref points
+to, what a branch's upstream is, what stat data the index recorded — by
+reading `.git/HEAD`, loose refs, `packed-refs`, `config` and `index`
+directly instead of spawning `git`.
+
+Every lookup returns None when the answer can't be read with certainty
+(unusual ref storage, broken files, ...), so callers can fall back to a
+git subprocess.
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import NamedTuple
+
+# Guards against symbolic ref cycles
+_MAX_SYMREF_DEPTH = 5
+
+# Index entry mode bits of submodules and sparse-index directories
+_MODE_TYPE_MASK = 0o170000
+_NON_FILE_MODES = (0o160000, 0o040000)
+
+
+class IndexStat(NamedTuple):
+    """The stat data the index recorded for a tracked file."""
+
+    path: str
+    mtime_s: int
+    mtime_ns: int  # 0 when git was built without nanosecond support
+    size: int  # truncated to 32 bits, as stored by git
+
+
+def resolve_git_dir(repo_path: Path) -> Path | None:
+    """Locate the git directory of a working tree.
+
+    Handles plain `.git` directories as well as `.git` files containing
+    `gitdir: <path>` (linked worktrees and submodules).
+
+    Args:
+        repo_path: Working tree root.
+
+    Returns:
+        Path to the git directory, or None if there isn't a usable one.
+    """
+    dot_git = repo_path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content[len("gitdir:") :].strip())
+    if not git_dir.is_absolute():
+        git_dir = repo_path / git_dir
+    return git_dir if git_dir.is_dir() else None
+
+
+def common_dir(git_dir: Path) -> Path:
+    """Return the directory holding shared refs, packed-refs and config.
+
+    Linked worktrees keep only HEAD and per-worktree refs in their own
+    git dir and point at the main repository via a `commondir` file.
+    """
+    try:
+        content = (git_dir / "commondir").read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return git_dir
+    path = Path(content)
+    return path if path.is_absolute() else (git_dir / path)
+
+
+def read_symref(git_dir: Path, name: str = "HEAD") -> str | None:
+    """Return the target of a symbolic ref, or None if it is detached."""
+    content = _read_loose(git_dir, name)
+    if content and content.startswith("ref:"):
+        return content[4:].strip()
+    return None
+
+
+def current_branch(git_dir: Path) -> str | None:
+    """Return the short name of the branch HEAD is on (None if detached)."""
+    target = read_symref(git_dir)
+    if target and target.startswith("refs/heads/"):
+        return target[len("refs/heads/") :]
+    return None
+
+
+def resolve_ref(git_dir: Path, name: str = "HEAD") -> str | None:
+    """Resolve a ref to a commit SHA, following symbolic refs.
+
+    Args:
+        git_dir: Git directory (per-worktree for linked worktrees).
+        name: Full ref name such as `HEAD` or `refs/remotes/origin/main`.
+
+    Returns:
+        40-character hex SHA, or None if the ref can't be resolved.
+    """
+    for _ in range(_MAX_SYMREF_DEPTH):
+        content = _read_loose(git_dir, name)
+        if content is None:
+            return _read_packed(common_dir(git_dir)).get(name)
+        if not content.startswith("ref:"):
+            return content if _is_sha(content) else None
+        name = content[4:].strip()
+    return None
+
+
+def list_refs(git_dir: Path, prefix: str) -> dict[str, str]:
+    """Return every direct ref under a prefix as a name → SHA mapping.
+
+    Merges `packed-refs` with loose refs (loose ones win, as in git).
+    Symbolic refs such as `refs/remotes/origin/HEAD` are left out.
+
+    Args:
+        git_dir: Git directory (per-worktree for linked worktrees).
+        prefix: Ref namespace ending in `/`, e.g. `refs/remotes/origin/`.
+    """
+    base = common_dir(git_dir)
+    refs = {
+        name: sha for name, sha in _read_packed(base).items() if name.startswith(prefix)
+    }
+    root = base / prefix
+    try:
+        loose = [p for p in root.rglob("*") if p.is_file() and p.suffix != ".lock"]
+    except OSError:
+        loose = []
+    for path in loose:
+        try:
+            content = path.read_text().strip()
+        except (OSError, UnicodeDecodeError):
+            continue
+        if _is_sha(content):
+            refs[prefix + path.relative_to(root).as_posix()] = content
+    return refs
+
+
+def default_branch(git_dir: Path, remote: str = "origin") -> str | None:
+    """Return the remote's default branch as recorded by clone.
+
+    Reads `refs/remotes/<remote>/HEAD`, which `git clone` sets up.
+    """
+    target = read_symref(git_dir, f"refs/remotes/{remote}/HEAD")
+    prefix = f"refs/remotes/{remote}/"
+    if target and target.startswith(prefix):
+        return target[len(prefix) :]
+    return None
+
+
+def upstream_ref(git_dir: Path, branch: str) -> str | None:
+    """Return the remote-tracking ref a branch is configured to follow.
+
+    Reads `branch.<name>.remote` / `branch.<name>.merge` from the repo
+    config. Only remote upstreams are resolved; a local upstream
+    (`remote = .`) or `include` directives return None.
+    """
+    section = _read_config(common_dir(git_dir)).get(f'branch "{branch}"')
+    if not section:
+        return None
+    remote = section.get("remote")
+    merge = section.get("merge", "")
+    if not remote or remote == "." or not merge.startswith("refs/heads/"):
+        return None
+    return f"refs/remotes/{remote}/{merge[len('refs/heads/') :]}"
+
+
+def partial_clone_filter(git_dir: Path, remote: str = "origin") -> str | None:
+    """Return the object filter a partial clone uses, or None if it isn't one.
+
+    Reads `remote.<name>.promisor` and `remote.<name>.partialclonefilter`,
+    which `git clone --filter=...` records in the repo config.
+    """
+    section = _read_config(common_dir(git_dir)).get(f'remote "{remote}"')
+    if not section or section.get("promisor", "").lower() != "true":
+        return None
+    return section.get("partialclonefilter") or "blob:none"
+
+
+def read_index_stats(git_dir: Path) -> list[IndexStat] | None:
+    """Return the recorded stat data of every file in the index.
+
+    Reads index versions 2-4, skipping submodule and sparse-directory
+    entries. A missing index means nothing is tracked yet.
+
+    Returns:
+        IndexStat list in index order, or None for an unreadable or
+        split index.
+    """
+    try:
+        data = (git_dir / "index").read_bytes()
+    except FileNotFoundError:
+        return []
+    except OSError:
+        return None
+    if len(data) < 12 or data[:4] != b"DIRC":
+        return None
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3, 4):
+        return None
+    extensions = _read_config(common_dir(git_dir)).get("extensions", {})
+    hash_size = 32 if extensions.get("objectformat") == "sha256" else 20
+
+    stats: list[IndexStat] = []
+    pos = 12
+    name = b""
+    try:
+        for _ in range(count):
+            start = pos
+            mtime_s, mtime_ns = struct.unpack_from(">II", data, pos + 8)
+            (mode,) = struct.unpack_from(">I", data, pos + 24)
+            (size,) = struct.unpack_from(">I", data, pos + 36)
+            pos += 40 + hash_size
+            (flags,) = struct.unpack_from(">H", data, pos)
+            pos += 2
+            if version >= 3 and flags & 0x4000:
+                pos += 2  # extended flags
+            if version == 4:
+                # Names are stored as a suffix of the previous entry's name
+                strip, pos = _read_varint(data, pos)
+                end = data.index(b"\0", pos)
+                name = name[: len(name) - strip] + data[pos:end]
+                pos = end + 1
+            else:
+                end = data.index(b"\0", pos)
+                name = data[pos:end]
+                # Entries are NUL-padded to a multiple of 8 bytes
+                pos = start + ((end - start + 8) & ~7)
+            if mode & _MODE_TYPE_MASK in _NON_FILE_MODES:
+                continue
+            path = name.decode("utf-8", "surrogateescape")
+            stats.append(IndexStat(path, mtime_s, mtime_ns, size))
+
+        # A split index keeps most entries in a shared index file
+        while pos + 8 <= len(data) - hash_size:
+            signature = data[pos : pos + 4]
+            (length,) = struct.unpack_from(">I", data, pos + 4)
+            if signature == b"link":
+                return None
+            pos += 8 + length
+    except (struct.error, ValueError):
+        return None
+    return stats
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode git's offset varint at `pos`; return (value, next position)."""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _read_loose(git_dir: Path, name: str) -> str | None:
+    """Read a loose ref from the worktree git dir, then the common dir."""
+    for base in (git_dir, common_dir(git_dir)):
+        try:
+            return (base / name).read_text().strip()
+        except (OSError, UnicodeDecodeError):
+            continue
+    return None
+
+
+def _read_packed(git_dir: Path) -> dict[str, str]:
+    """Parse `packed-refs` into a ref name → SHA mapping."""
+    refs: dict[str, str] = {}
+    try:
+        lines = (git_dir / "packed-refs").read_text().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return refs
+    for line in lines:
+        # Skip the header and peeled-tag lines ("^<sha>")
+        if not line or line[0] in "#^":
+            continue
+        sha, _, name = line.partition(" ")
+        if _is_sha(sha):
+            refs[name.strip()] = sha
+    return refs
+
+
+def _read_config(git_dir: Path) -> dict[str, dict[str, str]]:
+    """Minimal git config reader keyed by raw section header."""
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    try:
+        lines = (git_dir / "config").read_text().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return sections
+    for raw in lines:
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            current = sections.setdefault(line[1:-1].strip(), {})
+        elif current is not None and "=" in line:
+            key, _, value = line.partition("=")
+            current[key.strip().lower()] = value.strip().strip('"')
+    if "include" in sections or any(s.startswith("includeIf") for s in sections):
+        return {}
+    return sections
+
+
+def _is_sha(value: str) -> bool:
+    return len(value) in (40, 64) and all(c in "0123456789abcdef" for c in value)
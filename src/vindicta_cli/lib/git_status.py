@@ -0,0 +1,108 @@
+"""Git porcelain v2 status parser.
+
+Parses the output of `git status --porcelain=v2 --branch -z` so a
+single git process yields branch, upstream, ahead/behind and per-state
+change counts for a repository.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+# Arguments for the single status call whose output `parse_porcelain_v2` reads
+STATUS_ARGS = ["status", "--porcelain=v2", "--branch", "-z"]
+
+
+@dataclass
+class GitStatus:
+    """Parsed repository status."""
+
+    branch: str | None = None  # None when HEAD is detached
+    oid: str | None = None  # None before the first commit
+    upstream: str | None = None
+    ahead: int = 0
+    behind: int = 0
+    staged: int = 0
+    unstaged: int = 0
+    untracked: int = 0
+    conflicts: int = 0
+    paths: list[str] = field(default_factory=list)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether any tracked or untracked change is present."""
+        return bool(self.paths)
+
+
+def parse_porcelain_v2(output: str) -> GitStatus:
+    """Parse NUL-delimited `git status --porcelain=v2 --branch` output.
+
+    Args:
+        output: Raw stdout of the status command.
+
+    Returns:
+        GitStatus populated from headers and entries.
+    """
+    status = GitStatus()
+    records = output.split("\0")
+    i = 0
+
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+
+        kind = record[0]
+
+        if kind == "#":
+            _parse_header(record, status)
+        elif kind == "1":
+            # 1 XY sub mH mI mW hH hI path
+            parts = record.split(" ", 8)
+            _count_xy(parts[1], status)
+            status.paths.append(parts[8])
+        elif kind == "2":
+            # 2 XY sub mH mI mW hH hI Xscore path, then origPath record
+            parts = record.split(" ", 9)
+            _count_xy(parts[1], status)
+            status.paths.append(parts[9])
+            i += 1
+        elif kind == "u":
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            parts = record.split(" ", 10)
+            status.conflicts += 1
+            status.paths.append(parts[10])
+        elif kind == "?":
+            status.untracked += 1
+            status.paths.append(record[2:])
+        # "!" (ignored) entries only appear with --ignored and are skipped
+
+    return status
+
+
+def _parse_header(record: str, status: GitStatus) -> None:
+    """Apply a `# branch.*` header line."""
+    parts = record.split(" ")
+    if len(parts) < 3:
+        return
+    key, value = parts[1], parts[2]
+
+    if key == "branch.oid":
+        status.oid = None if value == "(initial)" else value
+    elif key == "branch.head":
+        status.branch = None if value == "(detached)" else value
+    elif key == "branch.upstream":
+        status.upstream = value
+    elif key == "branch.ab" and len(parts) >= 4 and "?" not in record:
+        # `+? -?` is reported when counting was skipped
+        status.ahead = int(parts[2].lstrip("+"))
+        status.behind = int(parts[3].lstrip("-"))
+
+
+def _count_xy(xy: str, status: GitStatus) -> None:
+    """Count staged (X) and unstaged (Y) changes of an entry."""
+    if xy[0] != ".":
+        status.staged += 1
+    if xy[1] != ".":
+        status.unstaged += 1
@@ -0,0 +1,135 @@
+"""Git tuning — make `git status` scale with changes, not tree size.
+
+Dirty checks in `status` and `sync` run `git status`, which by default
+stats every tracked file and walks every untracked directory. Three repo
+settings remove most of that work:
+
+- `core.untrackedCache` caches directory mtimes so unchanged untracked
+  directories (node_modules, build output) are not re-read.
+- `feature.manyFiles` switches to index v4 and the untracked cache.
+- `core.fsmonitor` uses git's built-in file system monitor daemon so
+  only paths changed since the last status are examined. The daemon is
+  available on macOS and Windows; elsewhere the setting is left alone.
+
+Settings are read with `git config` so values from the user's global
+config count too, and written to the repo's local config.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+from vindicta_cli.lib.logger import get_logger
+
+logger = get_logger("git_tuning")
+
+
+@dataclass
+class GitTuning:
+    """Which status accelerators a repository has enabled."""
+
+    untracked_cache: bool = False
+    many_files: bool = False
+    fsmonitor: bool = False
+    fsmonitor_supported: bool = False
+
+    @property
+    def complete(self) -> bool:
+        """Whether every setting this platform supports is enabled."""
+        return (
+            self.untracked_cache
+            and self.many_files
+            and (self.fsmonitor or not self.fsmonitor_supported)
+        )
+
+    @property
+    def missing(self) -> list[str]:
+        """Config keys that still need enabling."""
+        missing = []
+        if not self.untracked_cache:
+            missing.append("core.untrackedCache")
+        if not self.many_files:
+            missing.append("feature.manyFiles")
+        if self.fsmonitor_supported and not self.fsmonitor:
+            missing.append("core.fsmonitor")
+        return missing
+
+
+def read_tuning(repo_path: Path) -> GitTuning | None:
+    """Report a repository's status settings, or None if git can't."""
+    if _git(["rev-parse", "--git-dir"], repo_path) is None:
+        return None
+    many_files = _config_bool(repo_path, "feature.manyFiles")
+    untracked = _config_bool(repo_path, "core.untrackedCache")
+    return GitTuning(
+        # feature.manyFiles turns the untracked cache on unless it is set
+        untracked_cache=untracked if untracked is not None else bool(many_files),
+        many_files=bool(many_files),
+        fsmonitor=bool(_config_bool(repo_path, "core.fsmonitor")),
+        fsmonitor_supported=fsmonitor_supported(repo_path),
+    )
+
+
+def enable_tuning(repo_path: Path) -> bool:
+    """Enable the untracked cache, manyFiles and (where supported) fsmonitor.
+
+    The untracked cache and fsmonitor daemon are populated by the next
+    `git status`, so the first dirty check after enabling is not faster.
+
+    Returns:
+        True if every supported setting is now enabled.
+    """
+    settings = [("core.untrackedCache", "true"), ("feature.manyFiles", "true")]
+    if fsmonitor_supported(repo_path):
+        settings.append(("core.fsmonitor", "true"))
+
+    for key, value in settings:
+        if _git(["config", "--local", key, value], repo_path) is None:
+            logger.warning("Failed to set %s for %s", key, repo_path.name)
+            return False
+    logger.info("Enabled git status tuning for %s", repo_path.name)
+    return True
+
+
+def fsmonitor_supported(repo_path: Path) -> bool:
+    """Whether git's built-in fsmonitor daemon works for this repo.
+
+    `git fsmonitor--daemon status` exits 0 (watching) or 1 (not running)
+    when the daemon is usable, and fails with 128 when the platform or
+    the repo's file system is unsupported.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "fsmonitor--daemon", "status"],
+            cwd=str(repo_path),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode in (0, 1)
+
+
+def _config_bool(repo_path: Path, key: str) -> bool | None:
+    """Read a boolean config value; None if unset or not a boolean."""
+    value = _git(["config", "--type=bool", "--get", key], repo_path)
+    return None if value is None else value == "true"
+
+
+def _git(args: list[str], repo_path: Path) -> str | None:
+    """Run git and return stripped stdout, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=str(repo_path),
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        logger.error("git %s failed in %s: %s", args[0], repo_path.name, e)
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
@@ -0,0 +1,50 @@
+"""Versioned JSON state files under `.vindicta/`.
+
+Caches, journals and manifests are JSON objects with a `version` field
+and one payload mapping. Files from another version, or that cannot be
+read, are treated as empty. Writes go through a temporary file and
+`os.replace`, so a concurrent reader sees either the old file or the
+new one, never a torn write.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+
+def load_versioned_json(path: Path, version: int, key: str) -> dict[str, Any]:
+    """Return the `key` mapping of a versioned JSON file.
+
+    Returns:
+        The mapping, or {} if the file is missing, unreadable, from
+        another version or holds no mapping under `key`.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != version:
+        return {}
+    payload = data.get(key)
+    return payload if isinstance(payload, dict) else {}
+
+
+def atomic_write_json(path: Path, data: Any, indent: int | None = None) -> None:
+    """Write `data` as JSON to `path` atomically, creating parent directories.
+
+    Raises:
+        OSError: If the file cannot be written; no temporary file is left.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per thread, so concurrent writers never share a temp file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, indent=indent))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,156 @@
+"""Local clone sources — mirror cache and existing workspaces.
+
+`vindicta dev init` normally clones every repo over the network. With
+the mirror cache enabled, each repo is first brought up to date in a
+user-level bare mirror (`~/.cache/vindicta/mirrors/<owner>/<name>.git`,
+or `$VINDICTA_MIRROR_DIR`) and the workspace copy is cloned from it.
+`init --from <workspace>` does the same from another workspace's repos.
+
+Local clones hardlink the source's object files, so workspaces share
+disk with the mirror (and each other) without depending on it: unlike
+`--reference` alternates, pruning or deleting the source never corrupts
+a clone. The clone's `origin` is pointed back at the real remote.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from vindicta_cli.lib import git_exec
+from vindicta_cli.lib.gh_client import GhClient
+from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.models.repo_info import RepoEntry
+
+logger = get_logger("mirror")
+
+# Windows: mirrors are refreshed without a lock
+if sys.platform != "win32":
+    import fcntl
+
+# Mirrors track branches and tags only, not GitHub's refs/pull/*
+MIRROR_REFSPEC = "+refs/heads/*:refs/heads/*"
+
+
+def default_mirror_root() -> Path:
+    """Return the user-level mirror store directory."""
+    if override := os.environ.get("VINDICTA_MIRROR_DIR"):
+        return Path(override).expanduser()
+    cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache) / "vindicta" / "mirrors"
+
+
+def mirror_path(mirror_root: Path, entry: RepoEntry) -> Path:
+    """Return the bare mirror location for a registry entry."""
+    return mirror_root / f"{entry.slug}.git"
+
+
+async def refresh_mirror(
+    entry: RepoEntry, mirror_root: Path, timeout: float = 600
+) -> Path:
+    """Create or update the bare mirror of a repository.
+
+    Concurrent refreshes of the same mirror (from other workspaces) are
+    serialized with a lock file.
+
+    Returns:
+        Path to the up-to-date mirror.
+
+    Raises:
+        ConnectionError: If the clone or fetch fails.
+    """
+    mirror = mirror_path(mirror_root, entry)
+    mirror.parent.mkdir(parents=True, exist_ok=True)
+
+    lock = await asyncio.to_thread(_lock, mirror.with_name(f"{mirror.name}.lock"))
+    try:
+        if not is_bare_repo(mirror):
+            # Clone next to the final path so a half-made mirror is never used
+            partial = mirror.with_name(f"{mirror.name}.{os.getpid()}.partial")
+            await asyncio.to_thread(shutil.rmtree, partial, ignore_errors=True)
+            try:
+                await GhClient().clone_repo(entry.slug, partial, ["--bare"])
+                await _git(["config", "remote.origin.fetch", MIRROR_REFSPEC], partial)
+                await asyncio.to_thread(shutil.rmtree, mirror, ignore_errors=True)
+                os.replace(partial, mirror)
+            finally:
+                await asyncio.to_thread(shutil.rmtree, partial, ignore_errors=True)
+            logger.info("Created mirror of %s", entry.slug)
+        else:
+            await _git(["fetch", "--prune", "--tags", "origin"], mirror, timeout)
+            logger.info("Refreshed mirror of %s", entry.slug)
+    finally:
+        lock.close()
+    return mirror
+
+
+async def clone_from_local(source: Path, target: Path, timeout: float = 600) -> None:
+    """Clone `target` from a local mirror or workspace repo.
+
+    A bare mirror already holds the remote's branches, so the clone is
+    complete once `origin` points at the real remote. A workspace repo
+    may be behind and have its own branches checked out, so the clone
+    is fetched from the remote and switched to the default branch.
+
+    Raises:
+        ConnectionError: If any git step fails.
+    """
+    url = (await _git(["config", "--get", "remote.origin.url"], source)).strip()
+    if not url:
+        raise ConnectionError(f"{source} has no origin remote")
+
+    from_mirror = is_bare_repo(source)
+    args = ["clone", "--quiet"] + ([] if from_mirror else ["--no-checkout"])
+    await _git([*args, str(source), str(target)], target.parent, timeout)
+    await _git(["remote", "set-url", "origin", url], target)
+    if from_mirror:
+        return
+
+    try:
+        seeded_branch = await _git(["symbolic-ref", "--short", "HEAD"], target)
+    except ConnectionError:
+        seeded_branch = ""  # detached HEAD in the source
+    await _git(["fetch", "--prune", "origin"], target, timeout)
+    await _git(["remote", "set-head", "origin", "--auto"], target, timeout)
+    head = await _git(["symbolic-ref", "--short", "refs/remotes/origin/HEAD"], target)
+    default = head.strip().removeprefix("origin/")
+    await _git(
+        ["checkout", "--quiet", "-B", default, "--track", f"origin/{default}"], target
+    )
+    seeded_branch = seeded_branch.strip()
+    if seeded_branch and seeded_branch != default:
+        await _git(["branch", "--quiet", "-D", seeded_branch], target)
+
+
+def is_bare_repo(path: Path) -> bool:
+    """Whether `path` looks like a bare repository."""
+    return (path / "HEAD").is_file() and (path / "objects").is_dir()
+
+
+def _lock(path: Path):
+    """Open and exclusively lock `path`; closing the file releases it."""
+    handle = path.open("a")
+    if sys.platform != "win32":
+        fcntl.flock(handle, fcntl.LOCK_EX)
+    return handle
+
+
+async def _git(args: list[str], cwd: Path, timeout: float = 60) -> str:
+    """Run git and return stdout.
+
+    Raises:
+        ConnectionError: On a non-zero exit or timeout.
+    """
+    try:
+        returncode, stdout, stderr = await git_exec.communicate(
+            ["git", *args], cwd, timeout
+        )
+    except asyncio.TimeoutError:
+        raise ConnectionError(f"git {args[0]} timed out after {timeout}s") from None
+
+    if returncode != 0:
+        raise ConnectionError(f"git {args[0]} failed: {stderr.strip()}")
+    return stdout
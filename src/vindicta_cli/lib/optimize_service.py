@@ -0,0 +1,179 @@
+"""Optimize service — repository maintenance across the workspace.
+
+Runs the same housekeeping as `git maintenance` on every repo: packing
+and pruning loose objects, an incremental repack behind a multi-pack
+index, and a split commit-graph. Status, rev-list and fetch all slow down
+as loose objects and packs accumulate, and workspace repos are rarely
+busy enough for git's automatic gc to catch up.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from vindicta_cli.lib import git_refs
+from vindicta_cli.lib.git_exec import run_git
+from vindicta_cli.lib.logger import get_logger
+
+logger = get_logger("optimize_service")
+
+# Maintenance steps in the order they run
+STEPS = ("loose-objects", "prune", "incremental-repack", "commit-graph")
+
+# Unreachable loose objects younger than this are kept, as `git gc` does
+PRUNE_EXPIRE = "2.weeks.ago"
+
+
+@dataclass
+class ObjectStats:
+    """Object store counters from `git count-objects -v`."""
+
+    loose_objects: int = 0
+    loose_kib: int = 0
+    packs: int = 0
+    pack_kib: int = 0
+
+
+@dataclass
+class OptimizeResult:
+    """Result of optimizing a single repository."""
+
+    name: str
+    success: bool
+    before: ObjectStats | None = None
+    after: ObjectStats | None = None
+    timings: dict[str, float] = field(default_factory=dict)  # step → seconds
+    message: str = ""
+
+
+def optimize_repos(
+    repos: list[tuple[str, Path]],
+    parallel_count: int = 4,
+    timeout: float = 600,
+    on_result: Callable[[OptimizeResult], None] | None = None,
+) -> list[OptimizeResult]:
+    """Run maintenance on many repositories concurrently.
+
+    Git does the heavy lifting in child processes, so repos are fanned
+    out over a thread pool.
+
+    Args:
+        repos: List of (name, path) tuples.
+        parallel_count: Max repos maintained at once.
+        timeout: Per-step timeout in seconds.
+        on_result: Called with each result as soon as its repo finishes.
+
+    Returns:
+        OptimizeResult list in the same order as `repos`.
+    """
+    if not repos:
+        return []
+
+    workers = max(1, min(parallel_count, len(repos)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(optimize_repo, path, name, timeout) for name, path in repos
+        ]
+        if on_result:
+            for future in as_completed(futures):
+                on_result(future.result())
+        return [future.result() for future in futures]
+
+
+def optimize_repo(repo_path: Path, name: str, timeout: float = 600) -> OptimizeResult:
+    """Run every maintenance step on one repository.
+
+    Stops at the first failing step; the after-stats still reflect
+    whatever the earlier steps achieved.
+    """
+    result = OptimizeResult(name=name, success=True)
+    result.before = object_stats(repo_path)
+    if result.before is None:
+        result.success = False
+        result.message = "Not a git repository"
+        return result
+
+    for step in STEPS:
+        started = time.monotonic()
+        try:
+            for args in _step_commands(step, repo_path):
+                completed = run_git(args, repo_path, timeout)
+                if completed.returncode != 0:
+                    raise RuntimeError(completed.stderr.strip() or f"git {args[0]}")
+        except (subprocess.TimeoutExpired, OSError, RuntimeError) as e:
+            result.success = False
+            result.message = f"{step} failed: {e}"
+            logger.warning("Optimizing %s: %s", name, result.message)
+            break
+        finally:
+            result.timings[step] = time.monotonic() - started
+
+    result.after = object_stats(repo_path)
+    return result
+
+
+def object_stats(repo_path: Path) -> ObjectStats | None:
+    """Read loose object and pack counts, or None if git can't."""
+    try:
+        completed = run_git(["count-objects", "-v"], repo_path, 30)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if completed.returncode != 0:
+        return None
+
+    values: dict[str, int] = {}
+    for line in completed.stdout.splitlines():
+        key, _, value = line.partition(":")
+        try:
+            values[key.strip()] = int(value.strip())
+        except ValueError:
+            continue
+    return ObjectStats(
+        loose_objects=values.get("count", 0),
+        loose_kib=values.get("size", 0),
+        packs=values.get("packs", 0),
+        pack_kib=values.get("size-pack", 0),
+    )
+
+
+def _step_commands(step: str, repo_path: Path) -> list[list[str]]:
+    """Git commands making up one maintenance step."""
+    if step == "loose-objects":
+        # Pack reachable loose objects into one new pack; existing packs stay
+        return [["repack", "-d", "-q"]]
+    if step == "prune":
+        return [["prune", f"--expire={PRUNE_EXPIRE}"]]
+    if step == "incremental-repack":
+        commands = [["multi-pack-index", "write"], ["multi-pack-index", "expire"]]
+        batch_size = _repack_batch_size(repo_path)
+        if batch_size:
+            commands.append(
+                ["multi-pack-index", "repack", f"--batch-size={batch_size}"]
+            )
+        return commands
+    if step == "commit-graph":
+        return [["commit-graph", "write", "--reachable", "--split"]]
+    raise ValueError(f"Unknown step: {step}")
+
+
+def _repack_batch_size(repo_path: Path) -> int:
+    """Batch size that merges the small packs but leaves the largest alone.
+
+    Mirrors `git maintenance`'s incremental-repack task: one byte more
+    than the second-largest pack. Returns 0 (skip) with fewer than two
+    packs.
+    """
+    git_dir = git_refs.resolve_git_dir(repo_path)
+    if git_dir is None:
+        return 0
+    pack_dir = git_refs.common_dir(git_dir) / "objects" / "pack"
+    try:
+        sizes = sorted(p.stat().st_size for p in pack_dir.glob("*.pack"))
+    except OSError:
+        return 0
+    return sizes[-2] + 1 if len(sizes) >= 2 else 0
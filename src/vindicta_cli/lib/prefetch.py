@@ -0,0 +1,125 @@
+"""Background prefetch — download remote changes before `sync` needs them.
+
+`prefetch_workspace` fetches every repo into `refs/prefetch/` (see
+`sync_service.prefetch_repo`) and records when each repo was prefetched
+in `.vindicta/prefetch.json`. A later foreground `sync` treats prefetches
+younger than `prefetch_max_age` as current: it moves the remote-tracking
+refs locally instead of going to the network, then consumes the stamps
+so the following sync fetches for real again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+from vindicta_cli.lib.json_store import atomic_write_json, load_versioned_json
+from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.lib.sync_service import SyncResult, prefetch_repo
+
+logger = get_logger("prefetch")
+
+STAMPS_VERSION = 1
+
+
+def stamps_path(workspace_root: Path) -> Path:
+    """Return the prefetch stamp file path for a workspace."""
+    return workspace_root / ".vindicta" / "prefetch.json"
+
+
+def load_stamps(workspace_root: Path) -> dict[str, float]:
+    """Return repo name → time of its last successful prefetch."""
+    return load_versioned_json(stamps_path(workspace_root), STAMPS_VERSION, "repos")
+
+
+def _save_stamps(workspace_root: Path, stamps: dict[str, float]) -> None:
+    data = {"version": STAMPS_VERSION, "repos": stamps}
+    try:
+        atomic_write_json(stamps_path(workspace_root), data)
+    except OSError as e:
+        logger.warning("Failed to write prefetch stamps: %s", e)
+
+
+def fresh_prefetches(workspace_root: Path, max_age: float) -> set[str]:
+    """Names of repos prefetched within the last `max_age` seconds."""
+    if max_age <= 0:
+        return set()
+    now = time.time()
+    return {
+        name
+        for name, stamp in load_stamps(workspace_root).items()
+        if isinstance(stamp, (int, float)) and now - stamp <= max_age
+    }
+
+
+def consume_prefetches(workspace_root: Path, names: list[str]) -> None:
+    """Forget prefetches that a foreground sync has applied."""
+    stamps = load_stamps(workspace_root)
+    if any(name in stamps for name in names):
+        for name in names:
+            stamps.pop(name, None)
+        _save_stamps(workspace_root, stamps)
+
+
+def used_prefetches(results: list[SyncResult], fresh: set[str]) -> list[str]:
+    """Names of repos whose sync caught up with their fresh prefetch.
+
+    Their tracking refs now match (or are past) the prefetch, by applying
+    it or by a real fetch. Repos skipped as dirty, failed or cut off by
+    the deadline keep their prefetch for the next sync.
+    """
+    return [
+        r.name
+        for r in results
+        if r.name in fresh and r.success and r.action != "skipped"
+    ]
+
+
+async def prefetch_workspace(
+    workspace_root: Path,
+    repos: list[tuple[str, Path]],
+    profiles: dict[str, str] | None = None,
+    parallel_count: int = 4,
+    timeout: int = 120,
+    deadline: float | None = None,
+) -> dict[str, bool]:
+    """Prefetch repos concurrently and stamp the ones that succeeded.
+
+    Args:
+        workspace_root: Workspace whose stamp file is updated.
+        repos: List of (name, path) tuples.
+        profiles: Repo name → fetch profile; repos not listed use "full".
+        parallel_count: Max concurrent fetches.
+        timeout: Per-repo timeout in seconds.
+        deadline: Overall time budget in seconds; repos still fetching
+            when it runs out are cancelled and count as failed.
+
+    Returns:
+        Dict of repo name → success.
+    """
+    semaphore = asyncio.Semaphore(parallel_count)
+
+    async def _one(name: str, path: Path) -> bool:
+        async with semaphore:
+            profile = (profiles or {}).get(name, "full")
+            return await prefetch_repo(path, profile, timeout=timeout)
+
+    tasks = [asyncio.create_task(_one(name, path)) for name, path in repos]
+    pending: set[asyncio.Task] = set()
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    results = {
+        name: not task.cancelled() and task.result()
+        for (name, _), task in zip(repos, tasks)
+    }
+
+    now = time.time()
+    stamps = load_stamps(workspace_root)
+    stamps.update({name: now for name, ok in results.items() if ok})
+    _save_stamps(workspace_root, stamps)
+    logger.info("Prefetched %d/%d repos", sum(results.values()), len(results))
+    return results
@@ -0,0 +1,234 @@
+"""Remote data cache — GitHub PR/CI summaries and auth state.
+
+Stores results from `GhClient` in `.vindicta/remote-cache.json` so that
+`status --ci` doesn't hit GitHub on every run. Entries younger than the
+TTL are served as-is; older ones are served immediately and refreshed by
+a detached process (`python -m vindicta_cli.lib.remote_cache`), so the
+command exits without waiting on GitHub (stale-while-revalidate).
+Entries older than `MAX_STALE`, or unreadable, are treated as missing
+and fetched in the foreground.
+
+`vindicta dev sync` invalidates the entries of repos whose remote-tracking
+refs it moved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from vindicta_cli.lib.gh_client import GhClient, RepoCiSummary
+from vindicta_cli.lib.json_store import atomic_write_json, load_versioned_json
+from vindicta_cli.lib.logger import get_logger
+
+logger = get_logger("remote_cache")
+
+CACHE_VERSION = 1
+
+# Stale entries older than this are refetched before answering
+MAX_STALE = 24 * 3600
+
+_AUTH_KEY = "auth"
+_SUMMARY_PREFIX = "summary:"
+
+
+def cache_path(workspace_root: Path) -> Path:
+    """Return the remote cache file path for a workspace."""
+    return workspace_root / ".vindicta" / "remote-cache.json"
+
+
+class RemoteCache:
+    """JSON file of `key → (value, fetched_at)` entries."""
+
+    def __init__(self, workspace_root: Path, ttl: float = 300.0) -> None:
+        self.path = cache_path(workspace_root)
+        self.ttl = ttl
+        # A None value marks a deletion for `save` to apply to the file
+        self._entries: dict[str, dict[str, Any] | None] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load entries from disk, discarding unreadable or foreign caches."""
+        with self._lock:
+            self._entries = self._read()
+
+    def _read(self) -> dict[str, dict[str, Any] | None]:
+        return load_versioned_json(self.path, CACHE_VERSION, "entries")
+
+    def save(self) -> None:
+        """Merge with the file on disk (newest entry wins) and write atomically."""
+        with self._lock:
+            merged = self._read()
+            for key, entry in self._entries.items():
+                current = merged.get(key)
+                if entry is None:
+                    merged.pop(key, None)
+                elif current is None or entry["fetched_at"] >= current.get(
+                    "fetched_at", 0
+                ):
+                    merged[key] = entry
+
+            data = {"version": CACHE_VERSION, "entries": merged}
+            try:
+                atomic_write_json(self.path, data)
+            except OSError as e:
+                logger.warning("Failed to write remote cache: %s", e)
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """Return `(value, age_seconds)` for a key, or None if absent."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if not entry:
+            return None
+        return entry.get("value"), time.time() - entry.get("fetched_at", 0)
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a freshly fetched value."""
+        with self._lock:
+            self._entries[key] = {"value": value, "fetched_at": time.time()}
+
+    def invalidate(self, keys: list[str] | None = None) -> None:
+        """Drop entries (default: all) so they are refetched next time."""
+        with self._lock:
+            for key in keys if keys is not None else list(self._entries):
+                self._entries[key] = None
+
+
+def summary_key(slug: str) -> str:
+    """Cache key of a repo's PR/CI summary."""
+    return f"{_SUMMARY_PREFIX}{slug}"
+
+
+def cached_check_auth(cache: RemoteCache, client: GhClient | None = None) -> bool:
+    """Check gh authentication, remembering a successful check for the TTL.
+
+    Failures aren't cached so that logging in takes effect immediately.
+    """
+    cached = cache.get(_AUTH_KEY)
+    if cached and cached[0] and cached[1] < cache.ttl:
+        return True
+    ok = (client or GhClient()).check_auth()
+    if ok:
+        cache.put(_AUTH_KEY, True)
+    return ok
+
+
+def get_cached_repo_summaries(
+    cache: RemoteCache,
+    repos: list[str],
+    client: GhClient | None = None,
+    refresh: bool = False,
+) -> tuple[dict[str, RepoCiSummary], list[str]]:
+    """Fetch PR/CI summaries, serving cached entries when possible.
+
+    Missing (or too stale) entries are fetched before returning. Entries
+    past the TTL are returned as-is and listed for revalidation, which
+    callers hand to `revalidate_detached` once they have shown output.
+
+    Args:
+        cache: Loaded remote cache.
+        repos: Repos in owner/name format.
+        client: GitHub client to use. Defaults to a new `GhClient`.
+        refresh: Fetch everything in the foreground, ignoring the cache.
+
+    Returns:
+        Tuple of (owner/name → summary, stale repos to revalidate).
+    """
+    client = client or GhClient()
+    summaries: dict[str, RepoCiSummary] = {}
+    missing: list[str] = []
+    stale: list[str] = []
+
+    for repo in repos:
+        cached = None if refresh or cache.ttl <= 0 else cache.get(summary_key(repo))
+        if cached is None or cached[0] is None or cached[1] > MAX_STALE:
+            missing.append(repo)
+            continue
+        try:
+            summaries[repo] = RepoCiSummary(**cached[0])
+        except TypeError:
+            # Written by an older version, or damaged
+            missing.append(repo)
+            continue
+        if cached[1] > cache.ttl:
+            stale.append(repo)
+
+    if missing:
+        summaries.update(fetch_repo_summaries(cache, client, missing))
+
+    return summaries, stale
+
+
+def revalidate_detached(workspace_root: Path, repos: list[str]) -> None:
+    """Refresh cached summaries in a detached process and return at once.
+
+    The process outlives the calling command, so its output isn't held
+    up by the GitHub round-trip.
+    """
+    if not repos:
+        return
+    logger.debug("Revalidating %d stale repo summaries", len(repos))
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", __name__, str(workspace_root), *repos],
+            cwd=str(workspace_root),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        logger.warning("Failed to start remote cache refresh: %s", e)
+
+
+def invalidate_repo_summaries(workspace_root: Path, repos: list[str]) -> None:
+    """Drop cached summaries for repos whose remote state just changed.
+
+    The cache file is only rewritten if one of the repos had an entry.
+    """
+    if not repos:
+        return
+    cache = RemoteCache(workspace_root)
+    cache.load()
+    keys = [summary_key(repo) for repo in repos]
+    keys = [key for key in keys if cache.get(key) is not None]
+    if keys:
+        cache.invalidate(keys)
+        cache.save()
+
+
+def fetch_repo_summaries(
+    cache: RemoteCache, client: GhClient, repos: list[str]
+) -> dict[str, RepoCiSummary]:
+    """Query GitHub for repos and record the results in the cache."""
+    fetched = asyncio.run(client.get_repo_summaries(repos))
+    if cache.ttl > 0:
+        for repo, summary in fetched.items():
+            cache.put(summary_key(repo), asdict(summary))
+        if fetched:
+            cache.save()
+    return fetched
+
+
+def _main(argv: list[str]) -> None:
+    """Entry point of the detached refresh: WORKSPACE_ROOT REPO..."""
+    from vindicta_cli.lib.workspace import load_config
+
+    root, *repos = argv
+    workspace_root = Path(root)
+    # Same TTL as the command that spawned us, so entries aren't dropped
+    cache = RemoteCache(
+        workspace_root, ttl=load_config(workspace_root).remote_cache_ttl
+    )
+    cache.load()
+    fetch_repo_summaries(cache, GhClient(), repos)
+
+
+if __name__ == "__main__":
+    _main(sys.argv[1:])
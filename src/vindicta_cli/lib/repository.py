@@ -6,21 +6,77 @@ Handles cloning repositories and detecting repo types.
 from __future__ import annotations
 
 import asyncio
+import shutil
+import time
 from pathlib import Path
-from typing import Callable
+from typing import Awaitable, Callable, Collection
 
+from vindicta_cli.lib import git_refs
+from vindicta_cli.lib.bundle_service import clone_from_bundles, load_manifest
 from vindicta_cli.lib.gh_client import GhClient
+from vindicta_cli.lib.init_journal import CLONE_STAGES, InitJournal, verify_clone
 from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.lib.mirror import clone_from_local, refresh_mirror
+from vindicta_cli.lib.scheduler import DurationHistory
 from vindicta_cli.models.repo_info import RepoEntry
 
 logger = get_logger("repository")
 
 
+def clone_args(mode: str, depth: int = 1) -> list[str]:
+    """Return the `git clone` flags for a clone mode.
+
+    Args:
+        mode: One of `CLONE_MODES`.
+        depth: Commits to fetch for "shallow" clones.
+    """
+    if mode == "full":
+        return []
+    if mode == "blobless":
+        return ["--filter=blob:none"]
+    if mode == "single-branch":
+        return ["--single-branch"]
+    if mode == "shallow":
+        # --depth implies --single-branch
+        return [f"--depth={depth}"]
+    raise ValueError(f"Unknown clone mode: {mode}")
+
+
+def has_local_source(
+    name: str,
+    mirror_root: Path | None = None,
+    seed_workspace: Path | None = None,
+    bundled: Collection[str] = (),
+) -> bool:
+    """Whether `clone_repos` would clone a repo from a local source.
+
+    Args:
+        name: Repo name.
+        mirror_root: Mirror store passed to `clone_repos`.
+        seed_workspace: Seed workspace passed to `clone_repos`.
+        bundled: Repo names in the bundle manifest.
+    """
+    if mirror_root is not None or name in bundled:
+        return True
+    return (
+        seed_workspace is not None
+        and git_refs.resolve_git_dir(seed_workspace / name) is not None
+    )
+
+
 async def clone_repos(
     repos: list[RepoEntry],
     workspace_root: Path,
     parallel_count: int = 4,
     on_progress: Callable[[str, str], None] | None = None,
+    history: DurationHistory | None = None,
+    clone_modes: dict[str, str] | None = None,
+    depth: int = 1,
+    mirror_root: Path | None = None,
+    seed_workspace: Path | None = None,
+    bundle_dir: Path | None = None,
+    on_cloned: Callable[[RepoEntry], Awaitable[None]] | None = None,
+    journal: InitJournal | None = None,
 ) -> dict[str, bool]:
     """Clone multiple repos in parallel.
 
@@ -29,41 +85,128 @@ async def clone_repos(
         workspace_root: Target workspace directory.
         parallel_count: Max concurrent clones.
         on_progress: Callback(repo_name, status_message).
+        history: Duration history that successful network clone times
+            are recorded in. Clones start in the order given.
+        clone_modes: Repo name → clone mode; repos not listed are
+            cloned in full.
+        depth: Commits to fetch for "shallow" clones.
+        mirror_root: Mirror store to refresh and clone from instead of
+            the network (see `lib.mirror`).
+        seed_workspace: Existing workspace whose repos are cloned from
+            and then fetched; takes precedence over `mirror_root`.
+        bundle_dir: Directory written by `vindicta dev bundle`; repos
+            with bundles there are created from them without the
+            network, ahead of any other source.
+        on_cloned: Awaited with each repo that was cloned or already
+            present, after its clone slot is released, so follow-up
+            work (setup) overlaps with the remaining clones. The call
+            finishes before `clone_repos` returns.
+        journal: Init journal that clone progress is recorded in. With
+            one, existing directories are checked: verified repos are
+            kept, partial clones left by an interrupted run are removed
+            and cloned again, and other incomplete directories fail
+            without being touched.
+
+    Clone modes don't apply to local sources. If cloning from a local
+    source fails, the repo is cloned over the network.
 
     Returns:
         Dict of repo_name -> success boolean.
     """
     gh = GhClient()
+    bundled = load_manifest(bundle_dir) if bundle_dir else {}
     semaphore = asyncio.Semaphore(parallel_count)
     results: dict[str, bool] = {}
 
     async def _clone_one(entry: RepoEntry) -> None:
         async with semaphore:
-            target = workspace_root / entry.name
-            if target.exists():
-                if on_progress:
-                    on_progress(entry.name, "already exists — skipping")
-                results[entry.name] = True
-                return
-
+            await _clone(entry)
+        if results.get(entry.name) and on_cloned is not None:
+            await on_cloned(entry)
+
+    async def _clone(entry: RepoEntry) -> None:
+        target = workspace_root / entry.name
+        if target.exists() and not await _reclone_partial(entry, target):
+            return
+
+        mode = (clone_modes or {}).get(entry.name, "full")
+        if on_progress:
+            suffix = "" if mode == "full" else f" ({mode})"
+            on_progress(entry.name, f"cloning{suffix}...")
+
+        started = time.monotonic()
+        try:
+            if journal is not None:
+                journal.begin_clone(entry.name)
+            if not await _clone_local(entry, target):
+                await gh.clone_repo(entry.slug, target, clone_args(mode, depth))
+                # Local clones take milliseconds and would skew the ordering
+                if history is not None:
+                    history.record("clone", entry.name, time.monotonic() - started)
+            if journal is not None:
+                journal.mark(entry.name, "cloned")
+                if not await asyncio.to_thread(verify_clone, target):
+                    raise RuntimeError("clone finished without a checkout")
+                journal.mark(entry.name, "verified")
+            entry.present = True
+            entry.local_path = target
+            results[entry.name] = True
             if on_progress:
-                on_progress(entry.name, "cloning...")
-
-            try:
-                org_repo = entry.github_url.replace("https://github.com/", "").rstrip(
-                    ".git"
-                )
-                await gh.clone_repo(org_repo, target)
-                entry.present = True
-                entry.local_path = target
-                results[entry.name] = True
+                on_progress(entry.name, "✓ cloned")
+        except Exception as e:
+            results[entry.name] = False
+            logger.error("Failed to clone %s: %s", entry.name, e)
+            if on_progress:
+                on_progress(entry.name, f"✗ failed: {e}")
+
+    async def _reclone_partial(entry: RepoEntry, target: Path) -> bool:
+        """Handle an existing directory; True if it was removed for recloning."""
+        if journal is not None and not journal.has(entry.name, "verified"):
+            if await asyncio.to_thread(verify_clone, target):
+                journal.mark(entry.name, *CLONE_STAGES)
+            elif journal.started(entry.name):
+                # Left behind by an interrupted init
                 if on_progress:
-                    on_progress(entry.name, "✓ cloned")
-            except Exception as e:
+                    on_progress(entry.name, "removing partial clone...")
+                logger.info("Removing partial clone of %s", entry.name)
+                await asyncio.to_thread(shutil.rmtree, target, ignore_errors=True)
+                return True
+            else:
+                # Not created by init, so never deleted
                 results[entry.name] = False
-                logger.error("Failed to clone %s: %s", entry.name, e)
+                logger.error("%s exists but is not a complete clone", target)
                 if on_progress:
-                    on_progress(entry.name, f"✗ failed: {e}")
+                    on_progress(entry.name, "✗ exists but is not a complete clone")
+                return False
+
+        if on_progress:
+            on_progress(entry.name, "already exists — skipping")
+        entry.present = True
+        entry.local_path = target
+        results[entry.name] = True
+        return False
+
+    async def _clone_local(entry: RepoEntry, target: Path) -> bool:
+        """Clone from bundles, seed workspace or mirror; False if none applies."""
+        seed = seed_workspace / entry.name if seed_workspace else None
+        if seed is not None and git_refs.resolve_git_dir(seed) is None:
+            seed = None
+        try:
+            if bundle_dir is not None and entry.name in bundled:
+                await asyncio.to_thread(
+                    clone_from_bundles, bundle_dir, entry.name, target, entry.github_url
+                )
+            elif seed is not None:
+                await clone_from_local(seed, target)
+            elif mirror_root is not None:
+                await clone_from_local(await refresh_mirror(entry, mirror_root), target)
+            else:
+                return False
+            return True
+        except Exception as e:
+            logger.warning("Local clone of %s failed, using network: %s", entry.name, e)
+            await asyncio.to_thread(shutil.rmtree, target, ignore_errors=True)
+            return False
 
     tasks = [_clone_one(entry) for entry in repos]
     await asyncio.gather(*tasks, return_exceptions=True)
@@ -3,20 +3,18 @@
 Configures tenacity for network operation retries.
 3 attempts with delays: 1s, 2s, 4s (total ~7s max wait).
 Only retries on network-related exceptions.
+
+tenacity is imported on the first call of a decorated function rather
+than at decoration time, so importing a module that uses `with_retry`
+stays cheap.
 """
 
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
 
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
-
 logger = logging.getLogger("vindicta.retry")
 
 # Network-related exceptions that should trigger retries
@@ -27,13 +25,16 @@ RETRYABLE_EXCEPTIONS = (
 )
 
 
-def with_retry(func):
-    """Decorator for exponential backoff retry on network failures.
+def _build_retrying(func):
+    """Wrap func with the tenacity retry policy."""
+    from tenacity import (
+        before_sleep_log,
+        retry,
+        retry_if_exception_type,
+        stop_after_attempt,
+        wait_exponential,
+    )
 
-    Retries up to 3 times with exponential backoff (1s, 2s, 4s).
-    Only retries on network-related exceptions (ConnectionError,
-    TimeoutError, OSError). Other exceptions propagate immediately.
-    """
     return retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=4),
@@ -41,3 +42,33 @@ def with_retry(func):
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )(func)
+
+
+def with_retry(func):
+    """Decorator for exponential backoff retry on network failures.
+
+    Retries up to 3 times with exponential backoff (1s, 2s, 4s).
+    Only retries on network-related exceptions (ConnectionError,
+    TimeoutError, OSError). Other exceptions propagate immediately.
+    """
+    retrying = None
+
+    def _get_retrying():
+        nonlocal retrying
+        if retrying is None:
+            retrying = _build_retrying(func)
+        return retrying
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            return await _get_retrying()(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return _get_retrying()(*args, **kwargs)
+
+    return wrapper
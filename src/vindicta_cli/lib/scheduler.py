@@ -0,0 +1,145 @@
+"""Makespan-aware ordering of per-repo jobs.
+
+Multi-repo commands run jobs through a FIFO semaphore, so the order in
+which they are queued decides the total wall time: a big repo that only
+starts near the end leaves the run waiting on it alone. `schedule`
+queues the longest jobs first (LPT scheduling), using how long each repo
+took on previous runs — sync durations from the sync history (see
+`sync_history.typical`), clone durations from `.vindicta/durations.json`
+— and falling back to the size of its local object store, then to the
+size GitHub reports for it (so a first clone is ordered too). Tier (P0
+before P3) breaks ties.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+
+from vindicta_cli.lib import git_refs
+from vindicta_cli.lib.json_store import atomic_write_json, load_versioned_json
+from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.models.repo_info import RepoEntry
+
+logger = get_logger("scheduler")
+
+HISTORY_VERSION = 1
+
+# Weight of the latest run in the moving average of durations
+_SMOOTHING = 0.5
+
+# Rough transfer rate used to turn object store size into seconds
+_BYTES_PER_SECOND = 2 * 1024 * 1024
+
+_TIER_RANK = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+
+
+def history_path(workspace_root: Path) -> Path:
+    """Return the duration history file path for a workspace."""
+    return workspace_root / ".vindicta" / "durations.json"
+
+
+class DurationHistory:
+    """Smoothed per-repo durations of past runs, keyed by operation.
+
+    Only `init` records here (as "clone"); sync timings live in the
+    sync history, which keeps every phase of every run.
+    """
+
+    def __init__(self, workspace_root: Path) -> None:
+        self.path = history_path(workspace_root)
+        self._entries: dict[str, float] = {}
+
+    def load(self) -> None:
+        """Load durations from disk, discarding unreadable files."""
+        self._entries = load_versioned_json(self.path, HISTORY_VERSION, "entries")
+
+    def save(self) -> None:
+        """Write durations atomically."""
+        data = {"version": HISTORY_VERSION, "entries": self._entries}
+        try:
+            atomic_write_json(self.path, data)
+        except OSError as e:
+            logger.warning("Failed to write duration history: %s", e)
+
+    def get(self, op: str, name: str) -> float | None:
+        """Return the expected duration of `op` on a repo, if known."""
+        value = self._entries.get(f"{op}:{name}")
+        return float(value) if isinstance(value, (int, float)) else None
+
+    def record(self, op: str, name: str, seconds: float) -> None:
+        """Fold a measured duration into the repo's moving average."""
+        previous = self.get(op, name)
+        if previous is not None:
+            seconds = _SMOOTHING * seconds + (1 - _SMOOTHING) * previous
+        self._entries[f"{op}:{name}"] = round(seconds, 3)
+
+    def durations(self, op: str) -> dict[str, float]:
+        """Return the expected duration of `op` for every known repo."""
+        prefix = f"{op}:"
+        return {
+            key[len(prefix) :]: float(value)
+            for key, value in self._entries.items()
+            if key.startswith(prefix) and isinstance(value, (int, float))
+        }
+
+
+def object_store_size(repo_path: Path) -> int:
+    """Return the size in bytes of a repo's packfiles (0 if unknown)."""
+    git_dir = git_refs.resolve_git_dir(repo_path)
+    if git_dir is None:
+        return 0
+    total = 0
+    try:
+        for pack in (git_refs.common_dir(git_dir) / "objects" / "pack").glob("*.pack"):
+            total += pack.stat().st_size
+    except OSError:
+        pass
+    return total
+
+
+def estimate(
+    entry: RepoEntry,
+    durations: Mapping[str, float] | None = None,
+    remote_sizes: Mapping[str, int] | None = None,
+) -> float:
+    """Expected duration of a job on a repo in seconds.
+
+    Uses recorded durations when available, then the local object store
+    size, then the size GitHub reports. Repos with none estimate to 0.
+    """
+    if durations is not None and entry.name in durations:
+        return durations[entry.name]
+    local = object_store_size(entry.local_path) if entry.local_path else 0
+    if local:
+        return local / _BYTES_PER_SECOND
+    return (remote_sizes or {}).get(entry.name, 0) / _BYTES_PER_SECOND
+
+
+def schedule(
+    entries: list[RepoEntry],
+    durations: Mapping[str, float] | None = None,
+    remote_sizes: Mapping[str, int] | None = None,
+) -> list[RepoEntry]:
+    """Order repos longest-expected-first, then by tier, then registry order.
+
+    Args:
+        entries: Repos to run the job on.
+        durations: Repo name → seconds the job took on earlier runs.
+        remote_sizes: Repo name → repository size in bytes on GitHub,
+            for repos that have not been cloned yet.
+
+    Returns:
+        The same entries in the order their jobs should start.
+    """
+    keyed = [
+        (
+            -estimate(entry, durations, remote_sizes),
+            _TIER_RANK.get(entry.tier, 4),
+            index,
+            entry,
+        )
+        for index, entry in enumerate(entries)
+    ]
+    keyed.sort(key=lambda item: item[:3])
+    return [item[3] for item in keyed]
@@ -1,15 +1,21 @@
 """Setup service — T029.
 
 Handles dependency installation, virtual environment creation,
-and pre-commit hook setup for workspace repositories.
+pre-commit hook setup and git status tuning for workspace repositories.
 """
 
 from __future__ import annotations
 
+import asyncio
+import os
 import subprocess
 from pathlib import Path
+from typing import Callable, Collection
 
+from vindicta_cli.lib.git_tuning import enable_tuning
+from vindicta_cli.lib.init_journal import InitJournal
 from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.models.repo_info import RepoEntry
 
 logger = get_logger("setup_service")
 
@@ -20,6 +26,9 @@ def setup_repo(
     skip_venv: bool = False,
     skip_hooks: bool = False,
     skip_node: bool = False,
+    skip_git_tuning: bool = False,
+    done: Collection[str] = (),
+    on_step: Callable[[str, bool], None] | None = None,
 ) -> dict[str, bool]:
     """Set up a single repository.
 
@@ -29,25 +38,122 @@ def setup_repo(
         skip_venv: Skip virtual environment creation.
         skip_hooks: Skip pre-commit hook installation.
         skip_node: Skip Node.js dependency installation.
+        skip_git_tuning: Leave untracked cache / fsmonitor settings alone.
+        done: Steps that already succeeded on an earlier run; they are
+            not run again and are left out of the results.
+        on_step: Callback(step, success) after each step that runs.
 
     Returns:
         Dict with setup step results.
     """
-    results: dict[str, bool] = {}
+    steps: list[tuple[str, Callable[[Path], bool]]] = []
 
     if repo_type in ("python", "mixed") and not skip_venv:
-        results["venv"] = _create_venv(repo_path)
-        results["python_deps"] = _install_python_deps(repo_path)
+        steps.append(("venv", _create_venv))
+        steps.append(("python_deps", _install_python_deps))
 
     if repo_type in ("nodejs", "mixed") and not skip_node:
-        results["node_deps"] = _install_node_deps(repo_path)
+        steps.append(("node_deps", _install_node_deps))
 
     if not skip_hooks:
-        results["hooks"] = _install_hooks(repo_path)
+        steps.append(("hooks", _install_hooks))
+
+    if not skip_git_tuning:
+        steps.append(("git_tuning", enable_tuning))
+
+    results: dict[str, bool] = {}
+    for step, run in steps:
+        if step in done:
+            continue
+        results[step] = run(repo_path)
+        if on_step:
+            on_step(step, results[step])
 
     return results
 
 
+def default_setup_parallel() -> int:
+    """Concurrent setups that keep CPU and disk busy without thrashing."""
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+class SetupStage:
+    """Set up repos as they arrive from `clone_repos(on_cloned=...)`.
+
+    Cloning is network bound while venv/deps/hooks are CPU and disk
+    bound, so setup has its own concurrency limit and runs in worker
+    threads: each repo is set up as soon as its own clone finishes
+    instead of waiting for the slowest clone.
+
+    With a journal, steps that succeeded on an earlier run are skipped
+    and each step is recorded as soon as it succeeds.
+    """
+
+    def __init__(
+        self,
+        parallel_count: int | None = None,
+        on_progress: Callable[[str, str], None] | None = None,
+        journal: InitJournal | None = None,
+        **options: bool,
+    ) -> None:
+        """Create a setup stage.
+
+        Args:
+            parallel_count: Max concurrent setups (default: half the CPUs,
+                at most 4).
+            on_progress: Callback(repo_name, status_message).
+            journal: Init journal to resume from and record steps in.
+            **options: Skip flags passed to `setup_repo`.
+        """
+        self.results: dict[str, dict[str, bool]] = {}
+        self._slots = asyncio.Semaphore(parallel_count or default_setup_parallel())
+        self._on_progress = on_progress
+        self._journal = journal
+        self._options = options
+
+    async def __call__(self, entry: RepoEntry) -> None:
+        """Set up one cloned repo, recording its step results."""
+        if entry.local_path is None:
+            return
+        done: Collection[str] = ()
+        on_step: Callable[[str, bool], None] | None = None
+        journal = self._journal
+        if journal is not None:
+            done = journal.stages(entry.name)
+
+            def _record(step: str, ok: bool) -> None:
+                if ok:
+                    journal.mark(entry.name, step)
+
+            on_step = _record
+
+        async with self._slots:
+            self._report(entry.name, "setting up...")
+            try:
+                steps = await asyncio.to_thread(
+                    setup_repo,
+                    entry.local_path,
+                    entry.repo_type,
+                    done=done,
+                    on_step=on_step,
+                    **self._options,
+                )
+            except Exception as e:
+                logger.error("Setup of %s failed: %s", entry.name, e)
+                steps = {"setup": False}
+        self.results[entry.name] = steps
+
+        failed = [step for step, ok in steps.items() if not ok]
+        if failed:
+            self._report(entry.name, f"✗ setup failed: {', '.join(failed)}")
+        else:
+            self._report(entry.name, "✓ set up")
+
+    def _report(self, name: str, status: str) -> None:
+        if self._on_progress:
+            self._on_progress(name, status)
+
+
 def _create_venv(repo_path: Path) -> bool:
     """Create a virtual environment using uv."""
     try:
@@ -0,0 +1,324 @@
+"""Persistent status cache.
+
+Stores each repo's last computed `RepoInfo` in
+`.vindicta/status-cache.json` together with a stat fingerprint of its git
+metadata and working tree, so `vindicta dev status` only recomputes repos
+that changed since the previous run.
+
+The working-tree part compares every tracked file's stat data with what
+the index recorded, the same check `git status` starts with, but without
+spawning git. Files inside untracked directories are not seen, so cached
+entries also expire after a TTL; `ttl=0` disables the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from vindicta_cli.lib.git_refs import common_dir, read_index_stats, resolve_git_dir
+from vindicta_cli.lib.json_store import atomic_write_json, load_versioned_json
+from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.lib.workspace import REPO_DEADLINE, collect_repo_infos
+from vindicta_cli.models.repo_info import RepoEntry, RepoInfo
+
+logger = get_logger("status_cache")
+
+CACHE_VERSION = 1
+
+# Git metadata files whose stat changes mean a repo must be recomputed
+_FINGERPRINT_FILES = (
+    "HEAD",
+    "index",
+    "packed-refs",
+    "FETCH_HEAD",
+    "ORIG_HEAD",
+    "MERGE_HEAD",
+    "logs/HEAD",
+    "config",
+)
+
+
+def cache_path(workspace_root: Path) -> Path:
+    """Return the status cache file path for a workspace."""
+    return workspace_root / ".vindicta" / "status-cache.json"
+
+
+def git_fingerprint(repo_path: Path) -> list[list[Any]]:
+    """Cheap stat-based fingerprint of a repo's git metadata and worktree.
+
+    Covers HEAD, the index, packed and loose refs, the repo config, the
+    working tree root and tracked files (see `worktree_digest`). Ref
+    updates are written via lock-file renames, so the mtimes of the
+    `refs/` directories change whenever a ref does.
+
+    Returns:
+        JSON-serializable list of `[name, mtime_ns, size]` entries plus a
+        `["worktree", digest]` entry.
+    """
+    git_dir = resolve_git_dir(repo_path) or repo_path / ".git"
+    shared = common_dir(git_dir)
+    parts: list[list[Any]] = []
+
+    def _stat(name: str, path: Path) -> None:
+        try:
+            st = path.stat()
+            parts.append([name, st.st_mtime_ns, st.st_size])
+        except OSError:
+            parts.append([name, None, None])
+
+    for name in _FINGERPRINT_FILES:
+        base = git_dir if (git_dir / name).exists() else shared
+        _stat(name, base / name)
+
+    for dirpath, _dirnames, _filenames in os.walk(shared / "refs"):
+        _stat(os.path.relpath(dirpath, shared), Path(dirpath))
+
+    _stat(".", repo_path)
+    parts.append(["worktree", worktree_digest(repo_path, git_dir)])
+    return parts
+
+
+def worktree_digest(repo_path: Path, git_dir: Path) -> str:
+    """Digest of the tracked files that differ from the index.
+
+    A tracked file whose size or mtime no longer matches the index has
+    been edited (or deleted) since git last looked at it; its current stat
+    goes into the digest, so every further edit changes it too. Files
+    modified in the same second the index was written can't be told apart
+    by git's recorded stat ("racy" entries), so theirs is always included.
+    The mtimes of directories holding tracked files cover files added to
+    or removed from them.
+
+    Returns:
+        Hex digest, or a unique value when the index can't be read so the
+        repo is never served from cache.
+    """
+    stats = read_index_stats(git_dir)
+    try:
+        index_mtime_s = int((git_dir / "index").stat().st_mtime)
+    except OSError:
+        index_mtime_s = 0
+    if stats is None:
+        return f"unreadable-index:{time.time_ns()}"
+
+    digest = hashlib.sha1(usedforsecurity=False)
+    directories: set[str] = set()
+    for entry in stats:
+        directories.add(os.path.dirname(entry.path))
+        path = os.path.join(repo_path, entry.path)
+        try:
+            st = os.lstat(path)
+        except OSError:
+            digest.update(f"-{entry.path}\0".encode(errors="surrogateescape"))
+            continue
+        changed = (
+            int(st.st_mtime) != entry.mtime_s
+            or (entry.mtime_ns and st.st_mtime_ns % 1_000_000_000 != entry.mtime_ns)
+            or st.st_size & 0xFFFFFFFF != entry.size
+        )
+        if changed or entry.mtime_s >= index_mtime_s:
+            line = f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\0"
+            digest.update(line.encode(errors="surrogateescape"))
+
+    for directory in sorted(directories):
+        try:
+            mtime_ns = os.stat(os.path.join(repo_path, directory)).st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        digest.update(f"{directory}/\0{mtime_ns}\0".encode(errors="surrogateescape"))
+    return digest.hexdigest()
+
+
+def _entry_fingerprint(entry: RepoEntry) -> list[list[Any]]:
+    if entry.local_path is None:
+        raise ValueError(f"{entry.name} is not checked out")
+    return git_fingerprint(entry.local_path)
+
+
+class StatusCache:
+    """RepoInfo cache keyed by repo name and git metadata fingerprint."""
+
+    def __init__(self, workspace_root: Path, ttl: float = 300.0) -> None:
+        self.path = cache_path(workspace_root)
+        self.ttl = ttl
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    def load(self) -> None:
+        """Load entries from disk, discarding unreadable or foreign caches."""
+        self._entries = load_versioned_json(self.path, CACHE_VERSION, "repos")
+
+    def save(self) -> None:
+        """Write entries atomically so concurrent readers never see a torn file."""
+        data = {"version": CACHE_VERSION, "repos": self._entries}
+        try:
+            atomic_write_json(self.path, data)
+        except OSError as e:
+            logger.warning("Failed to write status cache: %s", e)
+
+    def get(self, entry: RepoEntry, fingerprint: list[list[Any]]) -> RepoInfo | None:
+        """Return the cached info for a repo if it is still valid."""
+        cached = self._entries.get(entry.name)
+        if not cached or self.ttl <= 0:
+            return None
+        if (
+            cached.get("fingerprint") != fingerprint
+            or time.time() - cached.get("computed_at", 0) > self.ttl
+        ):
+            return None
+        try:
+            info = RepoInfo.from_dict(cached["info"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if info.local_path != entry.local_path:
+            return None
+        return info
+
+    def put(self, info: RepoInfo, fingerprint: list[list[Any]]) -> None:
+        """Record freshly computed info for a repo."""
+        self._entries[info.name] = {
+            "fingerprint": fingerprint,
+            "computed_at": time.time(),
+            "info": info.to_dict(),
+        }
+
+
+class RepoStateTracker:
+    """In-memory RepoInfo per repo, recomputed when fingerprints change.
+
+    Shared by the workspace daemon and `status --watch`, which both poll
+    fingerprints and only run git for repos that changed.
+    """
+
+    def __init__(self) -> None:
+        self.infos: dict[str, RepoInfo] = {}
+        self._fingerprints: dict[str, list[list[Any]]] = {}
+        self._refreshed_at: dict[str, float] = {}
+
+    def refresh(
+        self,
+        entries: list[RepoEntry],
+        parallel_count: int = 4,
+        max_age: float | None = None,
+        force: bool = False,
+    ) -> list[str]:
+        """Recompute repos whose git metadata changed.
+
+        Repos missing from `entries` are forgotten.
+
+        Args:
+            entries: Present registry entries (with `local_path` set).
+            parallel_count: Max repos inspected at once.
+            max_age: Also recompute entries older than this many seconds.
+            force: Recompute every repo.
+
+        Returns:
+            Names of the repos that were recomputed.
+        """
+        now = time.monotonic()
+        present = {e.name for e in entries}
+        for name in list(self.infos):
+            if name not in present:
+                self.infos.pop(name)
+                self._fingerprints.pop(name, None)
+                self._refreshed_at.pop(name, None)
+
+        stale_entries = []
+        fingerprints = {}
+        for entry in entries:
+            fingerprints[entry.name] = _entry_fingerprint(entry)
+            expired = (
+                max_age is not None
+                and now - self._refreshed_at.get(entry.name, 0.0) > max_age
+            )
+            if (
+                force
+                or expired
+                or entry.name not in self.infos
+                or self._fingerprints.get(entry.name) != fingerprints[entry.name]
+            ):
+                stale_entries.append(entry)
+
+        infos = collect_repo_infos(stale_entries, parallel_count=parallel_count)
+        for info in infos:
+            self.infos[info.name] = info
+            self._fingerprints[info.name] = fingerprints[info.name]
+            self._refreshed_at[info.name] = now
+
+        return [info.name for info in infos]
+
+    def invalidate(self, names: list[str] | None = None) -> None:
+        """Force the given repos (default: all) to recompute next refresh."""
+        for name in names or list(self.infos):
+            self._fingerprints.pop(name, None)
+
+
+def collect_cached_repo_infos(
+    workspace_root: Path,
+    entries: list[RepoEntry],
+    parallel_count: int = 4,
+    ttl: float = 300.0,
+    refresh: bool = False,
+    deadline: float = REPO_DEADLINE,
+    on_result: Callable[[RepoInfo], None] | None = None,
+) -> list[RepoInfo]:
+    """Gather repo state, recomputing only repos whose metadata changed.
+
+    Args:
+        workspace_root: Workspace root holding the cache.
+        entries: Present registry entries (with `local_path` set).
+        parallel_count: Max repos inspected at once.
+        ttl: Seconds a cached entry stays valid. 0 disables the cache.
+        refresh: Ignore cached entries (they are still rewritten).
+        deadline: Time budget in seconds for each recomputed repo.
+        on_result: Called with each RepoInfo as soon as it is available;
+            cache hits first, then recomputed repos as they complete.
+            Streamed results are not kept.
+
+    Returns:
+        RepoInfo list in the same order as `entries`, or an empty list
+        when `on_result` is set.
+    """
+    cache = StatusCache(workspace_root, ttl=ttl)
+    cache.load()
+
+    infos: list[RepoInfo | None] = []
+    stale: dict[str, int] = {}
+    fingerprints: dict[str, list[list[Any]]] = {}
+    for i, entry in enumerate(entries):
+        # Taken before status runs, so changes made meanwhile aren't cached
+        fingerprints[entry.name] = _entry_fingerprint(entry)
+        info = None if refresh else cache.get(entry, fingerprints[entry.name])
+        if info is None:
+            stale[entry.name] = i
+        if on_result:
+            if info is not None:
+                on_result(info)
+        else:
+            infos.append(info)
+
+    def _computed(info: RepoInfo) -> None:
+        cache.put(info, fingerprints[info.name])
+        if on_result:
+            on_result(info)
+        else:
+            infos[stale[info.name]] = info
+
+    if stale:
+        collect_repo_infos(
+            [entries[i] for i in stale.values()],
+            parallel_count=parallel_count,
+            deadline=deadline,
+            on_result=_computed,
+        )
+
+    logger.debug(
+        "Status cache: %d hit(s), %d miss(es)", len(entries) - len(stale), len(stale)
+    )
+    if stale and ttl > 0:
+        cache.save()
+
+    return [info for info in infos if info is not None]
@@ -0,0 +1,133 @@
+"""Sync timing history.
+
+Every `vindicta dev sync` run appends one JSON line with each repo's
+phase timings to `.vindicta/sync-history.jsonl`. `summarize` turns the
+recorded runs into per-repo p50/p95 figures so slow repos and
+regressions show up in `sync --timings`. The same figures order the
+next sync longest-first and set the adaptive limiter's per-repo fetch
+baselines.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from vindicta_cli.lib.logger import get_logger
+from vindicta_cli.lib.sync_service import SyncResult
+
+logger = get_logger("sync_history")
+
+# Runs kept on disk; older ones are dropped when the file is rewritten
+MAX_RUNS = 200
+
+PHASES = ("dirty", "prefetch", "ls-remote", "fetch", "rev-list", "pull", "total")
+
+
+def history_path(workspace_root: Path) -> Path:
+    """Return the sync history file path for a workspace."""
+    return workspace_root / ".vindicta" / "sync-history.jsonl"
+
+
+def load_runs(workspace_root: Path) -> list[dict[str, Any]]:
+    """Read recorded runs, oldest first, skipping unreadable lines."""
+    try:
+        lines = history_path(workspace_root).read_text().splitlines()
+    except OSError:
+        return []
+    runs = []
+    for line in lines:
+        try:
+            run = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(run, dict) and isinstance(run.get("repos"), dict):
+            runs.append(run)
+    return runs
+
+
+def append_run(workspace_root: Path, results: list[SyncResult]) -> None:
+    """Record the phase timings of one sync run.
+
+    Skipped (dirty) repos only carry a dirty check and are left out.
+    """
+    repos = {
+        r.name: {phase: round(secs, 3) for phase, secs in r.timings.items()}
+        for r in results
+        if r.action != "skipped" and r.timings
+    }
+    if not repos:
+        return
+    line = json.dumps({"timestamp": time.time(), "repos": repos})
+
+    path = history_path(workspace_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with path.open("a") as f:
+            f.write(line + "\n")
+        if len(path.read_text().splitlines()) > 2 * MAX_RUNS:
+            _truncate(path)
+    except OSError as e:
+        logger.warning("Failed to write sync history: %s", e)
+
+
+def _truncate(path: Path) -> None:
+    """Rewrite the history keeping only the newest `MAX_RUNS` lines."""
+    lines = path.read_text().splitlines()[-MAX_RUNS:]
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text("".join(line + "\n" for line in lines))
+    os.replace(tmp, path)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list (q in 0-100)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(runs: list[dict[str, Any]]) -> dict[str, dict[str, dict[str, float]]]:
+    """Per-repo, per-phase p50/p95 across runs.
+
+    Returns:
+        Mapping of repo name → phase → {"p50", "p95", "runs"}.
+    """
+    samples: dict[str, dict[str, list[float]]] = {}
+    for run in runs:
+        for name, timings in run["repos"].items():
+            if not isinstance(timings, dict):
+                continue
+            for phase, secs in timings.items():
+                if isinstance(secs, (int, float)):
+                    samples.setdefault(name, {}).setdefault(phase, []).append(secs)
+
+    return {
+        name: {
+            phase: {
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "runs": len(values),
+            }
+            for phase, values in phases.items()
+        }
+        for name, phases in samples.items()
+    }
+
+
+def typical(
+    summary: dict[str, dict[str, dict[str, float]]], phase: str
+) -> dict[str, float]:
+    """Per-repo p50 of one phase from a `summarize` result.
+
+    Used to order repos longest-first (phase "total") and as each repo's
+    fetch latency baseline for the adaptive limiter (phase "fetch").
+    """
+    return {
+        name: phases[phase]["p50"]
+        for name, phases in summary.items()
+        if phase in phases
+    }
@@ -6,15 +6,52 @@ Parallel repository synchronization with configurable fetch/pull.
 from __future__ import annotations
 
 import asyncio
-import subprocess
-from dataclasses import dataclass
+import contextvars
+import os
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable
 
+from vindicta_cli.lib import git_exec, git_refs
+from vindicta_cli.lib.concurrency import AdaptiveLimiter
 from vindicta_cli.lib.logger import get_logger
 
 logger = get_logger("sync_service")
 
+# Namespace background prefetches write to, as `git maintenance` does
+PREFETCH_PREFIX = "refs/prefetch/remotes/"
+
+_POSIX = os.name == "posix"
+
+# Set while a sync deadline is active: git then runs in its own process
+# group, so helpers it spawns (ssh, credential helpers, remote-https) can
+# be killed along with it. Without a deadline git stays in ours, where
+# Ctrl-C reaches it and it can prompt on the terminal.
+_OWN_PROCESS_GROUP: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "own_process_group", default=False
+)
+
+# Fetch stderr fragments that point at the network or an overloaded
+# remote rather than at credentials or a missing repository
+_TRANSPORT_ERRORS = (
+    "could not resolve host",
+    "failed to connect",
+    "connection timed out",
+    "connection refused",
+    "connection reset",
+    "operation timed out",
+    "early eof",
+    "the remote end hung up unexpectedly",
+    "rpc failed",
+    "unexpected disconnect",
+    "http/2 stream",
+    "returned error: 429",
+    "returned error: 502",
+    "returned error: 503",
+    "returned error: 504",
+)
+
 
 @dataclass
 class SyncResult:
@@ -22,10 +59,19 @@ class SyncResult:
 
     name: str
     success: bool
-    action: str  # "fetched", "pulled", "skipped", "failed"
+    # "fetched", "up-to-date", "pulled", "skipped", "failed", "timed_out"
+    action: str
     ahead: int = 0
     behind: int = 0
     message: str = ""
+    # Phase → seconds: "dirty", "prefetch", "ls-remote", "fetch", "rev-list",
+    # "pull", "total"
+    timings: dict[str, float] = field(default_factory=dict)
+    # Failed on a timeout or network error (not e.g. bad credentials);
+    # only these make the adaptive limiter back off
+    congested: bool = False
+    # Some remote-tracking ref now points elsewhere than before the sync
+    refs_moved: bool = False
 
 
 async def sync_repos(
@@ -35,16 +81,44 @@ async def sync_repos(
     parallel_count: int = 4,
     timeout: int = 120,
     on_progress: Callable[[str, str], None] | None = None,
+    on_result: Callable[[SyncResult], None] | None = None,
+    limiter: AdaptiveLimiter | None = None,
+    skip_unchanged: bool = False,
+    fetch_profiles: dict[str, str] | None = None,
+    deadline: float | None = None,
+    prefetched: set[str] | None = None,
+    fetch_baselines: dict[str, float] | None = None,
 ) -> list[SyncResult]:
     """Synchronize multiple repositories in parallel.
 
     Args:
-        repos: List of (name, path) tuples.
+        repos: List of (name, path) tuples. Repos start in the order
+            given, so callers pass them already scheduled (see
+            `scheduler.schedule`).
         pull: Also pull changes (not just fetch).
         force: Force sync even on dirty repos.
         parallel_count: Max concurrent operations.
         timeout: Per-repo timeout in seconds.
         on_progress: Callback(repo_name, status).
+        on_result: Callback(result) invoked as each repo finishes. Results
+            are still returned, since sync records them in run history and
+            derives its exit status from them.
+        limiter: Adaptive concurrency controller used instead of a fixed
+            `parallel_count` semaphore.
+        skip_unchanged: Compare `git ls-remote` output with the local
+            remote-tracking refs first and skip the fetch of repos whose
+            remote is unchanged (reported as "up-to-date").
+        fetch_profiles: Repo name → fetch profile (see `FETCH_PROFILES`).
+            Repos not listed use "full".
+        deadline: Overall time budget in seconds. Repos still running
+            when it expires are cancelled (their git processes killed)
+            and reported as "timed_out"; finished repos keep their results.
+        prefetched: Repos with a recent `prefetch_repo` run. Their
+            remote-tracking refs are updated from `refs/prefetch/`
+            locally instead of fetching from the network.
+        fetch_baselines: Repo name → typical fetch duration in seconds.
+            With a limiter, a fetch much slower than its repo's baseline
+            counts as a congestion signal.
 
     Returns:
         List of SyncResult for each repo.
@@ -53,118 +127,441 @@ async def sync_repos(
     results: list[SyncResult] = []
 
     async def _sync_one(name: str, path: Path) -> SyncResult:
-        async with semaphore:
-            if on_progress:
-                on_progress(name, "syncing...")
-
-            # Check if dirty
-            if not force:
-                is_dirty = _check_dirty(path)
-                if is_dirty:
-                    if on_progress:
-                        on_progress(name, "skipped (dirty)")
-                    return SyncResult(
-                        name=name,
-                        success=True,
-                        action="skipped",
-                        message="Working tree has uncommitted changes",
-                    )
+        if on_progress:
+            on_progress(name, "syncing...")
 
-            # Fetch
-            try:
-                fetch_ok = await _run_git_async(
-                    ["git", "fetch", "--prune"], path, timeout
+        timings: dict[str, float] = {}
+
+        # Check if dirty
+        if not force:
+            dirty_started = time.monotonic()
+            is_dirty = await _check_dirty(path)
+            timings["dirty"] = time.monotonic() - dirty_started
+            if is_dirty:
+                if on_progress:
+                    on_progress(name, "skipped (dirty)")
+                return SyncResult(
+                    name=name,
+                    success=True,
+                    action="skipped",
+                    message="Working tree has uncommitted changes",
+                    timings=timings,
                 )
+
+        fetch_cmd, branch = _fetch_command(
+            path, (fetch_profiles or {}).get(name, "full")
+        )
+        refs_before = _tracking_refs(path)
+
+        # A recent background prefetch already has the objects; only the
+        # remote-tracking refs need to move
+        applied = False
+        if prefetched and name in prefetched:
+            apply_started = time.monotonic()
+            applied = await _apply_prefetched(path, branch=branch)
+            timings["prefetch"] = time.monotonic() - apply_started
+
+        # A remote whose branches all match our tracking refs has nothing
+        # to fetch; ls-remote skips fetch's negotiation round-trips
+        unchanged = False
+        if skip_unchanged and not applied:
+            check_started = time.monotonic()
+            unchanged = await _remote_unchanged(
+                path, branch=branch, tags="--no-tags" not in fetch_cmd
+            )
+            timings["ls-remote"] = time.monotonic() - check_started
+
+        if not unchanged and not applied:
+            fetch_started = time.monotonic()
+            try:
+                fetch_ok, transport_error = await _fetch_async(fetch_cmd, path, timeout)
+                timings["fetch"] = time.monotonic() - fetch_started
                 if not fetch_ok:
                     return SyncResult(
                         name=name,
                         success=False,
                         action="failed",
                         message="Fetch failed",
+                        timings=timings,
+                        congested=transport_error,
                     )
             except asyncio.TimeoutError:
+                timings["fetch"] = time.monotonic() - fetch_started
                 return SyncResult(
                     name=name,
                     success=False,
                     action="failed",
                     message=f"Fetch timed out after {timeout}s",
+                    timings=timings,
+                    congested=True,
                 )
 
-            # Get ahead/behind
-            ahead, behind = _get_ahead_behind(path)
+        # Get ahead/behind
+        rev_list_started = time.monotonic()
+        ahead, behind = await _get_ahead_behind(path)
+        timings["rev-list"] = time.monotonic() - rev_list_started
 
-            # Pull if requested
-            action = "fetched"
-            if pull and behind > 0:
-                try:
-                    pull_ok = await _run_git_async(
-                        ["git", "pull", "--ff-only"], path, timeout
-                    )
-                    action = "pulled" if pull_ok else "failed"
-                except asyncio.TimeoutError:
-                    action = "failed"
-
-            if on_progress:
-                on_progress(name, f"✓ {action}")
-
-            return SyncResult(
-                name=name,
-                success=True,
-                action=action,
-                ahead=ahead,
-                behind=behind,
+        # Pull if requested
+        action = "up-to-date" if unchanged else "fetched"
+        if pull and behind > 0:
+            pull_started = time.monotonic()
+            try:
+                pull_ok = await _run_git_async(
+                    ["git", "pull", "--ff-only"], path, timeout
+                )
+                action = "pulled" if pull_ok else "failed"
+            except asyncio.TimeoutError:
+                action = "failed"
+            timings["pull"] = time.monotonic() - pull_started
+
+        if on_progress:
+            on_progress(name, f"✓ {action}")
+
+        return SyncResult(
+            name=name,
+            success=True,
+            action=action,
+            ahead=ahead,
+            behind=behind,
+            timings=timings,
+            refs_moved=_tracking_refs(path) != refs_before,
+        )
+
+    async def _timed(name: str, path: Path) -> SyncResult:
+        started = time.monotonic()
+        result = await _sync_one(name, path)
+        result.timings["total"] = time.monotonic() - started
+        return result
+
+    async def _run(name: str, path: Path) -> SyncResult:
+        if limiter is None:
+            async with semaphore:
+                result = await _timed(name, path)
+        else:
+            slot = await limiter.acquire()
+            try:
+                result = await _timed(name, path)
+            except BaseException:
+                await limiter.release(slot, latency=None, ok=False)
+                raise
+            # Fetch latency and congestion drive the adaptive limit; other
+            # failures (auth, missing remote) say nothing about load
+            await limiter.release(
+                slot,
+                latency=result.timings.get("fetch") if result.success else None,
+                ok=not result.congested,
+                baseline=(fetch_baselines or {}).get(name),
             )
+        if on_result:
+            on_result(result)
+        return result
+
+    # Tasks copy the context when created
+    token = _OWN_PROCESS_GROUP.set(_POSIX and deadline is not None)
+    try:
+        tasks = [asyncio.create_task(_run(name, path)) for name, path in repos]
+    finally:
+        _OWN_PROCESS_GROUP.reset(token)
+    pending: set[asyncio.Task] = set()
+    try:
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=deadline)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning(
+            "Sync deadline of %ss hit, cancelling %d repos", deadline, len(pending)
+        )
+        await asyncio.gather(*pending, return_exceptions=True)
 
-    tasks = [_sync_one(name, path) for name, path in repos]
-    results = await asyncio.gather(*tasks)
+    results = []
+    for (name, _), task in zip(repos, tasks):
+        if not task.cancelled():
+            results.append(task.result())
+            continue
+        result = SyncResult(
+            name=name,
+            success=False,
+            action="timed_out",
+            message=f"Cancelled at the {deadline}s sync deadline",
+        )
+        if on_result:
+            on_result(result)
+        results.append(result)
+    if limiter is not None:
+        logger.info(
+            "Adaptive concurrency settled at %d (peak %d)", limiter.limit, limiter.peak
+        )
     return list(results)
 
 
-def _check_dirty(path: Path) -> bool:
+async def _check_dirty(path: Path) -> bool:
     """Check if repo has uncommitted changes."""
     try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=str(path),
-            capture_output=True,
-            text=True,
-            timeout=5,
+        returncode, stdout = await _git_output(
+            ["git", "status", "--porcelain"], path, timeout=5
+        )
+        return returncode == 0 and bool(stdout.strip())
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+
+def _fetch_command(
+    path: Path, profile: str, remote: str = "origin"
+) -> tuple[list[str], str | None]:
+    """Build the fetch command for a repo's fetch profile.
+
+    Profiles that can't apply to the repo (no known default branch, not a
+    partial clone) fall back to a full fetch.
+
+    Returns:
+        Tuple of (git command, the single branch fetched or None for all).
+    """
+    cmd = ["git", "fetch", "--prune"]
+    if profile == "no-tags":
+        return [*cmd, "--no-tags"], None
+
+    git_dir = git_refs.resolve_git_dir(path)
+    if profile == "default-branch" and git_dir is not None:
+        branch = git_refs.default_branch(git_dir, remote)
+        if branch:
+            refspec = f"+refs/heads/{branch}:refs/remotes/{remote}/{branch}"
+            return [*cmd, "--no-tags", remote, refspec], branch
+    if profile == "blobless" and git_dir is not None:
+        object_filter = git_refs.partial_clone_filter(git_dir, remote)
+        if object_filter:
+            return [*cmd, f"--filter={object_filter}"], None
+    if profile != "full":
+        logger.debug("Fetch profile %s doesn't apply to %s", profile, path.name)
+    return cmd, None
+
+
+async def prefetch_repo(
+    path: Path, profile: str = "full", timeout: float = 120, remote: str = "origin"
+) -> bool:
+    """Fetch a remote's branches into `refs/prefetch/` ahead of a sync.
+
+    Objects are downloaded but no remote-tracking ref, tag or FETCH_HEAD
+    is touched, so the working copy looks exactly as before. A
+    "default-branch" profile only prefetches that branch.
+
+    Returns:
+        True if the fetch succeeded.
+    """
+    _, branch = _fetch_command(path, profile, remote)
+    dest = f"{PREFETCH_PREFIX}{remote}/"
+    refspec = (
+        f"+refs/heads/{branch}:{dest}{branch}" if branch else f"+refs/heads/*:{dest}*"
+    )
+    cmd = [
+        "git",
+        "fetch",
+        remote,
+        "--prune",
+        "--no-tags",
+        "--no-write-fetch-head",
+        "--recurse-submodules=no",
+        "--refmap=",
+        refspec,
+    ]
+    try:
+        returncode, _ = await _git_output(cmd, path, timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    return returncode == 0
+
+
+async def _apply_prefetched(
+    path: Path, remote: str = "origin", branch: str | None = None
+) -> bool:
+    """Fast-forward remote-tracking refs to the commits under `refs/prefetch/`.
+
+    Each ref is only moved if it still points where it did when checked,
+    and only forward: if any tracking ref has moved past or away from its
+    prefetched commit (a fetch since the prefetch, a force-push), nothing
+    is applied. Refs are never deleted; the next real fetch prunes them.
+    Returns False when there is nothing prefetched or the update can't be
+    applied, so the caller can fetch normally.
+    """
+    git_dir = git_refs.resolve_git_dir(path)
+    if git_dir is None:
+        return False
+    source = f"{PREFETCH_PREFIX}{remote}/"
+    dest = f"refs/remotes/{remote}/"
+    wanted = {
+        dest + ref[len(source) :]: sha
+        for ref, sha in git_refs.list_refs(git_dir, source).items()
+    }
+    if branch:
+        wanted = {k: v for k, v in wanted.items() if k == dest + branch}
+    if not wanted:
+        return False
+    tracking = git_refs.list_refs(git_dir, dest)
+
+    commands = []
+    try:
+        for ref, sha in wanted.items():
+            old = tracking.get(ref)
+            if old == sha:
+                continue
+            if old is not None:
+                returncode, _ = await _git_output(
+                    ["git", "merge-base", "--is-ancestor", old, sha], path, timeout=10
+                )
+                if returncode != 0:
+                    return False
+            # An all-zero old value means the ref must not exist yet
+            commands.append(f"update {ref} {sha} {old or '0' * len(sha)}")
+        if not commands:
+            return True
+        returncode, _ = await _git_output(
+            ["git", "update-ref", "--stdin"],
+            path,
+            timeout=10,
+            input="".join(line + "\n" for line in commands),
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    return returncode == 0
+
+
+async def _remote_unchanged(
+    path: Path, remote: str = "origin", branch: str | None = None, tags: bool = True
+) -> bool:
+    """Check whether a remote's branches and tags match the local refs.
+
+    With `branch`, only that branch is compared, matching a fetch that is
+    limited to it. With `tags`, every remote tag must also exist locally
+    at the same object, since fetch follows new tags (local-only tags are
+    fine; fetch never deletes them). Any doubt (unreadable refs,
+    ls-remote failing or timing out) counts as changed so the caller
+    falls back to a real fetch.
+    """
+    git_dir = git_refs.resolve_git_dir(path)
+    if git_dir is None:
+        return False
+    try:
+        returncode, stdout = await _git_output(
+            ["git", "ls-remote", "--heads"]
+            + (["--tags"] if tags else [])
+            + [remote]
+            + ([f"refs/heads/{branch}"] if branch else []),
+            path,
+            timeout=30,
         )
-        return bool(result.stdout.strip())
-    except Exception:
+    except (OSError, asyncio.TimeoutError):
+        return False
+    if returncode != 0:
+        return False
+
+    remote_refs: dict[str, str] = {}
+    remote_tags: dict[str, str] = {}
+    for line in stdout.splitlines():
+        sha, _, ref = line.partition("\t")
+        if ref.startswith("refs/heads/"):
+            remote_refs[f"refs/remotes/{remote}/{ref[len('refs/heads/') :]}"] = sha
+        elif tags and ref.startswith("refs/tags/"):
+            # Peeled `tag^{}` lines repeat annotated tags; skip them
+            if not ref.endswith("^{}"):
+                remote_tags[ref] = sha
+        else:
+            return False
+    # Tracking refs of deleted branches count as a change too (--prune)
+    local_refs = git_refs.list_refs(git_dir, f"refs/remotes/{remote}/")
+    if branch:
+        tracking = f"refs/remotes/{remote}/{branch}"
+        local_refs = {k: v for k, v in local_refs.items() if k == tracking}
+    if remote_refs != local_refs:
         return False
+    local_tags = git_refs.list_refs(git_dir, "refs/tags/") if remote_tags else {}
+    return all(local_tags.get(ref) == sha for ref, sha in remote_tags.items())
 
 
-def _get_ahead_behind(path: Path) -> tuple[int, int]:
+async def _get_ahead_behind(path: Path) -> tuple[int, int]:
     """Get ahead/behind counts relative to tracking branch."""
+    # Identical tips need no history walk
+    git_dir = git_refs.resolve_git_dir(path)
+    if git_dir is not None:
+        branch = git_refs.current_branch(git_dir)
+        upstream = git_refs.upstream_ref(git_dir, branch) if branch else None
+        head = git_refs.resolve_ref(git_dir)
+        if upstream and head and head == git_refs.resolve_ref(git_dir, upstream):
+            return 0, 0
+
     try:
-        result = subprocess.run(
+        returncode, stdout = await _git_output(
             ["git", "rev-list", "--left-right", "--count", "HEAD...@{upstream}"],
-            cwd=str(path),
-            capture_output=True,
-            text=True,
+            path,
             timeout=5,
         )
-        if result.returncode == 0:
-            parts = result.stdout.strip().split()
+        if returncode == 0:
+            parts = stdout.strip().split()
             if len(parts) == 2:
                 return int(parts[0]), int(parts[1])
-    except Exception:
+    except (OSError, ValueError, asyncio.TimeoutError):
         pass
     return 0, 0
 
 
+def _tracking_refs(path: Path) -> dict[str, str]:
+    """Remote-tracking ref name → SHA, read without spawning git."""
+    git_dir = git_refs.resolve_git_dir(path)
+    return git_refs.list_refs(git_dir, "refs/remotes/") if git_dir else {}
+
+
 async def _run_git_async(cmd: list[str], cwd: Path, timeout: int) -> bool:
     """Run a git command asynchronously."""
-    process = await asyncio.create_subprocess_exec(
-        *cmd,
-        cwd=str(cwd),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+    returncode, _ = await _git_output(cmd, cwd, timeout)
+    return returncode == 0
+
+
+async def _fetch_async(cmd: list[str], cwd: Path, timeout: int) -> tuple[bool, bool]:
+    """Run a fetch, telling transport failures apart from other errors.
+
+    Returns:
+        Tuple of (success, whether a failure was a transport error).
+    """
+    returncode, _, stderr = await _git_communicate(cmd, cwd, timeout)
+    if returncode == 0:
+        return True, False
+    return False, _is_transport_error(stderr)
+
+
+def _is_transport_error(stderr: str) -> bool:
+    """Whether git's stderr reports a network problem, not e.g. bad auth."""
+    lowered = stderr.lower()
+    return any(marker in lowered for marker in _TRANSPORT_ERRORS)
+
+
+async def _git_output(
+    cmd: list[str], cwd: Path, timeout: float, input: str | None = None
+) -> tuple[int, str]:
+    """Run a command without blocking the event loop.
+
+    See `_git_communicate`, which this wraps.
+
+    Returns:
+        Tuple of (return code, decoded stdout).
+    """
+    returncode, stdout, _ = await _git_communicate(cmd, cwd, timeout, input)
+    return returncode, stdout
+
+
+async def _git_communicate(
+    cmd: list[str], cwd: Path, timeout: float, input: str | None = None
+) -> tuple[int, str, str]:
+    """Run a command with `git_exec.communicate`.
+
+    Git gets its own process group while a sync deadline is active.
+
+    Returns:
+        Tuple of (return code, decoded stdout, decoded stderr).
+    """
+    return await git_exec.communicate(
+        cmd, cwd, timeout, input, own_group=_OWN_PROCESS_GROUP.get()
     )
-    try:
-        await asyncio.wait_for(process.communicate(), timeout=timeout)
-        return process.returncode == 0
-    except asyncio.TimeoutError:
-        process.kill()
-        raise
@@ -8,8 +8,14 @@ from __future__ import annotations
 
 import dataclasses
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 
+from vindicta_cli.lib import git_refs
+from vindicta_cli.lib.git_exec import run_git
+from vindicta_cli.lib.git_status import STATUS_ARGS, parse_porcelain_v2
 from vindicta_cli.lib.logger import get_logger
 from vindicta_cli.lib.registry import filter_by_name, filter_by_tier, get_registry
 from vindicta_cli.models.repo_info import RepoEntry, RepoInfo
@@ -19,6 +25,9 @@ logger = get_logger("workspace")
 
 CONFIG_FILENAME = ".vindicta-workspace.yml"
 
+# Default time budget (seconds) for reading one repo's git state
+REPO_DEADLINE = 10.0
+
 
 def discover_workspace_root(start: Path | None = None) -> Path | None:
     """Walk up from start to find a directory containing config file.
@@ -95,7 +104,7 @@ def scan_repos(
     result = []
     for repo in repos:
         local_dir = workspace_root / repo.name
-        if local_dir.exists() and (local_dir / ".git").exists():
+        if git_refs.resolve_git_dir(local_dir) is not None:
             result.append(dataclasses.replace(repo, present=True, local_path=local_dir))
         else:
             result.append(dataclasses.replace(repo))
@@ -103,15 +112,71 @@ def scan_repos(
     return result
 
 
-def get_repo_info(repo_path: Path, entry: RepoEntry) -> RepoInfo:
+def collect_repo_infos(
+    entries: list[RepoEntry],
+    parallel_count: int = 4,
+    deadline: float = REPO_DEADLINE,
+    on_result: Callable[[RepoInfo], None] | None = None,
+) -> list[RepoInfo]:
+    """Gather git state for many repositories concurrently.
+
+    Git calls are I/O bound, so repos are fanned out over a thread pool.
+
+    Args:
+        entries: Present registry entries (with `local_path` set).
+        parallel_count: Max repos inspected at once.
+        deadline: Time budget in seconds for each repo.
+        on_result: Called with each RepoInfo as soon as it completes, in
+            completion order, from the calling thread. Streamed results
+            are not kept.
+
+    Returns:
+        RepoInfo list in the same order as `entries`, or an empty list
+        when `on_result` is set.
+
+    Raises:
+        ValueError: If an entry has no `local_path`.
+    """
+    if not entries:
+        return []
+    checked_out = [(e, e.local_path) for e in entries if e.local_path is not None]
+    if len(checked_out) != len(entries):
+        raise ValueError("collect_repo_infos needs entries with a local_path")
+
+    workers = max(1, min(parallel_count, len(entries)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        if not on_result:
+            futures = [
+                pool.submit(get_repo_info, path, entry, deadline)
+                for entry, path in checked_out
+            ]
+            return [future.result() for future in futures]
+        # as_completed drops each future once yielded, so streamed
+        # results are released as soon as the callback returns
+        for future in as_completed(
+            pool.submit(get_repo_info, path, entry, deadline)
+            for entry, path in checked_out
+        ):
+            on_result(future.result())
+        return []
+
+
+def get_repo_info(
+    repo_path: Path,
+    entry: RepoEntry,
+    deadline: float = REPO_DEADLINE,
+) -> RepoInfo:
     """Gather git state information for a checked-out repository.
 
     Args:
         repo_path: Path to the repository.
         entry: Registry entry for the repo.
+        deadline: Time budget in seconds shared by all git calls for
+            this repo. Whatever is left when it expires keeps defaults.
 
     Returns:
-        RepoInfo with populated git fields.
+        RepoInfo with populated git fields. Ahead/behind counts are
+        relative to the branch's configured upstream (0/0 without one).
     """
     info = RepoInfo(
         name=entry.name,
@@ -119,53 +184,44 @@ def get_repo_info(repo_path: Path, entry: RepoEntry) -> RepoInfo:
         repo_type=entry.repo_type,
         local_path=repo_path,
     )
+    expires = time.monotonic() + deadline
+
+    # Refs are read in-process so branch and HEAD survive a git timeout
+    git_dir = git_refs.resolve_git_dir(repo_path)
+    if git_dir is not None:
+        info.current_branch = git_refs.current_branch(git_dir) or "HEAD"
+        info.default_branch = git_refs.default_branch(git_dir) or info.default_branch
+        info.last_commit_hash = git_refs.resolve_ref(git_dir) or ""
 
     try:
-        # Current branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info.current_branch = result.stdout.strip()
-
-        # Dirty check
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            changed = [line for line in result.stdout.strip().split("\n") if line]
-            info.is_dirty = len(changed) > 0
-            info.uncommitted_files = changed
-
-        # Ahead/behind main
-        result = subprocess.run(
-            [
-                "git",
-                "rev-list",
-                "--left-right",
-                "--count",
-                f"HEAD...origin/{info.default_branch}",
-            ],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        result = _run_git(STATUS_ARGS, repo_path, expires)
         if result.returncode == 0:
-            parts = result.stdout.strip().split()
-            if len(parts) == 2:
-                info.ahead = int(parts[0])
-                info.behind = int(parts[1])
-
-    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
+            status = parse_porcelain_v2(result.stdout)
+            # Detached HEAD reports "HEAD", matching `rev-parse --abbrev-ref`
+            info.current_branch = status.branch or "HEAD"
+            info.upstream = status.upstream
+            info.is_dirty = status.is_dirty
+            info.uncommitted_files = status.paths
+            info.staged_count = status.staged
+            info.unstaged_count = status.unstaged
+            info.untracked_count = status.untracked
+            info.conflict_count = status.conflicts
+            info.last_commit_hash = status.oid or info.last_commit_hash
+            if status.upstream:
+                info.ahead = status.ahead
+                info.behind = status.behind
+
+    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError, IndexError):
         logger.warning("Failed to read git state for %s", entry.name)
 
     return info
+
+
+def _run_git(
+    args: list[str], repo_path: Path, expires: float
+) -> subprocess.CompletedProcess:
+    """Run a git command with whatever remains of the repo's deadline."""
+    remaining = expires - time.monotonic()
+    if remaining <= 0:
+        raise subprocess.TimeoutExpired(["git", *args], 0)
+    return run_git(args, repo_path, remaining)
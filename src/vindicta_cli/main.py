@@ -2,20 +2,35 @@
 
 Registers all domain sub-applications (dev, dice, match, etc.)
 following the `vindicta [domain] [action]` naming convention.
+
+Command modules are registered lazily so that only the module for the
+invoked command (and its dependencies) is imported.
 """
 
 from __future__ import annotations
 
 import typer
 
-from vindicta_cli.cli.dev.clean_cmd import clean_cmd
-from vindicta_cli.cli.dev.config_cmd import config_app
-from vindicta_cli.cli.dev.doctor_cmd import doctor_cmd
-from vindicta_cli.cli.dev.init_cmd import init_cmd
-from vindicta_cli.cli.dev.setup_cmd import setup_cmd
-from vindicta_cli.cli.dev.status_cmd import status_cmd
-from vindicta_cli.cli.dev.sync_cmd import sync_cmd
-from vindicta_cli.cli.dev.validate_cmd import validate_cmd
+from vindicta_cli.cli.lazy import LazyTyperGroup
+
+
+class DevGroup(LazyTyperGroup):
+    """`vindicta dev` commands, imported on demand."""
+
+    lazy_commands = {
+        "init": "vindicta_cli.cli.dev.init_cmd:init_cmd",
+        "sync": "vindicta_cli.cli.dev.sync_cmd:sync_cmd",
+        "setup": "vindicta_cli.cli.dev.setup_cmd:setup_cmd",
+        "status": "vindicta_cli.cli.dev.status_cmd:status_cmd",
+        "validate": "vindicta_cli.cli.dev.validate_cmd:validate_cmd",
+        "doctor": "vindicta_cli.cli.dev.doctor_cmd:doctor_cmd",
+        "clean": "vindicta_cli.cli.dev.clean_cmd:clean_cmd",
+        "optimize": "vindicta_cli.cli.dev.optimize_cmd:optimize_cmd",
+        "bundle": "vindicta_cli.cli.dev.bundle_cmd:bundle_cmd",
+        "config": "vindicta_cli.cli.dev.config_cmd:config_app",
+        "daemon": "vindicta_cli.cli.dev.daemon_cmd:daemon_app",
+    }
+
 
 # Root application
 app = typer.Typer(
@@ -29,18 +44,9 @@ dev_app = typer.Typer(
     name="dev",
     help="Developer commands for platform workspace management.",
     no_args_is_help=True,
+    cls=DevGroup,
 )
 
-# Register dev commands
-dev_app.command("init")(init_cmd)
-dev_app.command("sync")(sync_cmd)
-dev_app.command("setup")(setup_cmd)
-dev_app.command("status")(status_cmd)
-dev_app.command("validate")(validate_cmd)
-dev_app.command("doctor")(doctor_cmd)
-dev_app.command("clean")(clean_cmd)
-dev_app.add_typer(config_app, name="config")
-
 # Register dev sub-app on root
 app.add_typer(dev_app, name="dev")
 
@@ -6,8 +6,9 @@ RepoInfo: Runtime state of a repository in the workspace.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
 
 VALID_TIERS = {"P0", "P1", "P2", "P3"}
 VALID_REPO_TYPES = {"python", "nodejs", "mixed"}
@@ -36,6 +37,12 @@ class RepoEntry:
                 f"Must be one of: {VALID_REPO_TYPES}"
             )
 
+    @property
+    def slug(self) -> str:
+        """GitHub `owner/name` derived from `github_url`."""
+        path = self.github_url.removeprefix("https://github.com/").strip("/")
+        return path.removesuffix(".git")
+
 
 @dataclass
 class RepoInfo:
@@ -50,9 +57,14 @@ class RepoInfo:
     # Git State
     current_branch: str = "main"
     default_branch: str = "main"
+    upstream: str | None = None
     is_dirty: bool = False
     ahead: int = 0
     behind: int = 0
+    staged_count: int = 0
+    unstaged_count: int = 0
+    untracked_count: int = 0
+    conflict_count: int = 0
     uncommitted_files: list[str] = field(default_factory=list)
 
     # Remote State
@@ -66,3 +78,16 @@ class RepoInfo:
     def is_on_default(self) -> bool:
         """Check if repository is on the default branch."""
         return self.current_branch == self.default_branch
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        data = asdict(self)
+        data["local_path"] = str(self.local_path)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RepoInfo:
+        """Deserialize from a dict produced by `to_dict`."""
+        fields = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        fields["local_path"] = Path(fields["local_path"])
+        return cls(**fields)
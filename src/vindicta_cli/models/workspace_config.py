@@ -10,7 +10,14 @@ from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
+# How `vindicta dev sync` fetches: every ref, no tags, only the default
+# branch, or a blob-filtered fetch for partial clones
+FETCH_PROFILES = ("full", "no-tags", "default-branch", "blobless")
+
+# How `vindicta dev init` clones: full history, a blobless partial clone
+# (blobs fetched on checkout), only the default branch, or a shallow
+# `clone_depth`-commit clone of the default branch
+CLONE_MODES = ("full", "blobless", "single-branch", "shallow")
 
 
 @dataclass
@@ -28,6 +35,17 @@ class WorkspaceConfig:
     parallel_count: int = 4
     auto_pull: bool = False
     sync_timeout: int = 120
+    fetch_profile: str = "full"
+    prefetch_max_age: int = 3600
+    prefetch_interval: int = 0
+
+    # Clone Preferences
+    clone_mode: str = "full"
+    clone_depth: int = 1
+    # Tier → clone mode; P3 tooling repos are rarely worked on
+    tier_clone_modes: dict[str, str] = field(default_factory=lambda: {"P3": "shallow"})
+    # Clone through the user-level mirror store shared by all workspaces
+    mirror_cache: bool = False
 
     # Validation Preferences
     auto_fix: bool = False
@@ -38,6 +56,10 @@ class WorkspaceConfig:
     install_hooks: bool = True
     create_venvs: bool = True
 
+    # Status Preferences
+    status_cache_ttl: int = 300
+    remote_cache_ttl: int = 300
+
     # Global
     default_tier: str | None = None
     verbose: bool = False
@@ -49,15 +71,80 @@ class WorkspaceConfig:
             raise ValueError(f"parallel_count must be 1-16, got {self.parallel_count}")
         if not (10 <= self.sync_timeout <= 600):
             raise ValueError(f"sync_timeout must be 10-600, got {self.sync_timeout}")
+        if self.fetch_profile not in FETCH_PROFILES:
+            raise ValueError(
+                f"fetch_profile must be one of {FETCH_PROFILES}, "
+                f"got {self.fetch_profile!r}"
+            )
+        for repo in self.repositories:
+            profile = repo.get("fetch_profile")
+            if profile is not None and profile not in FETCH_PROFILES:
+                raise ValueError(
+                    f"fetch_profile of {repo.get('name')!r} must be one of "
+                    f"{FETCH_PROFILES}, got {profile!r}"
+                )
+        if self.clone_mode not in CLONE_MODES:
+            raise ValueError(
+                f"clone_mode must be one of {CLONE_MODES}, got {self.clone_mode!r}"
+            )
+        for tier, mode in self.tier_clone_modes.items():
+            if mode not in CLONE_MODES:
+                raise ValueError(
+                    f"clone mode of tier {tier} must be one of {CLONE_MODES}, "
+                    f"got {mode!r}"
+                )
+        for repo in self.repositories:
+            repo_mode = repo.get("clone_mode")
+            if repo_mode is not None and repo_mode not in CLONE_MODES:
+                raise ValueError(
+                    f"clone_mode of {repo.get('name')!r} must be one of "
+                    f"{CLONE_MODES}, got {repo_mode!r}"
+                )
+        if self.clone_depth < 1:
+            raise ValueError(f"clone_depth must be >= 1, got {self.clone_depth}")
+        if not (0 <= self.prefetch_max_age <= 86400):
+            raise ValueError(
+                f"prefetch_max_age must be 0-86400, got {self.prefetch_max_age}"
+            )
+        if not (0 <= self.prefetch_interval <= 86400):
+            raise ValueError(
+                f"prefetch_interval must be 0-86400, got {self.prefetch_interval}"
+            )
+        if not (0 <= self.status_cache_ttl <= 86400):
+            raise ValueError(
+                f"status_cache_ttl must be 0-86400, got {self.status_cache_ttl}"
+            )
+        if not (0 <= self.remote_cache_ttl <= 86400):
+            raise ValueError(
+                f"remote_cache_ttl must be 0-86400, got {self.remote_cache_ttl}"
+            )
+
+    def fetch_profile_for(self, name: str) -> str:
+        """Return a repo's fetch profile, from `repositories` or the default."""
+        for repo in self.repositories:
+            if repo.get("name") == name and repo.get("fetch_profile"):
+                return repo["fetch_profile"]
+        return self.fetch_profile
+
+    def clone_mode_for(self, name: str, tier: str) -> str:
+        """Return a repo's clone mode: per repo, then per tier, then default."""
+        for repo in self.repositories:
+            if repo.get("name") == name and repo.get("clone_mode"):
+                return repo["clone_mode"]
+        return self.tier_clone_modes.get(tier, self.clone_mode)
 
     def to_yaml(self) -> str:
         """Serialize configuration to YAML string."""
+        import yaml
+
         data = asdict(self)
         return yaml.dump(data, default_flow_style=False, sort_keys=False)
 
     @classmethod
     def from_yaml(cls, yaml_str: str) -> WorkspaceConfig:
         """Deserialize configuration from YAML string."""
+        import yaml
+
         data = yaml.safe_load(yaml_str) or {}
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
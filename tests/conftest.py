@@ -2,10 +2,36 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
 
+GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def git(*args: str, cwd: Path) -> str:
+    """Run a git command for test setup and return its stdout."""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=str(cwd),
+        env=GIT_ENV,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
 
 @pytest.fixture
 def tmp_workspace(tmp_path: Path) -> Path:
@@ -45,3 +71,26 @@ def vindicta_logs_dir(tmp_path: Path) -> Path:
     logs_dir = tmp_path / ".vindicta" / "logs"
     logs_dir.mkdir(parents=True)
     return logs_dir
+
+
+@pytest.fixture
+def git_remote(tmp_path: Path) -> Path:
+    """Create a bare repository with one commit on main, acting as origin."""
+    seed = tmp_path / "seed"
+    seed.mkdir()
+    git("init", "-q", "-b", "main", cwd=seed)
+    (seed / "README.md").write_text("# seed\n")
+    git("add", ".", cwd=seed)
+    git("commit", "-q", "-m", "initial", cwd=seed)
+
+    remote = tmp_path / "remote.git"
+    git("clone", "-q", "--bare", str(seed), str(remote), cwd=tmp_path)
+    return remote
+
+
+@pytest.fixture
+def git_clone(tmp_path: Path, git_remote: Path) -> Path:
+    """Create a working clone of `git_remote` tracking origin/main."""
+    clone = tmp_path / "clone"
+    git("clone", "-q", str(git_remote), str(clone), cwd=tmp_path)
+    return clone
@@ -7,6 +7,7 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
 from vindicta_cli.main import app
@@ -63,6 +64,16 @@ class TestCliHelpContract:
         assert result.exit_code == 0
         assert "--dry-run" in result.output
 
+    def test_dev_optimize_help(self):
+        result = runner.invoke(app, ["dev", "optimize", "--help"])
+        assert result.exit_code == 0
+        assert "--parallel" in result.output
+
+    def test_dev_bundle_help(self):
+        result = runner.invoke(app, ["dev", "bundle", "--help"])
+        assert result.exit_code == 0
+        assert "--incremental" in result.output
+
     def test_dev_config_help(self):
         result = runner.invoke(app, ["dev", "config", "--help"])
         assert result.exit_code == 0
@@ -141,7 +152,52 @@ class TestCliJsonOutput:
         assert "checks" in data
         assert isinstance(data["checks"], list)
 
-    def test_config_list_json_output(self):
+    def test_sync_adaptive_json_stays_a_list(self, tmp_path: Path, monkeypatch):
+        from vindicta_cli.lib.sync_service import SyncResult
+        from vindicta_cli.lib.workspace import CONFIG_FILENAME
+
+        (tmp_path / CONFIG_FILENAME).write_text("schema_version: '1.0.0'\n")
+        (tmp_path / "Vindicta-Core" / ".git").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+
+        async def _sync(**kwargs):
+            return [SyncResult("Vindicta-Core", True, "up-to-date")]
+
+        with patch("vindicta_cli.cli.dev.sync_cmd.sync_repos", side_effect=_sync):
+            result = runner.invoke(app, ["dev", "sync", "--adaptive", "--json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert [r["name"] for r in data] == ["Vindicta-Core"]
+        assert "Adaptive concurrency settled" in result.stderr
+
+    def test_sync_background_forwards_options(self, tmp_path: Path, monkeypatch):
+        from vindicta_cli.lib.workspace import CONFIG_FILENAME
+
+        (tmp_path / CONFIG_FILENAME).write_text("schema_version: '1.0.0'\n")
+        (tmp_path / "Vindicta-Core" / ".git").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+
+        with patch("vindicta_cli.cli.dev.sync_cmd.subprocess.Popen") as mock_popen:
+            mock_popen.return_value.pid = 42
+            result = runner.invoke(
+                app,
+                ["dev", "sync", "--background", "-p", "2", "-t", "P0"]
+                + ["--deadline", "30", "--json"],
+            )
+
+        assert result.exit_code == 0
+        args = mock_popen.call_args.args[0]
+        assert args[args.index("sync") + 1 :] == [
+            "--prefetch",
+            "--parallel",
+            "2",
+            "-t",
+            "P0",
+            "--deadline",
+            "30.0",
+        ]
+
         """Config list --json produces valid JSON with all keys."""
         with patch(
             "vindicta_cli.cli.dev.config_cmd.discover_workspace_root",
@@ -153,3 +209,47 @@ class TestCliJsonOutput:
         data = json.loads(result.output)
         assert "parallel_count" in data
         assert "auto_pull" in data
+
+
+class TestCliNdjsonOutput:
+    """Tests that --ndjson streams one JSON object per repo."""
+
+    def test_validate_ndjson_one_line_per_repo(self, tmp_path: Path, monkeypatch):
+        from vindicta_cli.lib.workspace import CONFIG_FILENAME
+
+        (tmp_path / CONFIG_FILENAME).write_text("schema_version: '1.0.0'\n")
+        for name in ("Vindicta-Core", "Vindicta-API"):
+            (tmp_path / name / ".git").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["dev", "validate", "--ndjson"])
+
+        lines = result.output.strip().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert [r["repo"] for r in records] == ["Vindicta-Core", "Vindicta-API"]
+        assert all("compliance_score" in r for r in records)
+
+    def test_clean_ndjson_records_carry_dry_run(self, tmp_path: Path, monkeypatch):
+        from vindicta_cli.lib.workspace import CONFIG_FILENAME
+
+        (tmp_path / CONFIG_FILENAME).write_text("schema_version: '1.0.0'\n")
+        (tmp_path / "Vindicta-Core" / ".git").mkdir(parents=True)
+        (tmp_path / "Vindicta-Core" / "__pycache__").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["dev", "clean", "--dry-run", "--ndjson"])
+
+        assert result.exit_code == 0
+        (record,) = [json.loads(line) for line in result.output.splitlines()]
+        assert record["name"] == "Vindicta-Core"
+        assert record["dry_run"] is True
+        assert record["items_found"] >= 1
+
+    @pytest.mark.parametrize("command", ["status", "sync", "validate", "clean"])
+    def test_json_and_ndjson_rejected(self, tmp_path: Path, monkeypatch, command):
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["dev", command, "--json", "--ndjson"])
+
+        assert result.exit_code == 2
+        assert "cannot be combined" in result.output
@@ -37,7 +37,9 @@ class TestSyncWorkflowIntegration:
 
         with (
             patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
-            patch("vindicta_cli.lib.sync_service._run_git_async", return_value=True),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async", return_value=(True, False)
+            ),
             patch(
                 "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(1, 2)
             ),
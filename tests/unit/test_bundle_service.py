@@ -0,0 +1,175 @@
+"""Unit tests for the bundle service.
+
+Tests for full and incremental bundles, the manifest, and creating
+repos from bundle chains against real repositories.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tests.conftest import git, requires_git
+from vindicta_cli.lib.bundle_service import (
+    bundle_repo,
+    bundle_repos,
+    clone_from_bundles,
+    load_manifest,
+)
+from vindicta_cli.lib.repository import clone_repos
+from vindicta_cli.models.repo_info import RepoEntry
+
+
+def _advance_remote(tmp_path: Path, git_remote: Path, clone: Path) -> str:
+    """Push a new commit to the remote, fetch it into `clone`, return its SHA."""
+    pusher = tmp_path / "pusher"
+    if not pusher.exists():
+        git("clone", "-q", str(git_remote), str(pusher), cwd=tmp_path)
+    git("pull", "-q", cwd=pusher)
+    n = len(list(pusher.glob("*.txt")))
+    (pusher / f"file{n}.txt").write_text(f"{n}\n")
+    git("add", ".", cwd=pusher)
+    git("commit", "-q", "-m", f"commit {n}", cwd=pusher)
+    git("push", "-q", "origin", "main", cwd=pusher)
+    git("fetch", "-q", cwd=clone)
+    return git("rev-parse", "HEAD", cwd=pusher)
+
+
+@requires_git
+class TestBundleRepos:
+    """Tests for writing bundles and the manifest."""
+
+    def test_full_bundle(self, tmp_path: Path, git_clone: Path):
+        out = tmp_path / "bundles"
+        [result] = bundle_repos([("Vindicta-Core", git_clone)], out)
+
+        assert result.success and result.action == "full"
+        assert result.file == "Vindicta-Core.bundle"
+        assert result.size > 0
+        entry = load_manifest(out)["Vindicta-Core"]
+        assert entry["default_branch"] == "main"
+        assert list(entry["bundles"][0]["refs"]) == ["refs/remotes/origin/main"]
+        git("bundle", "verify", "-q", str(out / "Vindicta-Core.bundle"), cwd=git_clone)
+
+    def test_incremental_chain(self, tmp_path: Path, git_remote: Path, git_clone: Path):
+        out = tmp_path / "bundles"
+        repos = [("Vindicta-Core", git_clone)]
+        bundle_repos(repos, out)
+
+        [unchanged] = bundle_repos(repos, out, incremental=True)
+        assert unchanged.action == "up-to-date"
+
+        _advance_remote(tmp_path, git_remote, git_clone)
+        [result] = bundle_repos(repos, out, incremental=True)
+
+        assert result.action == "incremental"
+        assert result.file == "Vindicta-Core.1.bundle"
+        assert len(load_manifest(out)["Vindicta-Core"]["bundles"]) == 2
+        heads = git(
+            "bundle", "list-heads", str(out / "Vindicta-Core.1.bundle"), cwd=git_clone
+        )
+        assert "refs/remotes/origin/main" in heads
+
+    def test_full_bundle_replaces_chain(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        out = tmp_path / "bundles"
+        bundle_repos([("Vindicta-Core", git_clone)], out)
+        _advance_remote(tmp_path, git_remote, git_clone)
+        bundle_repos([("Vindicta-Core", git_clone)], out, incremental=True)
+
+        bundle_repos([("Vindicta-Core", git_clone)], out)
+
+        assert len(load_manifest(out)["Vindicta-Core"]["bundles"]) == 1
+        assert not (out / "Vindicta-Core.1.bundle").exists()
+
+    def test_not_a_repository(self, tmp_path: Path):
+        result, entry = bundle_repo(tmp_path, "nope", tmp_path)
+        assert not result.success
+        assert entry is None
+
+    def test_shallow_clone_refused(self, tmp_path: Path, git_remote: Path):
+        shallow = tmp_path / "shallow"
+        git(
+            "clone",
+            "-q",
+            "--depth",
+            "1",
+            f"file://{git_remote}",
+            str(shallow),
+            cwd=tmp_path,
+        )
+
+        result, entry = bundle_repo(shallow, "Vindicta-Core", tmp_path / "out")
+
+        assert not result.success
+        assert "Shallow clone" in result.message
+        assert entry is None
+
+    def test_partial_clone_refused(self, tmp_path: Path, git_clone: Path):
+        git("config", "remote.origin.promisor", "true", cwd=git_clone)
+
+        result, entry = bundle_repo(git_clone, "Vindicta-Core", tmp_path / "out")
+
+        assert not result.success
+        assert "Partial clone" in result.message
+        assert entry is None
+
+    def test_failure_keeps_manifest(self, tmp_path: Path, git_clone: Path):
+        out = tmp_path / "bundles"
+        results = bundle_repos(
+            [("Vindicta-Core", git_clone), ("Missing", tmp_path / "missing")], out
+        )
+        assert [r.success for r in results] == [True, False]
+        assert list(load_manifest(out)) == ["Vindicta-Core"]
+
+
+@requires_git
+class TestCloneFromBundles:
+    """Tests for seeding repos from bundles."""
+
+    def test_chain_recreates_repo(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        out = tmp_path / "bundles"
+        bundle_repos([("Vindicta-Core", git_clone)], out)
+        sha = _advance_remote(tmp_path, git_remote, git_clone)
+        bundle_repos([("Vindicta-Core", git_clone)], out, incremental=True)
+
+        target = tmp_path / "ws" / "Vindicta-Core"
+        clone_from_bundles(out, "Vindicta-Core", target, "https://example.com/x")
+
+        assert git("rev-parse", "HEAD", cwd=target) == sha
+        assert git("rev-parse", "--abbrev-ref", "HEAD", cwd=target) == "main"
+        assert git("remote", "get-url", "origin", cwd=target) == "https://example.com/x"
+        assert git("symbolic-ref", "refs/remotes/origin/HEAD", cwd=target) == (
+            "refs/remotes/origin/main"
+        )
+        assert (target / "README.md").exists()
+
+    def test_missing_repo(self, tmp_path: Path):
+        with pytest.raises(LookupError):
+            clone_from_bundles(tmp_path, "Vindicta-Core", tmp_path / "t", "url")
+
+    def test_clone_repos_uses_bundles(self, tmp_path: Path, git_clone: Path):
+        out = tmp_path / "bundles"
+        bundle_repos([("Vindicta-Core", git_clone)], out)
+        entry = RepoEntry(
+            name="Vindicta-Core",
+            tier="P0",
+            repo_type="python",
+            github_url="https://github.com/vindicta-platform/Vindicta-Core",
+        )
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+
+        with patch("vindicta_cli.lib.repository.GhClient") as mock_gh_cls:
+            mock_gh_cls.return_value.clone_repo = AsyncMock(return_value=True)
+            results = asyncio.run(clone_repos([entry], workspace, bundle_dir=out))
+
+        assert results == {"Vindicta-Core": True}
+        mock_gh_cls.return_value.clone_repo.assert_not_called()
+        assert (workspace / "Vindicta-Core" / "README.md").exists()
@@ -0,0 +1,214 @@
+"""Unit tests for the adaptive concurrency limiter."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from vindicta_cli.lib.concurrency import AdaptiveLimiter
+from vindicta_cli.lib.sync_service import sync_repos
+
+
+async def _complete(
+    limiter: AdaptiveLimiter,
+    latency: float,
+    ok: bool = True,
+    baseline: float | None = None,
+):
+    slot = await limiter.acquire()
+    await limiter.release(slot, latency=latency, ok=ok, baseline=baseline)
+
+
+class TestAdaptiveLimiter:
+    """Tests for AIMD limit changes."""
+
+    def test_rejects_bad_bounds(self):
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial=8, maximum=4)
+
+    def test_grows_while_latency_is_flat(self):
+        limiter = AdaptiveLimiter(initial=2, maximum=16)
+
+        async def _run():
+            for _ in range(5):
+                await _complete(limiter, 1.0)
+
+        asyncio.run(_run())
+        assert limiter.limit == 7
+
+    def test_never_exceeds_maximum(self):
+        limiter = AdaptiveLimiter(initial=2, maximum=4)
+
+        async def _run():
+            for _ in range(10):
+                await _complete(limiter, 1.0)
+
+        asyncio.run(_run())
+        assert limiter.limit == 4
+        assert limiter.peak == 4
+
+    def test_error_halves_limit(self):
+        limiter = AdaptiveLimiter(initial=8, maximum=16)
+        asyncio.run(_complete(limiter, 1.0, ok=False))
+        assert limiter.limit == 4
+
+    def test_latency_spike_backs_off(self):
+        limiter = AdaptiveLimiter(initial=8, maximum=16)
+
+        async def _run():
+            await _complete(limiter, 1.0, baseline=1.0)
+            await _complete(limiter, 10.0, baseline=1.0)
+
+        asyncio.run(_run())
+        assert limiter.limit == 4
+        assert limiter.peak == 9
+
+    def test_slow_repo_judged_against_its_own_baseline(self):
+        """A big repo that is always slow is not a spike."""
+        limiter = AdaptiveLimiter(initial=8, maximum=16)
+
+        async def _run():
+            await _complete(limiter, 0.1, baseline=0.1)
+            await _complete(limiter, 30.0, baseline=25.0)
+            await _complete(limiter, 0.2)
+
+        asyncio.run(_run())
+        assert limiter.limit == 11
+
+    def test_additive_increase_after_backoff(self):
+        limiter = AdaptiveLimiter(initial=8, maximum=16)
+
+        async def _run():
+            await _complete(limiter, 1.0, ok=False)
+            for _ in range(4):
+                await _complete(limiter, 1.0)
+
+        asyncio.run(_run())
+        # Out of slow start: four successes at limit 4 add about one
+        assert limiter.limit in (4, 5)
+        assert limiter.limit < 8
+
+    def test_burst_of_failures_counts_once(self):
+        limiter = AdaptiveLimiter(initial=8, maximum=16)
+
+        async def _run():
+            slots = [await limiter.acquire() for _ in range(4)]
+            for slot in slots:
+                await limiter.release(slot, latency=1.0, ok=False)
+
+        asyncio.run(_run())
+        assert limiter.limit == 4
+
+    def test_never_below_minimum(self):
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=4)
+
+        async def _run():
+            for _ in range(5):
+                await _complete(limiter, 1.0, ok=False)
+
+        asyncio.run(_run())
+        assert limiter.limit == 1
+
+    def test_bounds_in_flight_tasks(self):
+        limiter = AdaptiveLimiter(initial=2, maximum=2)
+        running = 0
+        highest = 0
+
+        async def _task():
+            nonlocal running, highest
+            slot = await limiter.acquire()
+            running += 1
+            highest = max(highest, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            await limiter.release(slot, latency=0.01)
+
+        async def _run():
+            await asyncio.gather(*(_task() for _ in range(6)))
+
+        asyncio.run(_run())
+        assert highest == 2
+
+
+class TestSyncWithLimiter:
+    """sync_repos feeds fetch outcomes into the limiter."""
+
+    def test_non_transport_failures_keep_limit(self, tmp_path):
+        """Bad credentials or a missing remote say nothing about load."""
+        repos = [(f"Repo{i}", tmp_path / f"Repo{i}") for i in range(3)]
+        limiter = AdaptiveLimiter(initial=4, maximum=16)
+
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async",
+                return_value=(False, False),
+            ),
+        ):
+            results = asyncio.run(sync_repos(repos, limiter=limiter))
+
+        assert all(r.action == "failed" for r in results)
+        assert limiter.limit == 4
+
+    def test_slow_fetch_compared_with_repo_baseline(self, tmp_path):
+        repos = [("Repo", tmp_path / "Repo")]
+        limiter = AdaptiveLimiter(initial=4, maximum=16)
+
+        async def _slow_fetch(*args):
+            await asyncio.sleep(0.05)
+            return True, False
+
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async", side_effect=_slow_fetch
+            ),
+            patch(
+                "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 0)
+            ),
+        ):
+            asyncio.run(
+                sync_repos(repos, limiter=limiter, fetch_baselines={"Repo": 0.001})
+            )
+
+        assert limiter.limit == 2
+
+    def test_failed_fetches_reduce_limit(self, tmp_path):
+        """Overlapping failures are one congestion signal."""
+        repos = [(f"Repo{i}", tmp_path / f"Repo{i}") for i in range(3)]
+        limiter = AdaptiveLimiter(initial=4, maximum=16)
+
+        async def _failing_fetch(*args):
+            await asyncio.sleep(0.01)
+            return False, True
+
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async",
+                side_effect=_failing_fetch,
+            ),
+        ):
+            results = asyncio.run(sync_repos(repos, limiter=limiter))
+
+        assert all(r.action == "failed" for r in results)
+        assert limiter.limit == 2
+
+    def test_successful_fetches_raise_limit(self, tmp_path):
+        repos = [(f"Repo{i}", tmp_path / f"Repo{i}") for i in range(3)]
+        limiter = AdaptiveLimiter(initial=2, maximum=16)
+
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async", return_value=(True, False)
+            ),
+            patch(
+                "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 0)
+            ),
+        ):
+            results = asyncio.run(sync_repos(repos, limiter=limiter))
+
+        assert all(r.success for r in results)
+        assert limiter.limit == 5
+        assert all("fetch" in r.timings for r in results)
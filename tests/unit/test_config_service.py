@@ -54,6 +54,18 @@ class TestSetConfigValue:
         with pytest.raises(ValueError, match="Unknown config key"):
             set_config_value(tmp_path, "bad_key", "value")
 
+    def test_set_choice_value(self, tmp_path: Path):
+        assert set_config_value(tmp_path, "fetch_profile", "no-tags") == "no-tags"
+
+    def test_choice_validation(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="must be one of"):
+            set_config_value(tmp_path, "fetch_profile", "everything")
+
+    def test_set_clone_mode(self, tmp_path: Path):
+        assert set_config_value(tmp_path, "clone_mode", "blobless") == "blobless"
+        with pytest.raises(ValueError, match="must be one of"):
+            set_config_value(tmp_path, "clone_mode", "tiny")
+
 
 class TestListConfig:
     """Tests for list_config."""
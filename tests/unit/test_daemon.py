@@ -0,0 +1,164 @@
+"""Unit tests for the workspace daemon.
+
+Tests for state refresh, the request protocol, and the socket client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vindicta_cli.lib.daemon import (
+    DAEMON_SUPPORTED,
+    WorkspaceDaemon,
+    daemon_status,
+    request_daemon,
+    socket_path,
+)
+from vindicta_cli.lib.workspace import CONFIG_FILENAME
+from vindicta_cli.models.repo_info import RepoEntry, RepoInfo
+
+
+def _fake_info(repo_path: Path, entry: RepoEntry, deadline: float = 0) -> RepoInfo:
+    return RepoInfo(
+        name=entry.name,
+        tier=entry.tier,
+        repo_type=entry.repo_type,
+        local_path=repo_path,
+        current_branch="main",
+    )
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """Workspace with Vindicta-Core and Vindicta-Web present."""
+    (tmp_path / CONFIG_FILENAME).write_text("schema_version: '1.0.0'\n")
+    for name in ("Vindicta-Core", "Vindicta-Web"):
+        git_dir = tmp_path / name / ".git"
+        git_dir.mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    return tmp_path
+
+
+class TestWorkspaceDaemonState:
+    """Tests for in-memory state refresh."""
+
+    def test_initial_refresh_computes_present_repos(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace)
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            assert daemon.refresh() == 2
+
+        names = [i.name for i in daemon.snapshot()]
+        assert names == ["Vindicta-Core", "Vindicta-Web"]
+
+    def test_unchanged_repos_are_not_recomputed(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace)
+        with patch(
+            "vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info
+        ) as mock_info:
+            daemon.refresh()
+            assert daemon.refresh() == 0
+        assert mock_info.call_count == 2
+
+    def test_metadata_change_triggers_recompute(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace)
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            daemon.refresh()
+            (workspace / "Vindicta-Core" / ".git" / "index").write_bytes(b"x")
+            assert daemon.refresh() == 1
+
+    def test_max_age_forces_recompute(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace)
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            daemon.refresh()
+            assert daemon.refresh(max_age=0.0) == 2
+
+    def test_invalidate_drops_fingerprints(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace)
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            daemon.refresh()
+            daemon.invalidate(["Vindicta-Web"])
+            assert daemon.refresh() == 1
+
+    def test_snapshot_filters_tiers(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace)
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            daemon.refresh()
+        assert [i.name for i in daemon.snapshot(["P1"])] == ["Vindicta-Web"]
+
+
+class TestDaemonProtocol:
+    """Tests for request dispatch."""
+
+    def test_ping(self, workspace: Path):
+        response = asyncio.run(
+            WorkspaceDaemon(workspace).handle_request({"op": "ping"})
+        )
+        assert response["ok"] is True
+        assert response["workspace"] == str(workspace)
+
+    def test_unknown_op(self, workspace: Path):
+        response = asyncio.run(WorkspaceDaemon(workspace).handle_request({"op": "x"}))
+        assert response["ok"] is False
+
+    def test_status_returns_serialized_infos(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace)
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            response = asyncio.run(daemon.handle_request({"op": "status"}))
+        restored = [RepoInfo.from_dict(d) for d in response["repos"]]
+        assert restored[0].name == "Vindicta-Core"
+        assert isinstance(restored[0].local_path, Path)
+
+
+class TestDaemonClient:
+    """Tests for the socket client."""
+
+    def test_no_daemon_returns_none(self, workspace: Path):
+        assert request_daemon(workspace, {"op": "ping"}) is None
+        assert daemon_status(workspace) is None
+
+    def test_long_workspace_path_uses_temp_socket(self, tmp_path: Path):
+        deep = tmp_path / ("x" * 120)
+        assert len(str(socket_path(deep))) <= 100
+
+    @pytest.mark.skipif(not DAEMON_SUPPORTED, reason="requires AF_UNIX")
+    def test_end_to_end_over_socket(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace, refresh_interval=60)
+
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            thread = threading.Thread(target=lambda: asyncio.run(daemon.serve()))
+            thread.start()
+            try:
+                deadline = time.monotonic() + 5
+                while request_daemon(workspace, {"op": "ping"}) is None:
+                    assert time.monotonic() < deadline, "daemon did not start"
+                    time.sleep(0.05)
+
+                infos = daemon_status(workspace, ["P0"])
+                assert [i.name for i in infos] == ["Vindicta-Core"]
+            finally:
+                request_daemon(workspace, {"op": "shutdown"})
+                thread.join(timeout=5)
+
+        assert not socket_path(workspace).exists()
+
+
+class TestScheduledPrefetch:
+    """The daemon prefetches present repos on request."""
+
+    def test_prefetch_covers_present_repos(self, workspace: Path):
+        daemon = WorkspaceDaemon(workspace)
+        daemon._reload_config()
+
+        with patch(
+            "vindicta_cli.lib.daemon.prefetch_workspace", return_value={}
+        ) as mock_prefetch:
+            asyncio.run(daemon.prefetch())
+
+        repos = mock_prefetch.call_args.args[1]
+        assert [name for name, _ in repos] == ["Vindicta-Core", "Vindicta-Web"]
@@ -9,11 +9,13 @@ from unittest.mock import MagicMock, patch
 from vindicta_cli.lib.doctor_service import (
     DiagnosticResult,
     DoctorReport,
+    _check_git_tuning,
     _check_stale_locks,
     _check_tool,
     _check_workspace_config,
     run_diagnostics,
 )
+from vindicta_cli.lib.git_tuning import GitTuning
 
 
 class TestCheckTool:
@@ -103,6 +105,105 @@ class TestCheckStaleLocks:
         assert result.fixable is True
 
 
+class TestCheckGitTuning:
+    """Tests for the per-repo git status tuning check."""
+
+    def _present(self, tmp_path: Path):
+        from vindicta_cli.models.repo_info import RepoEntry
+
+        entry = RepoEntry(
+            name="Vindicta-Core",
+            tier="P0",
+            repo_type="python",
+            github_url="https://github.com/vindicta-platform/Vindicta-Core",
+            local_path=tmp_path / "Vindicta-Core",
+            present=True,
+        )
+        return patch("vindicta_cli.lib.doctor_service.scan_repos", return_value=[entry])
+
+    def test_reports_missing_settings(self, tmp_path: Path):
+        with (
+            self._present(tmp_path),
+            patch(
+                "vindicta_cli.lib.doctor_service.read_tuning",
+                return_value=GitTuning(many_files=True, untracked_cache=False),
+            ),
+        ):
+            results = _check_git_tuning(tmp_path)
+
+        assert len(results) == 1
+        assert results[0].name == "git tuning: Vindicta-Core"
+        assert results[0].status == "warning"
+        assert "core.untrackedCache" in results[0].message
+        assert results[0].fix_command == "vindicta dev doctor --fix"
+
+    def test_complete_is_ok(self, tmp_path: Path):
+        with (
+            self._present(tmp_path),
+            patch(
+                "vindicta_cli.lib.doctor_service.read_tuning",
+                return_value=GitTuning(untracked_cache=True, many_files=True),
+            ),
+        ):
+            results = _check_git_tuning(tmp_path)
+
+        assert results[0].status == "ok"
+        assert "fsmonitor unsupported" in results[0].message
+
+    def test_auto_fix_enables(self, tmp_path: Path):
+        with (
+            self._present(tmp_path),
+            patch(
+                "vindicta_cli.lib.doctor_service.read_tuning",
+                side_effect=[GitTuning(), GitTuning(True, True)],
+            ),
+            patch(
+                "vindicta_cli.lib.doctor_service.enable_tuning", return_value=True
+            ) as mock_enable,
+        ):
+            results = _check_git_tuning(tmp_path, auto_fix=True)
+
+        mock_enable.assert_called_once()
+        assert results[0].status == "ok"
+
+    def test_absent_repos_skipped(self, tmp_path: Path):
+        assert _check_git_tuning(tmp_path) == []
+
+    def test_repos_checked_concurrently_in_order(self, tmp_path: Path):
+        import threading
+        import time
+
+        from vindicta_cli.models.repo_info import RepoEntry
+
+        entries = [
+            RepoEntry(
+                name=f"Repo-{i}",
+                tier="P0",
+                repo_type="python",
+                github_url=f"https://github.com/vindicta-platform/Repo-{i}",
+                local_path=tmp_path / f"Repo-{i}",
+                present=True,
+            )
+            for i in range(4)
+        ]
+        threads = set()
+
+        def _read(path: Path) -> GitTuning:
+            threads.add(threading.get_ident())
+            # Later repos finish first
+            time.sleep(0.02 * (4 - int(path.name.split("-")[1])))
+            return GitTuning(untracked_cache=True, many_files=True)
+
+        with (
+            patch("vindicta_cli.lib.doctor_service.scan_repos", return_value=entries),
+            patch("vindicta_cli.lib.doctor_service.read_tuning", side_effect=_read),
+        ):
+            results = _check_git_tuning(tmp_path, parallel_count=4)
+
+        assert [r.name for r in results] == [f"git tuning: Repo-{i}" for i in range(4)]
+        assert len(threads) > 1
+
+
 class TestRunDiagnostics:
     """Tests for run_diagnostics orchestrator."""
 
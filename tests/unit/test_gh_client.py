@@ -29,6 +29,15 @@ class TestGhClient:
         assert "repo" in cmd
         assert "clone" in cmd
         assert "vindicta-platform/Vindicta-Core" in cmd
+        assert "--" not in cmd
+
+    def test_build_clone_command_passes_git_args(self):
+        from vindicta_cli.lib.gh_client import GhClient
+
+        cmd = GhClient()._build_clone_command(
+            "vindicta-platform/Vindicta-Core", "/tmp/Vindicta-Core", ["--depth=1"]
+        )
+        assert cmd[-2:] == ["--", "--depth=1"]
 
     def test_build_pr_list_command(self):
         from vindicta_cli.lib.gh_client import GhClient
@@ -47,3 +56,164 @@ class TestGhClient:
         cmd = client._build_ci_status_command("vindicta-platform/Vindicta-Core")
         assert "gh" in cmd
         assert "run" in cmd or "status" in cmd
+
+
+def _summary_node(prs: int, rollup: str | None = None, suites=None) -> dict:
+    return {
+        "pullRequests": {"totalCount": prs},
+        "defaultBranchRef": {
+            "target": {
+                "statusCheckRollup": {"state": rollup} if rollup else None,
+                "checkSuites": {"nodes": suites or []},
+            }
+        },
+    }
+
+
+class TestRepoSummaries:
+    """Tests for the batched GraphQL PR/CI query."""
+
+    def test_query_aliases_every_repo(self):
+        from vindicta_cli.lib.gh_client import GhClient
+
+        query = GhClient()._build_repo_summary_query(
+            ["vindicta-platform/Vindicta-Core", "vindicta-platform/Vindicta-API"]
+        )
+        assert 'r0: repository(owner: "vindicta-platform", name: "Vindicta-Core")' in (
+            query
+        )
+        assert 'r1: repository(owner: "vindicta-platform", name: "Vindicta-API")' in (
+            query
+        )
+        assert query.count("pullRequests(states: OPEN)") == 2
+
+    def test_query_escapes_names(self):
+        from vindicta_cli.lib.gh_client import GhClient
+
+        query = GhClient()._build_repo_summary_query(['org/bad"name'])
+        assert 'name: "bad\\"name"' in query
+
+    def test_parse_canned_response(self):
+        from vindicta_cli.lib.gh_client import parse_repo_summaries
+
+        repos = ["o/a", "o/b", "o/c", "o/missing"]
+        payload = {
+            "data": {
+                "r0": _summary_node(3, rollup="SUCCESS"),
+                "r1": _summary_node(0, rollup="FAILURE"),
+                "r2": _summary_node(1, rollup="PENDING"),
+                "r3": None,
+            },
+            "errors": [{"message": "Could not resolve to a Repository"}],
+        }
+        summaries = parse_repo_summaries(repos, payload)
+
+        assert set(summaries) == {"o/a", "o/b", "o/c"}
+        assert (summaries["o/a"].open_pr_count, summaries["o/a"].ci_status) == (
+            3,
+            "passing",
+        )
+        assert summaries["o/b"].ci_status == "failing"
+        assert summaries["o/c"].ci_status == "pending"
+
+    def test_check_suite_fallback(self):
+        from vindicta_cli.lib.gh_client import parse_repo_summaries
+
+        payload = {
+            "data": {
+                "r0": _summary_node(
+                    0, suites=[{"status": "COMPLETED", "conclusion": "SUCCESS"}]
+                ),
+                "r1": _summary_node(
+                    0, suites=[{"status": "COMPLETED", "conclusion": "TIMED_OUT"}]
+                ),
+                "r2": _summary_node(0, suites=[{"status": "IN_PROGRESS"}]),
+                "r3": _summary_node(0),
+                "r4": {"pullRequests": {"totalCount": 2}, "defaultBranchRef": None},
+            }
+        }
+        summaries = parse_repo_summaries(["a", "b", "c", "d", "e"], payload)
+        assert [summaries[r].ci_status for r in "abcde"] == [
+            "passing",
+            "failing",
+            "pending",
+            None,
+            None,
+        ]
+        assert summaries["e"].open_pr_count == 2
+
+    def test_chunks_into_few_gh_calls(self):
+        import asyncio
+        import json
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from vindicta_cli.lib.gh_client import GhClient
+
+        repos = [f"o/r{i}" for i in range(26)]
+        commands = []
+
+        async def _fake_exec(*cmd, **kwargs):
+            commands.append(cmd)
+            count = cmd[-1].count("repository(")
+            body = {"data": {f"r{i}": _summary_node(i) for i in range(count)}}
+            process = MagicMock(returncode=0)
+            process.communicate = AsyncMock(
+                return_value=(json.dumps(body).encode(), b"")
+            )
+            return process
+
+        with patch(
+            "vindicta_cli.lib.gh_client.asyncio.create_subprocess_exec",
+            side_effect=_fake_exec,
+        ):
+            summaries = asyncio.run(GhClient().get_repo_summaries(repos, batch_size=25))
+
+        assert len(commands) == 2
+        assert all(c[:3] == ("gh", "api", "graphql") for c in commands)
+        assert len(summaries) == 26
+        assert summaries["o/r25"].open_pr_count == 0  # first alias of chunk two
+
+    def test_failed_chunk_is_omitted(self):
+        import asyncio
+        from unittest.mock import patch
+
+        from vindicta_cli.lib.gh_client import GhClient, RepoCiSummary
+
+        async def _query(repos):
+            if "o/bad" in repos:
+                raise ConnectionError("HTTP 502")
+            return {r: RepoCiSummary(open_pr_count=1) for r in repos}
+
+        with patch.object(GhClient, "_query_repo_summaries", side_effect=_query):
+            summaries = asyncio.run(
+                GhClient().get_repo_summaries(["o/a", "o/bad"], batch_size=1)
+            )
+        assert list(summaries) == ["o/a"]
+
+    def test_repo_sizes_from_disk_usage(self):
+        import asyncio
+        import json
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from vindicta_cli.lib.gh_client import GhClient
+
+        queries = []
+
+        async def _fake_exec(*cmd, **kwargs):
+            queries.append(cmd[-1])
+            body = {"data": {"r0": {"diskUsage": 2048}, "r1": None}}
+            process = MagicMock(returncode=1)
+            process.communicate = AsyncMock(
+                return_value=(json.dumps(body).encode(), b"")
+            )
+            return process
+
+        with patch(
+            "vindicta_cli.lib.gh_client.asyncio.create_subprocess_exec",
+            side_effect=_fake_exec,
+        ):
+            sizes = asyncio.run(GhClient().get_repo_sizes(["o/big", "o/gone"]))
+
+        assert sizes == {"o/big": 2048 * 1024}
+        assert "diskUsage" in queries[0]
+        assert "pullRequests" not in queries[0]
@@ -0,0 +1,199 @@
+"""Unit tests for the in-process git metadata reader.
+
+Tests for git dir discovery, HEAD and ref resolution, packed refs,
+and upstream lookup, checked against real repositories where useful.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tests.conftest import git, requires_git
+from vindicta_cli.lib import git_refs
+
+SHA = "1" * 40
+OTHER = "2" * 40
+
+
+def _git_dir(root: Path, head: str = "ref: refs/heads/main") -> Path:
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head + "\n")
+    return git_dir
+
+
+class TestResolveGitDir:
+    """Tests for locating the git directory."""
+
+    def test_plain_directory(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        assert git_refs.resolve_git_dir(tmp_path) == git_dir
+
+    def test_gitdir_file(self, tmp_path: Path):
+        real = tmp_path / "store" / "repo.git"
+        real.mkdir(parents=True)
+        work = tmp_path / "work"
+        work.mkdir()
+        (work / ".git").write_text("gitdir: ../store/repo.git\n")
+        assert git_refs.resolve_git_dir(work) == work / "../store/repo.git"
+
+    def test_dangling_gitdir_file(self, tmp_path: Path):
+        (tmp_path / ".git").write_text("gitdir: /nonexistent/path\n")
+        assert git_refs.resolve_git_dir(tmp_path) is None
+
+    def test_missing(self, tmp_path: Path):
+        assert git_refs.resolve_git_dir(tmp_path) is None
+
+
+class TestRefs:
+    """Tests for HEAD and ref resolution."""
+
+    def test_loose_branch(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        (git_dir / "refs" / "heads" / "main").write_text(SHA + "\n")
+        assert git_refs.current_branch(git_dir) == "main"
+        assert git_refs.resolve_ref(git_dir) == SHA
+
+    def test_packed_ref(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        (git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            f"{SHA} refs/heads/main\n"
+            f"{OTHER} refs/tags/v1\n"
+            f"^{SHA}\n"
+        )
+        assert git_refs.resolve_ref(git_dir) == SHA
+        assert git_refs.resolve_ref(git_dir, "refs/tags/v1") == OTHER
+
+    def test_loose_ref_wins_over_packed(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        (git_dir / "packed-refs").write_text(f"{OTHER} refs/heads/main\n")
+        (git_dir / "refs" / "heads" / "main").write_text(SHA)
+        assert git_refs.resolve_ref(git_dir) == SHA
+
+    def test_detached_head(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path, head=SHA)
+        assert git_refs.current_branch(git_dir) is None
+        assert git_refs.resolve_ref(git_dir) == SHA
+
+    def test_unborn_branch(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        assert git_refs.resolve_ref(git_dir) is None
+
+    def test_symref_cycle(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path, head="ref: refs/heads/a")
+        (git_dir / "refs" / "heads" / "a").write_text("ref: refs/heads/b")
+        (git_dir / "refs" / "heads" / "b").write_text("ref: refs/heads/a")
+        assert git_refs.resolve_ref(git_dir) is None
+
+    def test_list_refs_merges_loose_and_packed(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        remotes = git_dir / "refs" / "remotes" / "origin"
+        (remotes / "feat").mkdir(parents=True)
+        (remotes / "HEAD").write_text("ref: refs/remotes/origin/main\n")
+        (remotes / "feat" / "x").write_text(SHA + "\n")
+        (git_dir / "packed-refs").write_text(
+            f"{OTHER} refs/remotes/origin/main\n"
+            f"{OTHER} refs/remotes/origin/feat/x\n"
+            f"{OTHER} refs/heads/main\n"
+        )
+        assert git_refs.list_refs(git_dir, "refs/remotes/origin/") == {
+            "refs/remotes/origin/main": OTHER,
+            "refs/remotes/origin/feat/x": SHA,
+        }
+
+
+class TestUpstream:
+    """Tests for upstream and default branch lookup."""
+
+    def test_upstream_from_config(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        (git_dir / "config").write_text(
+            '[branch "feat/x"]\n\tremote = origin\n\tmerge = refs/heads/feat/x\n'
+        )
+        assert git_refs.upstream_ref(git_dir, "feat/x") == "refs/remotes/origin/feat/x"
+        assert git_refs.upstream_ref(git_dir, "main") is None
+
+    def test_local_upstream_is_ignored(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        (git_dir / "config").write_text(
+            '[branch "dev"]\n\tremote = .\n\tmerge = refs/heads/main\n'
+        )
+        assert git_refs.upstream_ref(git_dir, "dev") is None
+
+    def test_includes_disable_config_reading(self, tmp_path: Path):
+        git_dir = _git_dir(tmp_path)
+        (git_dir / "config").write_text(
+            '[include]\n\tpath = extra\n[branch "main"]\n\tremote = origin\n'
+            "\tmerge = refs/heads/main\n"
+        )
+        assert git_refs.upstream_ref(git_dir, "main") is None
+
+
+@requires_git
+class TestAgainstGit:
+    """Reader results match git for real repositories."""
+
+    def test_clone(self, git_clone: Path):
+        git_dir = git_refs.resolve_git_dir(git_clone)
+        assert git_refs.current_branch(git_dir) == "main"
+        assert git_refs.default_branch(git_dir) == "main"
+        assert git_refs.resolve_ref(git_dir) == git("rev-parse", "HEAD", cwd=git_clone)
+        upstream = git_refs.upstream_ref(git_dir, "main")
+        assert upstream == "refs/remotes/origin/main"
+        assert git_refs.resolve_ref(git_dir, upstream) == git(
+            "rev-parse", "origin/main", cwd=git_clone
+        )
+
+    def test_packed_refs_after_gc(self, git_clone: Path):
+        git("pack-refs", "--all", cwd=git_clone)
+        git_dir = git_refs.resolve_git_dir(git_clone)
+        assert git_refs.resolve_ref(git_dir) == git("rev-parse", "HEAD", cwd=git_clone)
+
+    def test_linked_worktree(self, tmp_path: Path, git_clone: Path):
+        tree = tmp_path / "tree"
+        git("worktree", "add", "-q", "-b", "wt", str(tree), cwd=git_clone)
+        git_dir = git_refs.resolve_git_dir(tree)
+        assert git_dir is not None
+        assert git_refs.current_branch(git_dir) == "wt"
+        assert git_refs.resolve_ref(git_dir) == git("rev-parse", "HEAD", cwd=tree)
+
+
+@requires_git
+class TestReadIndexStats:
+    """Index stat data matches what git recorded."""
+
+    def _tracked(self, repo: Path) -> list[str]:
+        return git("ls-files", cwd=repo).splitlines()
+
+    def test_matches_ls_files(self, git_clone: Path):
+        (git_clone / "dir" / "nested").mkdir(parents=True)
+        (git_clone / "dir" / "nested" / "a.txt").write_text("a\n")
+        (git_clone / "dir" / "b.txt").write_text("bb\n")
+        git("add", ".", cwd=git_clone)
+
+        stats = git_refs.read_index_stats(git_clone / ".git")
+
+        assert [s.path for s in stats] == self._tracked(git_clone)
+        by_path = {s.path: s for s in stats}
+        st = (git_clone / "dir" / "b.txt").stat()
+        assert by_path["dir/b.txt"].size == st.st_size
+        assert by_path["dir/b.txt"].mtime_s == int(st.st_mtime)
+
+    def test_index_v4(self, git_clone: Path):
+        (git_clone / "dir").mkdir()
+        for name in ("alpha.txt", "alphabet.txt", "beta.txt"):
+            (git_clone / "dir" / name).write_text(name)
+        git("add", ".", cwd=git_clone)
+        git("update-index", "--index-version", "4", cwd=git_clone)
+
+        stats = git_refs.read_index_stats(git_clone / ".git")
+
+        assert [s.path for s in stats] == self._tracked(git_clone)
+
+    def test_split_index_unsupported(self, git_clone: Path):
+        git("update-index", "--split-index", cwd=git_clone)
+        assert git_refs.read_index_stats(git_clone / ".git") is None
+
+    def test_missing_index(self, tmp_path: Path):
+        assert git_refs.read_index_stats(_git_dir(tmp_path)) == []
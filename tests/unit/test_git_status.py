@@ -0,0 +1,108 @@
+"""Unit tests for the porcelain v2 status parser.
+
+Tests for branch headers, entry counting, renames, and conflicts.
+"""
+
+from vindicta_cli.lib.git_status import parse_porcelain_v2
+
+OID = "a" * 40
+
+
+def _z(*records: str) -> str:
+    return "\0".join(records) + "\0"
+
+
+class TestBranchHeaders:
+    """Tests for `# branch.*` header parsing."""
+
+    def test_tracking_branch(self):
+        status = parse_porcelain_v2(
+            _z(
+                f"# branch.oid {OID}",
+                "# branch.head feat/x",
+                "# branch.upstream origin/feat/x",
+                "# branch.ab +2 -5",
+            )
+        )
+        assert status.oid == OID
+        assert status.branch == "feat/x"
+        assert status.upstream == "origin/feat/x"
+        assert (status.ahead, status.behind) == (2, 5)
+        assert status.is_dirty is False
+
+    def test_no_upstream(self):
+        status = parse_porcelain_v2(_z(f"# branch.oid {OID}", "# branch.head main"))
+        assert status.upstream is None
+        assert (status.ahead, status.behind) == (0, 0)
+
+    def test_skipped_ahead_behind(self):
+        status = parse_porcelain_v2(
+            _z(
+                "# branch.head main",
+                "# branch.upstream origin/main",
+                "# branch.ab +? -?",
+            )
+        )
+        assert (status.ahead, status.behind) == (0, 0)
+
+    def test_detached_head(self):
+        status = parse_porcelain_v2(
+            _z(f"# branch.oid {OID}", "# branch.head (detached)")
+        )
+        assert status.branch is None
+
+    def test_initial_commit(self):
+        status = parse_porcelain_v2(_z("# branch.oid (initial)", "# branch.head main"))
+        assert status.oid is None
+
+
+class TestEntries:
+    """Tests for change entry counting."""
+
+    def test_staged_and_unstaged(self):
+        status = parse_porcelain_v2(
+            _z(
+                f"1 M. N... 100644 100644 100644 {OID} {OID} staged.py",
+                f"1 .M N... 100644 100644 100644 {OID} {OID} unstaged.py",
+                f"1 MM N... 100644 100644 100644 {OID} {OID} both.py",
+            )
+        )
+        assert status.staged == 2
+        assert status.unstaged == 2
+        assert status.paths == ["staged.py", "unstaged.py", "both.py"]
+        assert status.is_dirty is True
+
+    def test_path_with_spaces(self):
+        status = parse_porcelain_v2(
+            _z(f"1 .M N... 100644 100644 100644 {OID} {OID} docs/my file.md")
+        )
+        assert status.paths == ["docs/my file.md"]
+
+    def test_rename_consumes_original_path(self):
+        status = parse_porcelain_v2(
+            _z(
+                f"2 R. N... 100644 100644 100644 {OID} {OID} R100 new.py",
+                "old.py",
+                "? untracked.txt",
+            )
+        )
+        assert status.paths == ["new.py", "untracked.txt"]
+        assert status.staged == 1
+        assert status.untracked == 1
+
+    def test_conflicts(self):
+        status = parse_porcelain_v2(
+            _z(f"u UU N... 100644 100644 100644 100644 {OID} {OID} {OID} clash.py")
+        )
+        assert status.conflicts == 1
+        assert status.paths == ["clash.py"]
+
+    def test_untracked(self):
+        status = parse_porcelain_v2(_z("? a.txt", "? b/c.txt"))
+        assert status.untracked == 2
+        assert status.staged == 0
+
+    def test_empty_output(self):
+        status = parse_porcelain_v2("")
+        assert status.is_dirty is False
+        assert status.branch is None
@@ -0,0 +1,106 @@
+"""Unit tests for git status tuning.
+
+Tests for reading and enabling the untracked cache, manyFiles and
+fsmonitor settings against real repositories.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from tests.conftest import git, requires_git
+from vindicta_cli.lib.git_tuning import (
+    GitTuning,
+    enable_tuning,
+    fsmonitor_supported,
+    read_tuning,
+)
+
+
+class TestGitTuning:
+    """Tests for the GitTuning summary."""
+
+    def test_complete_without_fsmonitor_support(self):
+        tuning = GitTuning(untracked_cache=True, many_files=True)
+        assert tuning.complete
+        assert tuning.missing == []
+
+    def test_fsmonitor_required_when_supported(self):
+        tuning = GitTuning(
+            untracked_cache=True, many_files=True, fsmonitor_supported=True
+        )
+        assert not tuning.complete
+        assert tuning.missing == ["core.fsmonitor"]
+
+    def test_missing_lists_config_keys(self):
+        assert GitTuning().missing == ["core.untrackedCache", "feature.manyFiles"]
+
+
+@requires_git
+class TestReadTuning:
+    """Tests for reading a repository's settings."""
+
+    def test_defaults_off(self, git_clone: Path):
+        tuning = read_tuning(git_clone)
+        assert tuning is not None
+        assert not tuning.untracked_cache
+        assert not tuning.many_files
+
+    def test_many_files_implies_untracked_cache(self, git_clone: Path):
+        git("config", "feature.manyFiles", "true", cwd=git_clone)
+        tuning = read_tuning(git_clone)
+        assert tuning.many_files and tuning.untracked_cache
+
+    def test_explicit_untracked_cache_off_wins(self, git_clone: Path):
+        git("config", "feature.manyFiles", "true", cwd=git_clone)
+        git("config", "core.untrackedCache", "false", cwd=git_clone)
+        assert not read_tuning(git_clone).untracked_cache
+
+    def test_not_a_repository(self, tmp_path: Path):
+        assert read_tuning(tmp_path) is None
+
+
+@requires_git
+class TestEnableTuning:
+    """Tests for enabling the settings."""
+
+    def test_enables_settings(self, git_clone: Path):
+        with patch(
+            "vindicta_cli.lib.git_tuning.fsmonitor_supported", return_value=False
+        ):
+            assert enable_tuning(git_clone) is True
+            tuning = read_tuning(git_clone)
+
+        assert tuning.complete
+        assert not tuning.fsmonitor
+        assert git("config", "--local", "core.untrackedCache", cwd=git_clone) == "true"
+
+    def test_enables_fsmonitor_where_supported(self, git_clone: Path):
+        with patch(
+            "vindicta_cli.lib.git_tuning.fsmonitor_supported", return_value=True
+        ):
+            assert enable_tuning(git_clone) is True
+        assert git("config", "--local", "core.fsmonitor", cwd=git_clone) == "true"
+
+    def test_not_a_repository(self, tmp_path: Path):
+        assert enable_tuning(tmp_path) is False
+
+
+class TestFsmonitorSupported:
+    """Tests for fsmonitor daemon detection."""
+
+    def test_not_running_is_supported(self, tmp_path: Path):
+        with patch("vindicta_cli.lib.git_tuning.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1)
+            assert fsmonitor_supported(tmp_path) is True
+
+    def test_unsupported_platform(self, tmp_path: Path):
+        with patch("vindicta_cli.lib.git_tuning.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=128)
+            assert fsmonitor_supported(tmp_path) is False
+
+    def test_git_missing(self, tmp_path: Path):
+        with patch("vindicta_cli.lib.git_tuning.subprocess.run") as mock_run:
+            mock_run.side_effect = FileNotFoundError("git")
+            assert fsmonitor_supported(tmp_path) is False
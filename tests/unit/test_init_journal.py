@@ -0,0 +1,164 @@
+"""Unit tests for the init journal.
+
+Tests for journal persistence, clone verification, and how clone_repos
+resumes from the journal against real repositories.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from tests.conftest import git, requires_git
+from vindicta_cli.lib.init_journal import InitJournal, verify_clone
+from vindicta_cli.lib.repository import clone_repos
+from vindicta_cli.models.repo_info import RepoEntry
+
+
+def _core() -> RepoEntry:
+    return RepoEntry(
+        name="Vindicta-Core",
+        tier="P0",
+        repo_type="python",
+        github_url="https://github.com/vindicta-platform/Vindicta-Core",
+    )
+
+
+def _fake_gh_clone(tmp_path: Path, git_remote: Path):
+    async def _clone(slug: str, target: Path, git_args: list[str]) -> bool:
+        git("clone", "-q", *git_args, str(git_remote), str(target), cwd=tmp_path)
+        return True
+
+    return _clone
+
+
+class TestInitJournal:
+    """Tests for recording and reloading stages."""
+
+    def test_round_trip(self, tmp_path: Path):
+        journal = InitJournal(tmp_path)
+        journal.begin_clone("Vindicta-Core")
+        journal.mark("Vindicta-Core", "cloned", "verified")
+        journal.mark("Vindicta-Core", "venv")
+
+        loaded = InitJournal(tmp_path)
+        loaded.load()
+        assert loaded.started("Vindicta-Core")
+        assert loaded.stages("Vindicta-Core") == {"cloned", "verified", "venv"}
+        assert not loaded.started("Vindicta-API")
+        assert loaded.stages("Vindicta-API") == set()
+
+    def test_begin_clone_clears_stages(self, tmp_path: Path):
+        journal = InitJournal(tmp_path)
+        journal.mark("Vindicta-Core", "cloned", "verified", "venv")
+        journal.begin_clone("Vindicta-Core")
+
+        assert journal.started("Vindicta-Core")
+        assert journal.stages("Vindicta-Core") == set()
+
+    def test_saved_after_every_mark(self, tmp_path: Path):
+        journal = InitJournal(tmp_path)
+        journal.mark("Vindicta-Core", "cloned")
+
+        data = json.loads(journal.path.read_text())
+        assert data["repos"]["Vindicta-Core"]["stages"] == ["cloned"]
+
+    def test_ignores_corrupt_file(self, tmp_path: Path):
+        journal = InitJournal(tmp_path)
+        journal.path.parent.mkdir(parents=True)
+        journal.path.write_text("{not json")
+        journal.load()
+        assert not journal.started("Vindicta-Core")
+
+
+@requires_git
+class TestVerifyClone:
+    """Tests for detecting clones that never finished."""
+
+    def test_complete_clone(self, git_clone: Path):
+        assert verify_clone(git_clone)
+
+    def test_missing_checkout(self, git_clone: Path):
+        (git_clone / ".git" / "index").unlink()
+        assert not verify_clone(git_clone)
+
+    def test_checkout_in_progress(self, git_clone: Path):
+        (git_clone / ".git" / "index.lock").write_text("")
+        assert not verify_clone(git_clone)
+
+    def test_no_commits(self, tmp_path: Path):
+        git("init", "-q", str(tmp_path / "empty"), cwd=tmp_path)
+        assert not verify_clone(tmp_path / "empty")
+
+    def test_not_a_repository(self, tmp_path: Path):
+        assert not verify_clone(tmp_path)
+
+
+@requires_git
+class TestCloneReposResume:
+    """Tests for clone_repos picking up after an interrupted init."""
+
+    def _clone(self, tmp_path: Path, git_remote: Path, journal: InitJournal):
+        workspace = tmp_path / "ws"
+        workspace.mkdir(exist_ok=True)
+        with patch("vindicta_cli.lib.repository.GhClient") as mock_gh_cls:
+            mock_gh_cls.return_value.clone_repo = AsyncMock(
+                side_effect=_fake_gh_clone(tmp_path, git_remote)
+            )
+            results = asyncio.run(clone_repos([_core()], workspace, journal=journal))
+        return results, mock_gh_cls.return_value.clone_repo
+
+    def test_records_clone_stages(self, tmp_path: Path, git_remote: Path):
+        journal = InitJournal(tmp_path / "ws")
+        results, _ = self._clone(tmp_path, git_remote, journal)
+
+        assert results == {"Vindicta-Core": True}
+        assert journal.stages("Vindicta-Core") == {"cloned", "verified"}
+
+    def test_verified_repo_skipped(self, tmp_path: Path, git_remote: Path):
+        journal = InitJournal(tmp_path / "ws")
+        self._clone(tmp_path, git_remote, journal)
+
+        results, clone = self._clone(tmp_path, git_remote, journal)
+
+        assert results == {"Vindicta-Core": True}
+        clone.assert_not_called()
+
+    def test_partial_clone_removed_and_recloned(self, tmp_path: Path, git_remote: Path):
+        journal = InitJournal(tmp_path / "ws")
+        journal.begin_clone("Vindicta-Core")
+        partial = tmp_path / "ws" / "Vindicta-Core"
+        git("init", "-q", str(partial), cwd=tmp_path)
+
+        results, clone = self._clone(tmp_path, git_remote, journal)
+
+        assert results == {"Vindicta-Core": True}
+        clone.assert_called_once()
+        assert (partial / "README.md").exists()
+        assert journal.has("Vindicta-Core", "verified")
+
+    def test_existing_clone_adopted(self, tmp_path: Path, git_remote: Path):
+        workspace = tmp_path / "ws"
+        target = workspace / "Vindicta-Core"
+        git("clone", "-q", str(git_remote), str(target), cwd=tmp_path)
+        journal = InitJournal(workspace)
+
+        results, clone = self._clone(tmp_path, git_remote, journal)
+
+        assert results == {"Vindicta-Core": True}
+        clone.assert_not_called()
+        assert journal.stages("Vindicta-Core") == {"cloned", "verified"}
+
+    def test_foreign_directory_left_alone(self, tmp_path: Path, git_remote: Path):
+        own = tmp_path / "ws" / "Vindicta-Core"
+        own.mkdir(parents=True)
+        (own / "notes.txt").write_text("mine\n")
+        journal = InitJournal(tmp_path / "ws")
+
+        results, clone = self._clone(tmp_path, git_remote, journal)
+
+        assert results == {"Vindicta-Core": False}
+        clone.assert_not_called()
+        assert (own / "notes.txt").read_text() == "mine\n"
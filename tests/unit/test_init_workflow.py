@@ -9,7 +9,8 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from vindicta_cli.lib.repository import clone_repos, detect_repo_type
+from vindicta_cli.lib.repository import clone_args, clone_repos, detect_repo_type
+from vindicta_cli.lib.scheduler import DurationHistory
 from vindicta_cli.models.repo_info import RepoEntry
 
 
@@ -98,6 +99,103 @@ class TestCloneRepos:
 
         assert sum(1 for v in results.values() if v) == 6
 
+    def test_records_clone_durations(
+        self, tmp_path: Path, sample_repos: list[RepoEntry]
+    ):
+        """Successful clone times go into the duration history."""
+        history = DurationHistory(tmp_path)
+
+        with patch("vindicta_cli.lib.repository.GhClient") as mock_gh_cls:
+            mock_gh = mock_gh_cls.return_value
+            mock_gh.clone_repo = AsyncMock(
+                side_effect=[True, ConnectionError("Network error")]
+            )
+
+            asyncio.run(clone_repos(sample_repos, tmp_path, history=history))
+
+        assert history.get("clone", "Vindicta-Core") is not None
+        assert history.get("clone", "Vindicta-API") is None
+
+    def test_clone_modes_passed_to_gh(
+        self, tmp_path: Path, sample_repos: list[RepoEntry]
+    ):
+        """Each repo is cloned with the git flags of its mode."""
+        with patch("vindicta_cli.lib.repository.GhClient") as mock_gh_cls:
+            mock_gh = mock_gh_cls.return_value
+            mock_gh.clone_repo = AsyncMock(return_value=True)
+
+            asyncio.run(
+                clone_repos(
+                    sample_repos,
+                    tmp_path,
+                    clone_modes={"Vindicta-API": "shallow"},
+                    depth=5,
+                )
+            )
+
+        args = {c.args[1].name: c.args[2] for c in mock_gh.clone_repo.call_args_list}
+        assert args == {"Vindicta-Core": [], "Vindicta-API": ["--depth=5"]}
+
+    def test_on_cloned_overlaps_remaining_clones(
+        self, tmp_path: Path, sample_repos: list[RepoEntry]
+    ):
+        """Follow-up work starts as soon as each repo's own clone finishes."""
+        events: list[str] = []
+
+        async def _clone(slug: str, target: Path, git_args: list[str]) -> bool:
+            # Core is slow, API is fast
+            await asyncio.sleep(0.05 if target.name == "Vindicta-Core" else 0)
+            events.append(f"cloned {target.name}")
+            return True
+
+        async def _on_cloned(entry: RepoEntry) -> None:
+            events.append(f"setup {entry.name}")
+
+        with patch("vindicta_cli.lib.repository.GhClient") as mock_gh_cls:
+            mock_gh_cls.return_value.clone_repo = AsyncMock(side_effect=_clone)
+            asyncio.run(clone_repos(sample_repos, tmp_path, on_cloned=_on_cloned))
+
+        assert events == [
+            "cloned Vindicta-API",
+            "setup Vindicta-API",
+            "cloned Vindicta-Core",
+            "setup Vindicta-Core",
+        ]
+
+    def test_on_cloned_includes_existing_not_failed(
+        self, tmp_path: Path, sample_repos: list[RepoEntry]
+    ):
+        """Repos already on disk are handed over too; failed clones are not."""
+        (tmp_path / "Vindicta-Core").mkdir()
+        handed_over: list[RepoEntry] = []
+
+        async def _on_cloned(entry: RepoEntry) -> None:
+            handed_over.append(entry)
+
+        with patch("vindicta_cli.lib.repository.GhClient") as mock_gh_cls:
+            mock_gh_cls.return_value.clone_repo = AsyncMock(
+                side_effect=ConnectionError("Network error")
+            )
+            asyncio.run(clone_repos(sample_repos, tmp_path, on_cloned=_on_cloned))
+
+        assert [e.name for e in handed_over] == ["Vindicta-Core"]
+        assert handed_over[0].present
+        assert handed_over[0].local_path == tmp_path / "Vindicta-Core"
+
+
+class TestCloneArgs:
+    """Tests for clone mode → git clone flags."""
+
+    def test_modes(self):
+        assert clone_args("full") == []
+        assert clone_args("blobless") == ["--filter=blob:none"]
+        assert clone_args("single-branch") == ["--single-branch"]
+        assert clone_args("shallow", depth=3) == ["--depth=3"]
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            clone_args("tiny")
+
 
 class TestDetectRepoType:
     """Tests for detect_repo_type function."""
@@ -0,0 +1,55 @@
+"""Unit tests for versioned JSON state files."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vindicta_cli.lib.json_store import atomic_write_json, load_versioned_json
+
+
+class TestLoadVersionedJson:
+    """Tests for reading versioned state files."""
+
+    def test_round_trip(self, tmp_path: Path):
+        path = tmp_path / ".vindicta" / "state.json"
+        atomic_write_json(path, {"version": 1, "repos": {"Vindicta-Core": 1.5}})
+
+        assert load_versioned_json(path, 1, "repos") == {"Vindicta-Core": 1.5}
+
+    @pytest.mark.parametrize(
+        "content",
+        ["{not json", '{"version": 2, "repos": {}}', "[]", '{"version": 1}'],
+    )
+    def test_unusable_file_is_empty(self, tmp_path: Path, content: str):
+        path = tmp_path / "state.json"
+        path.write_text(content)
+        assert load_versioned_json(path, 1, "repos") == {}
+
+    def test_missing_file_is_empty(self, tmp_path: Path):
+        assert load_versioned_json(tmp_path / "missing.json", 1, "repos") == {}
+
+
+class TestAtomicWriteJson:
+    """Tests for atomic writes."""
+
+    def test_indent(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        atomic_write_json(path, {"version": 1}, indent=2)
+        assert path.read_text() == json.dumps({"version": 1}, indent=2)
+
+    def test_failed_replace_keeps_old_file(self, tmp_path: Path):
+        path = tmp_path / "state.json"
+        atomic_write_json(path, {"version": 1})
+
+        with (
+            patch("vindicta_cli.lib.json_store.os.replace", side_effect=OSError),
+            pytest.raises(OSError),
+        ):
+            atomic_write_json(path, {"version": 2})
+
+        assert json.loads(path.read_text()) == {"version": 1}
+        assert list(tmp_path.iterdir()) == [path]
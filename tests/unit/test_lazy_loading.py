@@ -0,0 +1,121 @@
+"""Unit tests for lazy command and dependency loading.
+
+Imports are checked in a fresh interpreter so modules already loaded
+by other tests don't mask regressions.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+HEAVY_MODULES = ("rich", "yaml", "tenacity")
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the loaded module names."""
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+class TestLazyEntryPoint:
+    """Importing the entry point must not import command modules."""
+
+    def test_main_import_is_light(self):
+        modules = _loaded_modules("import vindicta_cli.main")
+        assert not any(m.startswith("vindicta_cli.cli.dev.") for m in modules)
+        for heavy in HEAVY_MODULES:
+            assert heavy not in modules
+
+    def test_status_json_path_skips_rich(self, tmp_path):
+        (tmp_path / ".vindicta-workspace.yml").write_text("schema_version: '1.0.0'\n")
+        code = (
+            "import os\n"
+            f"os.chdir({str(tmp_path)!r})\n"
+            "from typer.testing import CliRunner\n"
+            "from vindicta_cli.main import app\n"
+            "result = CliRunner().invoke(app, ['dev', 'status', '--json'])\n"
+            "assert result.exit_code == 0, result.output\n"
+        )
+        modules = _loaded_modules(code)
+        assert "vindicta_cli.cli.dev.status_cmd" in modules
+        assert "vindicta_cli.cli.dev.sync_cmd" not in modules
+        # yaml is legitimately needed to read parallel_count from the config
+        assert "rich" not in modules
+        assert "tenacity" not in modules
+
+
+class TestLazyCommandResolution:
+    """Lazy commands still resolve and run through the CLI."""
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "init",
+            "sync",
+            "setup",
+            "status",
+            "validate",
+            "doctor",
+            "clean",
+            "optimize",
+            "bundle",
+            "config",
+        ],
+    )
+    def test_command_resolves(self, command: str):
+        from typer.testing import CliRunner
+
+        from vindicta_cli.main import app
+
+        result = CliRunner().invoke(app, ["dev", command, "--help"])
+        assert result.exit_code == 0
+
+    def test_dev_help_lists_all_commands(self):
+        from typer.testing import CliRunner
+
+        from vindicta_cli.main import app
+
+        result = CliRunner().invoke(app, ["dev", "--help"])
+        assert result.exit_code == 0
+        for command in ("init", "sync", "status", "config"):
+            assert command in result.output
+
+
+class TestRetryIsLazy:
+    """with_retry defers importing tenacity until first call."""
+
+    def test_decorating_does_not_import_tenacity(self):
+        modules = _loaded_modules("import vindicta_cli.lib.gh_client")
+        assert "tenacity" not in modules
+
+    async def test_async_function_still_retries(self):
+        from tenacity import wait_none
+
+        from vindicta_cli.lib.retry import with_retry
+
+        calls = 0
+
+        @with_retry
+        async def flaky() -> str:
+            nonlocal calls
+            calls += 1
+            if calls < 2:
+                raise ConnectionError("blip")
+            return "ok"
+
+        # Skip the 1s backoff; the policy is built on the first call
+        with patch("tenacity.wait_exponential", return_value=wait_none()):
+            assert await flaky() == "ok"
+        assert calls == 2
@@ -0,0 +1,225 @@
+"""Unit tests for local clone sources.
+
+Tests for the mirror store location, creating and refreshing mirrors,
+and cloning from mirrors and existing workspaces against real repos.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tests.conftest import git, requires_git
+from vindicta_cli.lib.mirror import (
+    MIRROR_REFSPEC,
+    clone_from_local,
+    default_mirror_root,
+    is_bare_repo,
+    mirror_path,
+    refresh_mirror,
+)
+from vindicta_cli.lib.repository import clone_repos, has_local_source
+from vindicta_cli.lib.scheduler import DurationHistory
+from vindicta_cli.models.repo_info import RepoEntry
+
+CORE = RepoEntry(
+    name="Vindicta-Core",
+    tier="P0",
+    repo_type="python",
+    github_url="https://github.com/vindicta-platform/Vindicta-Core",
+)
+
+
+def _push_commit(tmp_path: Path, git_remote: Path) -> str:
+    """Push a new commit to main on the remote and return its SHA."""
+    pusher = tmp_path / "pusher"
+    git("clone", "-q", str(git_remote), str(pusher), cwd=tmp_path)
+    (pusher / "new.txt").write_text("new\n")
+    git("add", ".", cwd=pusher)
+    git("commit", "-q", "-m", "new", cwd=pusher)
+    git("push", "-q", "origin", "main", cwd=pusher)
+    return git("rev-parse", "HEAD", cwd=pusher)
+
+
+def _bare_mirror(tmp_path: Path, git_remote: Path) -> Path:
+    mirror = tmp_path / "mirrors" / "Vindicta-Core.git"
+    git("clone", "-q", "--bare", str(git_remote), str(mirror), cwd=tmp_path)
+    git("config", "remote.origin.fetch", MIRROR_REFSPEC, cwd=mirror)
+    return mirror
+
+
+class TestMirrorLocation:
+    """Tests for the mirror store path."""
+
+    def test_env_override(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("VINDICTA_MIRROR_DIR", str(tmp_path))
+        assert default_mirror_root() == tmp_path
+
+    def test_xdg_cache_home(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("VINDICTA_MIRROR_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_mirror_root() == tmp_path / "vindicta" / "mirrors"
+
+    def test_mirror_path_uses_slug(self, tmp_path: Path):
+        assert mirror_path(tmp_path, CORE) == (
+            tmp_path / "vindicta-platform" / "Vindicta-Core.git"
+        )
+
+
+@requires_git
+class TestRefreshMirror:
+    """Tests for creating and updating mirrors."""
+
+    def _fake_gh_clone(self, tmp_path: Path, git_remote: Path):
+        async def _clone(slug: str, target: Path, git_args: list[str]) -> bool:
+            git("clone", "-q", *git_args, str(git_remote), str(target), cwd=tmp_path)
+            return True
+
+        return _clone
+
+    def test_creates_then_refreshes(self, tmp_path: Path, git_remote: Path):
+        root = tmp_path / "mirrors"
+        with patch("vindicta_cli.lib.mirror.GhClient") as mock_gh_cls:
+            mock_gh_cls.return_value.clone_repo = AsyncMock(
+                side_effect=self._fake_gh_clone(tmp_path, git_remote)
+            )
+            mirror = asyncio.run(refresh_mirror(CORE, root))
+            assert is_bare_repo(mirror)
+            assert git("config", "remote.origin.fetch", cwd=mirror) == MIRROR_REFSPEC
+            assert not list(mirror.parent.glob("*.partial"))
+
+            sha = _push_commit(tmp_path, git_remote)
+            asyncio.run(refresh_mirror(CORE, root))
+
+        # Created once, then fetched
+        assert mock_gh_cls.return_value.clone_repo.call_count == 1
+        assert git("rev-parse", "main", cwd=mirror) == sha
+
+    def test_failed_create_leaves_nothing(self, tmp_path: Path):
+        root = tmp_path / "mirrors"
+        with patch("vindicta_cli.lib.mirror.GhClient") as mock_gh_cls:
+            mock_gh_cls.return_value.clone_repo = AsyncMock(
+                side_effect=ConnectionError("Network error")
+            )
+            with pytest.raises(ConnectionError):
+                asyncio.run(refresh_mirror(CORE, root))
+
+        assert not mirror_path(root, CORE).exists()
+
+
+@requires_git
+class TestCloneFromLocal:
+    """Tests for cloning from a mirror or another workspace."""
+
+    def test_from_mirror(self, tmp_path: Path, git_remote: Path):
+        mirror = _bare_mirror(tmp_path, git_remote)
+        target = tmp_path / "ws" / "Vindicta-Core"
+        target.parent.mkdir()
+
+        asyncio.run(clone_from_local(mirror, target))
+
+        assert (target / "README.md").exists()
+        assert git("remote", "get-url", "origin", cwd=target) == str(git_remote)
+        assert git("rev-parse", "--abbrev-ref", "HEAD", cwd=target) == "main"
+        assert git("rev-parse", "origin/main", cwd=target) == git(
+            "rev-parse", "main", cwd=mirror
+        )
+        # Objects are hardlinked, not copied
+        objects = [p for p in (target / ".git" / "objects").rglob("*") if p.is_file()]
+        assert any(p.stat().st_nlink > 1 for p in objects)
+
+    def test_from_workspace_catches_up(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        git("checkout", "-q", "-b", "feature", cwd=git_clone)
+        sha = _push_commit(tmp_path, git_remote)
+        target = tmp_path / "ws" / "Vindicta-Core"
+        target.parent.mkdir()
+
+        asyncio.run(clone_from_local(git_clone, target))
+
+        assert git("remote", "get-url", "origin", cwd=target) == str(git_remote)
+        assert git("rev-parse", "--abbrev-ref", "HEAD", cwd=target) == "main"
+        assert git("rev-parse", "HEAD", cwd=target) == sha
+        assert (target / "new.txt").exists()
+        assert git("branch", "--list", "feature", cwd=target) == ""
+        assert git("rev-parse", "--abbrev-ref", "main@{upstream}", cwd=target) == (
+            "origin/main"
+        )
+
+    def test_source_without_origin(self, tmp_path: Path):
+        source = tmp_path / "source"
+        source.mkdir()
+        git("init", "-q", cwd=source)
+        with pytest.raises(ConnectionError):
+            asyncio.run(clone_from_local(source, tmp_path / "target"))
+
+    def test_git_timeout_is_connection_error(self, tmp_path: Path, git_clone: Path):
+        with (
+            patch(
+                "vindicta_cli.lib.mirror.git_exec.communicate",
+                AsyncMock(side_effect=asyncio.TimeoutError),
+            ),
+            pytest.raises(ConnectionError, match="timed out"),
+        ):
+            asyncio.run(clone_from_local(git_clone, tmp_path / "target"))
+
+
+@requires_git
+class TestCloneReposLocalSources:
+    """Tests for clone_repos with a seed workspace or mirror store."""
+
+    def test_seed_workspace_skips_network(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        seed = tmp_path / "seed-ws"
+        seed.mkdir()
+        git_clone.rename(seed / "Vindicta-Core")
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+
+        history = DurationHistory(workspace)
+        with patch("vindicta_cli.lib.repository.GhClient") as mock_gh_cls:
+            mock_gh_cls.return_value.clone_repo = AsyncMock(return_value=True)
+            results = asyncio.run(
+                clone_repos([CORE], workspace, seed_workspace=seed, history=history)
+            )
+
+        assert results == {"Vindicta-Core": True}
+        mock_gh_cls.return_value.clone_repo.assert_not_called()
+        assert (workspace / "Vindicta-Core" / "README.md").exists()
+        # Local clone times would make LPT ordering treat the repo as tiny
+        assert history.get("clone", "Vindicta-Core") is None
+
+    def test_has_local_source(self, tmp_path: Path, git_clone: Path):
+        seed = tmp_path / "seed-ws"
+        seed.mkdir()
+        git_clone.rename(seed / "Vindicta-Core")
+
+        assert has_local_source("Vindicta-Core", seed_workspace=seed)
+        assert not has_local_source("Vindicta-API", seed_workspace=seed)
+        assert has_local_source("Vindicta-API", mirror_root=tmp_path / "mirrors")
+        assert has_local_source("Vindicta-API", bundled={"Vindicta-API": {}})
+        assert not has_local_source("Vindicta-API")
+
+    def test_local_failure_falls_back_to_network(self, tmp_path: Path):
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+
+        with (
+            patch("vindicta_cli.lib.repository.GhClient") as mock_gh_cls,
+            patch(
+                "vindicta_cli.lib.repository.refresh_mirror",
+                AsyncMock(side_effect=ConnectionError("offline")),
+            ),
+        ):
+            mock_gh_cls.return_value.clone_repo = AsyncMock(return_value=True)
+            results = asyncio.run(
+                clone_repos([CORE], workspace, mirror_root=tmp_path / "mirrors")
+            )
+
+        assert results == {"Vindicta-Core": True}
+        mock_gh_cls.return_value.clone_repo.assert_called_once()
@@ -0,0 +1,128 @@
+"""Unit tests for the optimize service.
+
+Tests for object store stats, the maintenance steps, incremental repack
+batch sizing and parallel execution across repos.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from tests.conftest import git, requires_git
+from vindicta_cli.lib.optimize_service import (
+    STEPS,
+    ObjectStats,
+    OptimizeResult,
+    _repack_batch_size,
+    object_stats,
+    optimize_repo,
+    optimize_repos,
+)
+
+
+def _add_commits(repo: Path, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        (repo / f"file{i}.txt").write_text(f"content {i}\n")
+        git("add", ".", cwd=repo)
+        git("commit", "-q", "-m", f"commit {i}", cwd=repo)
+
+
+@requires_git
+class TestObjectStats:
+    """Tests for reading `git count-objects -v`."""
+
+    def test_counts_loose_objects(self, git_clone: Path):
+        before = object_stats(git_clone)
+        _add_commits(git_clone, 2)
+        after = object_stats(git_clone)
+        assert before is not None and after is not None
+        # Each commit adds a blob, a tree and a commit object
+        assert after.loose_objects == before.loose_objects + 6
+
+    def test_not_a_repository(self, tmp_path: Path):
+        assert object_stats(tmp_path) is None
+
+
+@requires_git
+class TestOptimizeRepo:
+    """Tests for running maintenance on one repository."""
+
+    def test_packs_loose_objects(self, git_clone: Path):
+        _add_commits(git_clone, 3)
+        result = optimize_repo(git_clone, "clone")
+
+        assert result.success, result.message
+        assert result.before.loose_objects >= 9
+        assert result.after.loose_objects == 0
+        assert result.after.packs >= 1
+        assert list(result.timings) == list(STEPS)
+        assert git("rev-parse", "HEAD~3", cwd=git_clone)
+        assert (git_clone / ".git" / "objects" / "info" / "commit-graphs").is_dir()
+
+    def test_not_a_repository(self, tmp_path: Path):
+        result = optimize_repo(tmp_path, "nope")
+        assert not result.success
+        assert "Not a git repository" in result.message
+        assert result.timings == {}
+
+    def test_stops_at_failing_step(self, git_clone: Path):
+        from subprocess import CompletedProcess
+
+        def _fail_prune(args, repo_path, timeout):
+            if args[0] == "prune":
+                return CompletedProcess(args, 1, "", "fatal: boom")
+            return real_run(args, repo_path, timeout)
+
+        from vindicta_cli.lib import optimize_service
+
+        real_run = optimize_service.run_git
+        with patch.object(optimize_service, "run_git", side_effect=_fail_prune):
+            result = optimize_repo(git_clone, "clone")
+
+        assert not result.success
+        assert result.message == "prune failed: fatal: boom"
+        assert list(result.timings) == ["loose-objects", "prune"]
+        assert result.after is not None
+
+
+@requires_git
+class TestRepackBatchSize:
+    """Tests for incremental-repack batch sizing."""
+
+    def test_single_pack_skips(self, git_clone: Path):
+        git("repack", "-a", "-d", "-q", cwd=git_clone)
+        assert _repack_batch_size(git_clone) == 0
+
+    def test_second_largest_plus_one(self, git_clone: Path):
+        pack_dir = git_clone / ".git" / "objects" / "pack"
+        for i in range(2):
+            _add_commits(git_clone, 1, start=i)
+            git("repack", "-d", "-q", cwd=git_clone)
+        sizes = sorted(p.stat().st_size for p in pack_dir.glob("*.pack"))
+        assert len(sizes) >= 2
+        assert _repack_batch_size(git_clone) == sizes[-2] + 1
+
+    def test_not_a_repository(self, tmp_path: Path):
+        assert _repack_batch_size(tmp_path) == 0
+
+
+class TestOptimizeRepos:
+    """Tests for parallel execution."""
+
+    def test_empty(self):
+        assert optimize_repos([]) == []
+
+    def test_results_in_input_order_and_streamed(self):
+        def _fake(path, name, timeout):
+            return OptimizeResult(name=name, success=True, after=ObjectStats())
+
+        streamed: list[str] = []
+        repos = [("a", Path("/a")), ("b", Path("/b")), ("c", Path("/c"))]
+        with patch("vindicta_cli.lib.optimize_service.optimize_repo", _fake):
+            results = optimize_repos(
+                repos, parallel_count=2, on_result=lambda r: streamed.append(r.name)
+            )
+
+        assert [r.name for r in results] == ["a", "b", "c"]
+        assert sorted(streamed) == ["a", "b", "c"]
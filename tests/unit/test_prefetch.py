@@ -0,0 +1,163 @@
+"""Unit tests for background prefetch.
+
+Checked against a local bare repository acting as origin.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from tests.conftest import git, requires_git
+from vindicta_cli.lib.prefetch import (
+    consume_prefetches,
+    fresh_prefetches,
+    load_stamps,
+    prefetch_workspace,
+    stamps_path,
+    used_prefetches,
+)
+from vindicta_cli.lib.sync_service import SyncResult, sync_repos
+
+
+def _push(tmp_path: Path, git_remote: Path, branch: str = "main") -> str:
+    """Commit on `branch` in the seed repo, push it, return the new SHA."""
+    seed = tmp_path / "seed"
+    git("checkout", "-q", "-B", branch, cwd=seed)
+    (seed / f"{branch}-{time.monotonic_ns()}.txt").write_text("x")
+    git("add", ".", cwd=seed)
+    git("commit", "-q", "-m", branch, cwd=seed)
+    git("push", "-q", "-f", str(git_remote), branch, cwd=seed)
+    return git("rev-parse", "HEAD", cwd=seed)
+
+
+class TestStamps:
+    """Tests for prefetch freshness bookkeeping."""
+
+    def test_fresh_and_consumed(self, tmp_path: Path):
+        stamps_path(tmp_path).parent.mkdir(parents=True)
+        stamps_path(tmp_path).write_text(
+            '{"version": 1, "repos": {"New": %f, "Old": 0}}' % time.time()
+        )
+        assert fresh_prefetches(tmp_path, max_age=60) == {"New"}
+        assert fresh_prefetches(tmp_path, max_age=0) == set()
+
+        consume_prefetches(tmp_path, ["New"])
+        assert set(load_stamps(tmp_path)) == {"Old"}
+
+    def test_corrupt_file_means_no_prefetch(self, tmp_path: Path):
+        stamps_path(tmp_path).parent.mkdir(parents=True)
+        stamps_path(tmp_path).write_text("not json")
+        assert fresh_prefetches(tmp_path, max_age=60) == set()
+
+    def test_only_synced_repos_use_their_prefetch(self):
+        results = [
+            SyncResult(name="Synced", success=True, action="fetched"),
+            SyncResult(name="Dirty", success=True, action="skipped"),
+            SyncResult(name="Hung", success=False, action="timed_out"),
+            SyncResult(name="Stale", success=True, action="fetched"),
+        ]
+        fresh = {"Synced", "Dirty", "Hung"}
+        assert used_prefetches(results, fresh) == ["Synced"]
+
+
+@requires_git
+class TestPrefetchWorkspace:
+    """Prefetch downloads without touching remote-tracking refs."""
+
+    def test_writes_prefetch_namespace_only(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        before = git("rev-parse", "origin/main", cwd=git_clone)
+        new_sha = _push(tmp_path, git_remote)
+
+        results = asyncio.run(prefetch_workspace(tmp_path, [("Repo", git_clone)]))
+
+        assert results == {"Repo": True}
+        assert git("rev-parse", "origin/main", cwd=git_clone) == before
+        assert (
+            git("rev-parse", "refs/prefetch/remotes/origin/main", cwd=git_clone)
+            == new_sha
+        )
+        assert fresh_prefetches(tmp_path, max_age=60) == {"Repo"}
+
+    def test_failed_prefetch_not_stamped(self, tmp_path: Path, git_clone: Path):
+        git("remote", "set-url", "origin", "/nonexistent/remote.git", cwd=git_clone)
+
+        results = asyncio.run(prefetch_workspace(tmp_path, [("Repo", git_clone)]))
+
+        assert results == {"Repo": False}
+        assert fresh_prefetches(tmp_path, max_age=60) == set()
+
+    def test_deadline_cancels_slow_prefetches(self, tmp_path: Path):
+        async def _prefetch(path: Path, profile: str, timeout: float) -> bool:
+            if path.name == "Slow":
+                await asyncio.sleep(10)
+            return True
+
+        repos = [("Fast", tmp_path / "Fast"), ("Slow", tmp_path / "Slow")]
+        with patch("vindicta_cli.lib.prefetch.prefetch_repo", side_effect=_prefetch):
+            results = asyncio.run(prefetch_workspace(tmp_path, repos, deadline=0.2))
+
+        assert results == {"Fast": True, "Slow": False}
+        assert fresh_prefetches(tmp_path, max_age=60) == {"Fast"}
+
+    def test_sync_applies_prefetch_without_network(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        new_sha = _push(tmp_path, git_remote)
+        asyncio.run(prefetch_workspace(tmp_path, [("Repo", git_clone)]))
+
+        with patch("vindicta_cli.lib.sync_service._fetch_async") as mock_git:
+            (result,) = asyncio.run(
+                sync_repos([("Repo", git_clone)], prefetched={"Repo"})
+            )
+
+        mock_git.assert_not_called()
+        assert result.action == "fetched"
+        assert result.behind == 1
+        assert "prefetch" in result.timings
+        assert git("rev-parse", "origin/main", cwd=git_clone) == new_sha
+
+    def test_apply_never_deletes_refs(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        _push(tmp_path, git_remote, "feature")
+        git("fetch", "-q", cwd=git_clone)
+        git("push", "-q", str(git_remote), "--delete", "feature", cwd=tmp_path / "seed")
+        asyncio.run(prefetch_workspace(tmp_path, [("Repo", git_clone)]))
+
+        with patch("vindicta_cli.lib.sync_service._fetch_async") as mock_git:
+            asyncio.run(sync_repos([("Repo", git_clone)], prefetched={"Repo"}))
+
+        mock_git.assert_not_called()
+        refs = git("for-each-ref", "--format=%(refname)", "refs/remotes", cwd=git_clone)
+        # Left for the next real fetch to prune
+        assert "refs/remotes/origin/feature" in refs
+
+    def test_tracking_ref_ahead_of_prefetch_not_rewound(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        _push(tmp_path, git_remote)
+        asyncio.run(prefetch_workspace(tmp_path, [("Repo", git_clone)]))
+        # A fetch after the prefetch moves the tracking ref further
+        newest = _push(tmp_path, git_remote)
+        git("fetch", "-q", cwd=git_clone)
+
+        (result,) = asyncio.run(sync_repos([("Repo", git_clone)], prefetched={"Repo"}))
+
+        assert "fetch" in result.timings
+        assert git("rev-parse", "origin/main", cwd=git_clone) == newest
+
+    def test_missing_prefetch_falls_back_to_fetch(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        new_sha = _push(tmp_path, git_remote)
+
+        (result,) = asyncio.run(sync_repos([("Repo", git_clone)], prefetched={"Repo"}))
+
+        assert result.action == "fetched"
+        assert "fetch" in result.timings
+        assert git("rev-parse", "origin/main", cwd=git_clone) == new_sha
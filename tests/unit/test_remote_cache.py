@@ -0,0 +1,211 @@
+"""Unit tests for the remote data cache.
+
+Tests for TTL handling, stale-while-revalidate, auth caching,
+and invalidation.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from vindicta_cli.lib.gh_client import RepoCiSummary
+from vindicta_cli.lib.remote_cache import (
+    RemoteCache,
+    _main,
+    cache_path,
+    cached_check_auth,
+    get_cached_repo_summaries,
+    invalidate_repo_summaries,
+    revalidate_detached,
+    summary_key,
+)
+
+
+class _FakeClient:
+    """Records summary queries and answers with a fixed PR count."""
+
+    def __init__(self, prs: int = 1):
+        self.prs = prs
+        self.calls: list[list[str]] = []
+
+    async def get_repo_summaries(self, repos):
+        self.calls.append(list(repos))
+        return {
+            r: RepoCiSummary(open_pr_count=self.prs, ci_status="passing") for r in repos
+        }
+
+    def check_auth(self):
+        return True
+
+
+def _cache(tmp_path: Path, ttl: float = 300.0) -> RemoteCache:
+    cache = RemoteCache(tmp_path, ttl=ttl)
+    cache.load()
+    return cache
+
+
+class TestGetCachedRepoSummaries:
+    """Tests for cache hits, misses and background revalidation."""
+
+    def test_miss_fetches_and_persists(self, tmp_path: Path):
+        client = _FakeClient()
+        summaries, stale = get_cached_repo_summaries(
+            _cache(tmp_path), ["o/a", "o/b"], client
+        )
+
+        assert stale == []
+        assert client.calls == [["o/a", "o/b"]]
+        assert summaries["o/a"].open_pr_count == 1
+        data = json.loads(cache_path(tmp_path).read_text())
+        assert summary_key("o/a") in data["entries"]
+
+    def test_fresh_hit_skips_github(self, tmp_path: Path):
+        get_cached_repo_summaries(_cache(tmp_path), ["o/a"], _FakeClient())
+        client = _FakeClient()
+        summaries, stale = get_cached_repo_summaries(_cache(tmp_path), ["o/a"], client)
+
+        assert client.calls == []
+        assert stale == []
+        assert summaries["o/a"].ci_status == "passing"
+
+    def test_stale_entry_served_then_revalidated(self, tmp_path: Path):
+        get_cached_repo_summaries(_cache(tmp_path), ["o/a"], _FakeClient(prs=1))
+
+        client = _FakeClient(prs=7)
+        with patch(
+            "vindicta_cli.lib.remote_cache.time.time", return_value=time.time() + 600
+        ):
+            summaries, stale = get_cached_repo_summaries(
+                _cache(tmp_path), ["o/a"], client
+            )
+        # Stale value is returned without waiting on GitHub
+        assert summaries["o/a"].open_pr_count == 1
+        assert client.calls == []
+        assert stale == ["o/a"]
+
+        # What the detached process runs
+        with patch("vindicta_cli.lib.remote_cache.GhClient", return_value=client):
+            _main([str(tmp_path), *stale])
+
+        summaries, _ = get_cached_repo_summaries(
+            _cache(tmp_path), ["o/a"], _FakeClient()
+        )
+        assert summaries["o/a"].open_pr_count == 7
+
+    def test_detached_refresh_uses_configured_ttl(self, tmp_path: Path):
+        from vindicta_cli.lib.workspace import CONFIG_FILENAME
+
+        (tmp_path / CONFIG_FILENAME).write_text(
+            "schema_version: '1.0.0'\nremote_cache_ttl: 0\n"
+        )
+        client = _FakeClient()
+        with patch("vindicta_cli.lib.remote_cache.GhClient", return_value=client):
+            _main([str(tmp_path), "o/a"])
+
+        # A disabled cache is never written
+        assert client.calls == [["o/a"]]
+        assert not cache_path(tmp_path).exists()
+
+    def test_revalidate_detached_does_not_wait(self, tmp_path: Path):
+        with patch("vindicta_cli.lib.remote_cache.subprocess.Popen") as mock_popen:
+            revalidate_detached(tmp_path, ["o/a", "o/b"])
+            revalidate_detached(tmp_path, [])
+
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args.args[0]
+        assert args[1:] == [
+            "-m",
+            "vindicta_cli.lib.remote_cache",
+            str(tmp_path),
+            "o/a",
+            "o/b",
+        ]
+        assert mock_popen.call_args.kwargs["start_new_session"] is True
+        mock_popen.return_value.wait.assert_not_called()
+
+    def test_malformed_entry_is_a_miss(self, tmp_path: Path):
+        cache = _cache(tmp_path)
+        cache.put(summary_key("o/a"), {"open_prs": 3})
+        cache.save()
+
+        client = _FakeClient(prs=2)
+        summaries, stale = get_cached_repo_summaries(_cache(tmp_path), ["o/a"], client)
+
+        assert client.calls == [["o/a"]]
+        assert summaries["o/a"].open_pr_count == 2
+        assert stale == []
+
+    def test_too_stale_entry_fetched_in_foreground(self, tmp_path: Path):
+        get_cached_repo_summaries(_cache(tmp_path), ["o/a"], _FakeClient())
+        client = _FakeClient(prs=3)
+        with patch(
+            "vindicta_cli.lib.remote_cache.time.time",
+            return_value=time.time() + 3 * 86400,
+        ):
+            summaries, stale = get_cached_repo_summaries(
+                _cache(tmp_path), ["o/a"], client
+            )
+        assert stale == []
+        assert summaries["o/a"].open_pr_count == 3
+
+    def test_refresh_and_zero_ttl_bypass_cache(self, tmp_path: Path):
+        get_cached_repo_summaries(_cache(tmp_path), ["o/a"], _FakeClient())
+        client = _FakeClient()
+        get_cached_repo_summaries(_cache(tmp_path), ["o/a"], client, refresh=True)
+        get_cached_repo_summaries(_cache(tmp_path, ttl=0), ["o/a"], client)
+        assert client.calls == [["o/a"], ["o/a"]]
+
+    def test_invalidate_without_entries_skips_write(self, tmp_path: Path):
+        invalidate_repo_summaries(tmp_path, [])
+        invalidate_repo_summaries(tmp_path, ["o/a"])
+        assert not cache_path(tmp_path).exists()
+
+    def test_invalidate_forces_refetch(self, tmp_path: Path):
+        get_cached_repo_summaries(_cache(tmp_path), ["o/a", "o/b"], _FakeClient())
+        invalidate_repo_summaries(tmp_path, ["o/a"])
+
+        client = _FakeClient()
+        get_cached_repo_summaries(_cache(tmp_path), ["o/a", "o/b"], client)
+        assert client.calls == [["o/a"]]
+
+
+class TestRemoteCache:
+    """Tests for the cache file itself."""
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path):
+        cache_path(tmp_path).parent.mkdir(parents=True)
+        cache_path(tmp_path).write_text("{oops")
+        assert _cache(tmp_path).get("x") is None
+
+    def test_save_merges_concurrent_writers(self, tmp_path: Path):
+        first, second = _cache(tmp_path), _cache(tmp_path)
+        first.put("a", 1)
+        second.put("b", 2)
+        first.save()
+        second.save()
+        merged = _cache(tmp_path)
+        assert merged.get("a")[0] == 1
+        assert merged.get("b")[0] == 2
+
+
+class TestCachedCheckAuth:
+    """Tests for auth state caching."""
+
+    def test_success_is_cached(self, tmp_path: Path):
+        cache = _cache(tmp_path)
+        client = MagicMock()
+        client.check_auth.return_value = True
+        assert cached_check_auth(cache, client) is True
+        assert cached_check_auth(cache, client) is True
+        assert client.check_auth.call_count == 1
+
+    def test_failure_is_not_cached(self, tmp_path: Path):
+        cache = _cache(tmp_path)
+        client = MagicMock()
+        client.check_auth.return_value = False
+        cached_check_auth(cache, client)
+        cached_check_auth(cache, client)
+        assert client.check_auth.call_count == 2
@@ -72,6 +72,17 @@ class TestRepoEntry:
             )
             assert entry.repo_type == rt
 
+    def test_slug_from_github_url(self):
+        from vindicta_cli.models.repo_info import RepoEntry
+
+        entry = RepoEntry(
+            name="Vindicta-Status",
+            tier="P3",
+            repo_type="python",
+            github_url="https://github.com/vindicta-platform/Vindicta-Status.git",
+        )
+        assert entry.slug == "vindicta-platform/Vindicta-Status"
+
 
 class TestRepoInfo:
     """Test RepoInfo runtime state dataclass."""
@@ -0,0 +1,116 @@
+"""Unit tests for makespan-aware repo scheduling."""
+
+from pathlib import Path
+
+from vindicta_cli.lib.scheduler import DurationHistory, estimate, schedule
+from vindicta_cli.lib.sync_history import summarize, typical
+from vindicta_cli.models.repo_info import RepoEntry
+
+
+def _entry(name: str, tier: str = "P0", path: Path | None = None) -> RepoEntry:
+    return RepoEntry(
+        name=name,
+        tier=tier,
+        repo_type="python",
+        github_url=f"https://github.com/vindicta-platform/{name}.git",
+        local_path=path,
+        present=path is not None,
+    )
+
+
+def _with_pack(path: Path, size: int) -> Path:
+    pack_dir = path / ".git" / "objects" / "pack"
+    pack_dir.mkdir(parents=True)
+    (pack_dir / "pack-1.pack").write_bytes(b"\0" * size)
+    return path
+
+
+class TestDurationHistory:
+    """Tests for persisted duration history."""
+
+    def test_round_trip(self, tmp_path: Path):
+        history = DurationHistory(tmp_path)
+        history.record("sync", "RepoA", 4.0)
+        history.save()
+
+        loaded = DurationHistory(tmp_path)
+        loaded.load()
+        assert loaded.get("sync", "RepoA") == 4.0
+        assert loaded.get("clone", "RepoA") is None
+
+    def test_smooths_repeated_runs(self, tmp_path: Path):
+        history = DurationHistory(tmp_path)
+        history.record("sync", "RepoA", 4.0)
+        history.record("sync", "RepoA", 8.0)
+        assert history.get("sync", "RepoA") == 6.0
+
+    def test_ignores_corrupt_file(self, tmp_path: Path):
+        history = DurationHistory(tmp_path)
+        history.path.parent.mkdir(parents=True)
+        history.path.write_text("{not json")
+        history.load()
+        assert history.get("sync", "RepoA") is None
+
+    def test_durations_for_one_operation(self, tmp_path: Path):
+        history = DurationHistory(tmp_path)
+        history.record("clone", "RepoA", 4.0)
+        history.record("sync", "RepoB", 1.0)
+        assert history.durations("clone") == {"RepoA": 4.0}
+
+
+class TestSchedule:
+    """Tests for longest-first ordering."""
+
+    def test_slowest_history_first(self):
+        entries = [_entry("Fast"), _entry("Slow")]
+
+        ordered = schedule(entries, {"Fast": 1.0, "Slow": 30.0})
+
+        assert [e.name for e in ordered] == ["Slow", "Fast"]
+
+    def test_tier_breaks_ties(self):
+        entries = [_entry("Low", "P3"), _entry("Core", "P0"), _entry("Mid", "P1")]
+
+        ordered = schedule(entries)
+
+        assert [e.name for e in ordered] == ["Core", "Mid", "Low"]
+
+    def test_falls_back_to_pack_size(self, tmp_path: Path):
+        small = _with_pack(tmp_path / "Small", 1024)
+        big = _with_pack(tmp_path / "Big", 1024 * 1024)
+        entries = [_entry("Small", "P0", small), _entry("Big", "P3", big)]
+
+        ordered = schedule(entries, {})
+
+        assert [e.name for e in ordered] == ["Big", "Small"]
+
+    def test_remote_size_orders_first_clone(self):
+        """A fresh init has neither history nor packs."""
+        entries = [_entry("Small", "P0"), _entry("Big", "P3")]
+
+        ordered = schedule(entries, {}, {"Small": 1024, "Big": 500 * 1024 * 1024})
+
+        assert [e.name for e in ordered] == ["Big", "Small"]
+
+    def test_history_wins_over_size(self):
+        entry = _entry("Repo")
+        assert estimate(entry, {"Repo": 3.0}, {"Repo": 10**12}) == 3.0
+
+    def test_unknown_repo_estimates_zero(self):
+        assert estimate(_entry("Missing")) == 0.0
+
+
+class TestSyncDurations:
+    """Sync is scheduled from the sync history."""
+
+    def test_typical_total_per_repo(self):
+        runs = [
+            {"repos": {"Big": {"total": 30.0}, "Small": {"total": 1.0}}},
+            {"repos": {"Big": {"total": 20.0}, "Small": {"dirty": 0.1}}},
+        ]
+
+        durations = typical(summarize(runs), "total")
+
+        assert durations == {"Big": 20.0, "Small": 1.0}
+        ordered = schedule([_entry("Small"), _entry("Big")], durations)
+        assert [e.name for e in ordered] == ["Big", "Small"]
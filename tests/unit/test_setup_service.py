@@ -3,17 +3,23 @@
 Tests for venv creation, Python deps, Node deps, and hook installation.
 """
 
+import asyncio
 import subprocess
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from vindicta_cli.lib.init_journal import InitJournal
 from vindicta_cli.lib.setup_service import (
+    SetupStage,
     _create_venv,
     _install_hooks,
     _install_node_deps,
     _install_python_deps,
     setup_repo,
 )
+from vindicta_cli.models.repo_info import RepoEntry
 
 
 class TestSetupRepo:
@@ -52,6 +58,20 @@ class TestSetupRepo:
         assert "venv" not in results
         assert "hooks" not in results
 
+    def test_git_tuning_step(self, tmp_path: Path):
+        """Git tuning runs by default and can be skipped."""
+        with patch(
+            "vindicta_cli.lib.setup_service.enable_tuning", return_value=True
+        ) as mock_enable:
+            results = setup_repo(tmp_path, repo_type="nodejs", skip_hooks=True)
+            skipped = setup_repo(
+                tmp_path, repo_type="nodejs", skip_hooks=True, skip_git_tuning=True
+            )
+
+        assert results["git_tuning"] is True
+        assert "git_tuning" not in skipped
+        mock_enable.assert_called_once_with(tmp_path)
+
     def test_mixed_repo_runs_both(self, tmp_path: Path):
         """Mixed repo runs Python + Node deps."""
         (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
@@ -65,6 +85,129 @@ class TestSetupRepo:
         assert "python_deps" in results
         assert "node_deps" in results
 
+    def test_done_steps_skipped(self, tmp_path: Path):
+        """Steps done on an earlier run are not repeated or reported."""
+        steps: list[tuple[str, bool]] = []
+        with (
+            patch("vindicta_cli.lib.setup_service._create_venv") as mock_venv,
+            patch(
+                "vindicta_cli.lib.setup_service._install_python_deps",
+                return_value=False,
+            ),
+        ):
+            results = setup_repo(
+                tmp_path,
+                repo_type="python",
+                skip_hooks=True,
+                skip_git_tuning=True,
+                done={"venv"},
+                on_step=lambda step, ok: steps.append((step, ok)),
+            )
+
+        mock_venv.assert_not_called()
+        assert results == {"python_deps": False}
+        assert steps == [("python_deps", False)]
+
+
+class TestSetupStage:
+    """Tests for the pipelined setup stage."""
+
+    def _entry(self, tmp_path: Path, name: str) -> RepoEntry:
+        return RepoEntry(
+            name=name,
+            tier="P0",
+            repo_type="python",
+            github_url=f"https://github.com/vindicta-platform/{name}",
+            local_path=tmp_path / name,
+            present=True,
+        )
+
+    def test_records_results_and_progress(self, tmp_path: Path):
+        progress: list[tuple[str, str]] = []
+        stage = SetupStage(
+            1, on_progress=lambda n, s: progress.append((n, s)), skip_hooks=True
+        )
+        with patch(
+            "vindicta_cli.lib.setup_service.setup_repo",
+            return_value={"venv": True, "python_deps": False},
+        ) as mock_setup:
+            asyncio.run(stage(self._entry(tmp_path, "Vindicta-Core")))
+
+        mock_setup.assert_called_once_with(
+            tmp_path / "Vindicta-Core", "python", done=(), on_step=None, skip_hooks=True
+        )
+        assert stage.results == {"Vindicta-Core": {"venv": True, "python_deps": False}}
+        assert progress == [
+            ("Vindicta-Core", "setting up..."),
+            ("Vindicta-Core", "✗ setup failed: python_deps"),
+        ]
+
+    def test_concurrency_limit(self, tmp_path: Path):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _setup(path, repo_type, **options):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return {"venv": True}
+
+        stage = SetupStage(2)
+
+        async def _run():
+            entries = [self._entry(tmp_path, f"Repo-{i}") for i in range(5)]
+            await asyncio.gather(*(stage(e) for e in entries))
+
+        with patch("vindicta_cli.lib.setup_service.setup_repo", side_effect=_setup):
+            asyncio.run(_run())
+
+        assert peak == 2
+        assert len(stage.results) == 5
+
+    def test_exception_recorded_as_failure(self, tmp_path: Path):
+        stage = SetupStage(1)
+        with patch(
+            "vindicta_cli.lib.setup_service.setup_repo",
+            side_effect=OSError("disk full"),
+        ):
+            asyncio.run(stage(self._entry(tmp_path, "Vindicta-Core")))
+
+        assert stage.results == {"Vindicta-Core": {"setup": False}}
+
+    def test_journal_resumes_failed_steps(self, tmp_path: Path):
+        journal = InitJournal(tmp_path)
+        entry = self._entry(tmp_path, "Vindicta-Core")
+        options = {"skip_hooks": True, "skip_git_tuning": True}
+
+        with (
+            patch("vindicta_cli.lib.setup_service._create_venv", return_value=True),
+            patch(
+                "vindicta_cli.lib.setup_service._install_python_deps",
+                return_value=False,
+            ),
+        ):
+            asyncio.run(SetupStage(1, journal=journal, **options)(entry))
+        assert journal.stages("Vindicta-Core") == {"venv"}
+
+        with (
+            patch("vindicta_cli.lib.setup_service._create_venv") as mock_venv,
+            patch(
+                "vindicta_cli.lib.setup_service._install_python_deps",
+                return_value=True,
+            ),
+        ):
+            stage = SetupStage(1, journal=journal, **options)
+            asyncio.run(stage(entry))
+
+        mock_venv.assert_not_called()
+        assert stage.results == {"Vindicta-Core": {"python_deps": True}}
+        assert journal.stages("Vindicta-Core") == {"venv", "python_deps"}
+
 
 class TestCreateVenv:
     """Tests for _create_venv helper."""
@@ -0,0 +1,251 @@
+"""Unit tests for the persistent status cache.
+
+Tests for fingerprinting, hit/miss decisions, TTL expiry, and
+resilience against corrupt cache files.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tests.conftest import git, requires_git
+from vindicta_cli.lib.status_cache import (
+    RepoStateTracker,
+    cache_path,
+    collect_cached_repo_infos,
+    git_fingerprint,
+)
+from vindicta_cli.models.repo_info import RepoEntry, RepoInfo
+
+
+def _fake_info(repo_path: Path, entry: RepoEntry, deadline: float = 0) -> RepoInfo:
+    return RepoInfo(
+        name=entry.name,
+        tier=entry.tier,
+        repo_type=entry.repo_type,
+        local_path=repo_path,
+        current_branch="main",
+    )
+
+
+@pytest.fixture
+def entries(tmp_path: Path) -> list[RepoEntry]:
+    """Two present repos with minimal git metadata."""
+    result = []
+    for name in ("Vindicta-Core", "Vindicta-API"):
+        git_dir = tmp_path / name / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        result.append(
+            RepoEntry(
+                name=name,
+                tier="P0",
+                repo_type="python",
+                github_url=f"https://github.com/org/{name}.git",
+                local_path=tmp_path / name,
+                present=True,
+            )
+        )
+    return result
+
+
+def _collect(tmp_path: Path, entries: list[RepoEntry], **kwargs):
+    with patch(
+        "vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info
+    ) as mock_info:
+        infos = collect_cached_repo_infos(tmp_path, entries, **kwargs)
+    return infos, mock_info.call_count
+
+
+class TestCollectCachedRepoInfos:
+    """Tests for cache hits and misses."""
+
+    def test_second_run_is_served_from_cache(self, tmp_path, entries):
+        _, first = _collect(tmp_path, entries)
+        infos, second = _collect(tmp_path, entries)
+
+        assert (first, second) == (2, 0)
+        assert [i.name for i in infos] == ["Vindicta-Core", "Vindicta-API"]
+        assert isinstance(infos[0].local_path, Path)
+
+    def test_index_change_recomputes_only_that_repo(self, tmp_path, entries):
+        _collect(tmp_path, entries)
+        (entries[1].local_path / ".git" / "index").write_bytes(b"changed")
+        _, calls = _collect(tmp_path, entries)
+        assert calls == 1
+
+    def test_change_during_compute_is_not_cached(self, tmp_path, entries):
+        def _info_then_edit(repo_path: Path, entry: RepoEntry, deadline: float = 0):
+            info = _fake_info(repo_path, entry)
+            # Lands after status read the repo but before the result is cached
+            (repo_path / ".git" / "HEAD").write_text("ref: refs/heads/feat\n")
+            return info
+
+        with patch(
+            "vindicta_cli.lib.workspace.get_repo_info", side_effect=_info_then_edit
+        ):
+            collect_cached_repo_infos(tmp_path, entries)
+        _, calls = _collect(tmp_path, entries)
+
+        assert calls == 2
+
+    def test_new_loose_ref_invalidates(self, tmp_path, entries):
+        _collect(tmp_path, entries)
+        (entries[0].local_path / ".git" / "refs" / "heads" / "feat").write_text("x")
+        _, calls = _collect(tmp_path, entries)
+        assert calls == 1
+
+    def test_refresh_bypasses_cache(self, tmp_path, entries):
+        _collect(tmp_path, entries)
+        _, calls = _collect(tmp_path, entries, refresh=True)
+        assert calls == 2
+
+    def test_expired_entries_recomputed(self, tmp_path, entries):
+        _collect(tmp_path, entries)
+        with patch("vindicta_cli.lib.status_cache.time.time", return_value=1e12):
+            _, calls = _collect(tmp_path, entries)
+        assert calls == 2
+
+    def test_zero_ttl_disables_cache(self, tmp_path, entries):
+        _collect(tmp_path, entries, ttl=0)
+        assert not cache_path(tmp_path).exists()
+        _, calls = _collect(tmp_path, entries, ttl=0)
+        assert calls == 2
+
+    def test_partial_run_keeps_other_entries(self, tmp_path, entries):
+        _collect(tmp_path, entries)
+        _collect(tmp_path, entries[:1], refresh=True)
+        _, calls = _collect(tmp_path, entries)
+        assert calls == 0
+
+    def test_on_result_streams_hits_and_misses(self, tmp_path, entries):
+        _collect(tmp_path, entries[:1])
+        seen = []
+        infos, calls = _collect(tmp_path, entries, on_result=seen.append)
+
+        assert calls == 1
+        assert [i.name for i in seen] == ["Vindicta-Core", "Vindicta-API"]
+        assert infos == []
+        # Streamed misses are still cached
+        _, calls = _collect(tmp_path, entries)
+        assert calls == 0
+
+    @pytest.mark.parametrize("content", ["{not json", '{"version": 999}', "[]"])
+    def test_unusable_cache_is_ignored(self, tmp_path, entries, content):
+        cache_path(tmp_path).parent.mkdir(parents=True)
+        cache_path(tmp_path).write_text(content)
+        _, calls = _collect(tmp_path, entries)
+        assert calls == 2
+        assert json.loads(cache_path(tmp_path).read_text())["version"] == 1
+
+
+class TestRepoStateTracker:
+    """Tests for the in-memory tracker used by the daemon and --watch."""
+
+    def test_only_changed_repos_recomputed(self, entries):
+        tracker = RepoStateTracker()
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            assert tracker.refresh(entries) == ["Vindicta-Core", "Vindicta-API"]
+            assert tracker.refresh(entries) == []
+            (entries[0].local_path / ".git" / "HEAD").write_text("ref: refs/heads/x\n")
+            assert tracker.refresh(entries) == ["Vindicta-Core"]
+
+    def test_removed_repos_are_forgotten(self, entries):
+        tracker = RepoStateTracker()
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            tracker.refresh(entries)
+            tracker.refresh(entries[:1])
+        assert list(tracker.infos) == ["Vindicta-Core"]
+
+    @requires_git
+    def test_worktree_edit_recomputed(self, git_clone: Path):
+        entry = RepoEntry(
+            name="Vindicta-Core",
+            tier="P0",
+            repo_type="python",
+            github_url="https://github.com/org/Vindicta-Core.git",
+            local_path=git_clone,
+            present=True,
+        )
+        # Files written in the same second as the index are "racy" and make
+        # git rewrite the index on every status; age them like a real clone
+        past = time.time() - 60
+        for path in git("ls-files", cwd=git_clone).splitlines():
+            os.utime(git_clone / path, (past, past))
+        tracker = RepoStateTracker()
+        tracker.refresh([entry])
+        # git status refreshes the index once; then the repo is settled
+        tracker.refresh([entry])
+        assert tracker.refresh([entry]) == []
+
+        (git_clone / "README.md").write_text("edited\n")
+
+        assert tracker.refresh([entry]) == ["Vindicta-Core"]
+        assert tracker.infos["Vindicta-Core"].is_dirty
+
+    def test_invalidate(self, entries):
+        tracker = RepoStateTracker()
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=_fake_info):
+            tracker.refresh(entries)
+            tracker.invalidate(["Vindicta-API"])
+            assert tracker.refresh(entries) == ["Vindicta-API"]
+
+
+@requires_git
+class TestGitFingerprint:
+    """Fingerprints track real git operations."""
+
+    def test_stable_without_changes(self, git_clone: Path):
+        assert git_fingerprint(git_clone) == git_fingerprint(git_clone)
+
+    def test_commit_changes_fingerprint(self, git_clone: Path):
+        before = git_fingerprint(git_clone)
+        (git_clone / "new.txt").write_text("x")
+        git("add", "new.txt", cwd=git_clone)
+        git("commit", "-q", "-m", "change", cwd=git_clone)
+        assert git_fingerprint(git_clone) != before
+
+    def test_branch_switch_changes_fingerprint(self, git_clone: Path):
+        before = git_fingerprint(git_clone)
+        git("checkout", "-q", "-b", "other", cwd=git_clone)
+        assert git_fingerprint(git_clone) != before
+
+    def test_tracked_file_edits_change_fingerprint(self, git_clone: Path):
+        (git_clone / "sub").mkdir()
+        (git_clone / "sub" / "x.txt").write_text("x\n")
+        git("add", ".", cwd=git_clone)
+        git("commit", "-q", "-m", "sub", cwd=git_clone)
+        git("status", "--porcelain", cwd=git_clone)
+        clean = git_fingerprint(git_clone)
+
+        (git_clone / "sub" / "x.txt").write_text("y\n")
+        first_edit = git_fingerprint(git_clone)
+        assert first_edit != clean
+
+        # A dirty file keeps changing the fingerprint on each edit
+        (git_clone / "sub" / "x.txt").write_text("z\n")
+        assert git_fingerprint(git_clone) != first_edit
+
+    def test_deleted_file_changes_fingerprint(self, git_clone: Path):
+        before = git_fingerprint(git_clone)
+        (git_clone / "README.md").unlink()
+        assert git_fingerprint(git_clone) != before
+
+    def test_new_file_in_tracked_directory(self, git_clone: Path):
+        (git_clone / "sub").mkdir()
+        (git_clone / "sub" / "x.txt").write_text("x\n")
+        git("add", ".", cwd=git_clone)
+        git("commit", "-q", "-m", "sub", cwd=git_clone)
+        before = git_fingerprint(git_clone)
+        (git_clone / "sub" / "untracked.txt").write_text("new\n")
+        assert git_fingerprint(git_clone) != before
+
+    def test_unreadable_index_is_never_cached(self, git_clone: Path):
+        (git_clone / ".git" / "index").write_bytes(b"garbage")
+        assert git_fingerprint(git_clone) != git_fingerprint(git_clone)
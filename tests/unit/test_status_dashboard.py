@@ -4,8 +4,16 @@ Tests for tier grouping, health indicators, filtering, JSON output.
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
-from vindicta_cli.models.repo_info import RepoInfo
+import pytest
+from typer.testing import CliRunner
+
+from vindicta_cli.lib.workspace import CONFIG_FILENAME
+from vindicta_cli.main import app
+from vindicta_cli.models.repo_info import RepoEntry, RepoInfo
+
+runner = CliRunner()
 
 
 class TestRepoInfoStatusProperties:
@@ -98,3 +106,127 @@ class TestRepoInfoStatusProperties:
         assert "Clean" not in names
         assert "Dirty" in names
         assert "OffDefault" in names
+
+
+class TestStatusWatch:
+    """Tests for `status --watch`."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path: Path, monkeypatch) -> Path:
+        (tmp_path / CONFIG_FILENAME).write_text("schema_version: '1.0.0'\n")
+        for name in ("Vindicta-Core", "Vindicta-API"):
+            git_dir = tmp_path / name / ".git"
+            git_dir.mkdir(parents=True)
+            (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    @staticmethod
+    def _fake_info(repo_path: Path, entry: RepoEntry, deadline: float = 0):
+        return RepoInfo(
+            name=entry.name,
+            tier=entry.tier,
+            repo_type=entry.repo_type,
+            local_path=repo_path,
+        )
+
+    def test_rejects_json(self, workspace: Path):
+        result = runner.invoke(app, ["dev", "status", "--watch", "--json"])
+        assert result.exit_code == 2
+
+    def test_polls_and_refreshes_only_changed_rows(self, workspace: Path):
+        polls = []
+
+        def _sleep(seconds: float) -> None:
+            polls.append(seconds)
+            if len(polls) == 1:
+                head = workspace / "Vindicta-API" / ".git" / "HEAD"
+                head.write_text("ref: refs/heads/other\n")
+            elif len(polls) == 3:
+                raise KeyboardInterrupt
+
+        with (
+            patch("vindicta_cli.cli.dev.status_cmd.time.sleep", side_effect=_sleep),
+            patch(
+                "vindicta_cli.lib.workspace.get_repo_info",
+                side_effect=self._fake_info,
+            ) as mock_info,
+        ):
+            result = runner.invoke(
+                app, ["dev", "status", "--watch", "--interval", "0.5"]
+            )
+
+        assert result.exit_code == 0
+        assert polls == [0.5, 0.5, 0.5]
+        # Two initial rows, then one for the changed repo, then nothing
+        assert [c.args[1].name for c in mock_info.call_args_list] == [
+            "Vindicta-Core",
+            "Vindicta-API",
+            "Vindicta-API",
+        ]
+        assert "Vindicta-Core" in result.output
+
+
+class TestStatusCi:
+    """Tests for `status --ci`."""
+
+    def test_json_includes_batched_ci_state(self, tmp_path: Path, monkeypatch):
+        import json
+
+        from vindicta_cli.lib.gh_client import GhClient, RepoCiSummary
+
+        (tmp_path / CONFIG_FILENAME).write_text("schema_version: '1.0.0'\n")
+        (tmp_path / "Vindicta-Core" / ".git").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+
+        async def _summaries(self, repos, batch_size=25):
+            return {
+                repo: RepoCiSummary(open_pr_count=4, ci_status="failing")
+                for repo in repos
+            }
+
+        with (
+            patch(
+                "vindicta_cli.lib.workspace.get_repo_info",
+                side_effect=TestStatusWatch._fake_info,
+            ),
+            patch.object(GhClient, "check_auth", return_value=True),
+            patch.object(
+                GhClient, "get_repo_summaries", autospec=True, side_effect=_summaries
+            ) as mock_summaries,
+        ):
+            result = runner.invoke(
+                app, ["dev", "status", "--ci", "--json", "--no-daemon"]
+            )
+
+        assert result.exit_code == 0
+        mock_summaries.assert_called_once()
+        assert mock_summaries.call_args.args[1] == ["vindicta-platform/Vindicta-Core"]
+        data = json.loads(result.output)
+        assert data[0]["ci_status"] == "failing"
+        assert data[0]["open_prs"] == 4
+
+
+class TestStatusNdjson:
+    """Tests for `status --ndjson`."""
+
+    def test_streams_compact_records(self, tmp_path: Path, monkeypatch):
+        import json
+
+        (tmp_path / CONFIG_FILENAME).write_text("schema_version: '1.0.0'\n")
+        for name in ("Vindicta-Core", "Vindicta-Web"):
+            (tmp_path / name / ".git").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+
+        with patch(
+            "vindicta_cli.lib.workspace.get_repo_info",
+            side_effect=TestStatusWatch._fake_info,
+        ):
+            result = runner.invoke(app, ["dev", "status", "--ndjson", "--no-daemon"])
+
+        assert result.exit_code == 0
+        lines = result.output.strip().splitlines()
+        assert len(lines) == 2
+        records = [json.loads(line) for line in lines]
+        assert {r["name"] for r in records} == {"Vindicta-Core", "Vindicta-Web"}
+        assert all(": " not in line for line in lines)
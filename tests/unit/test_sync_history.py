@@ -0,0 +1,74 @@
+"""Unit tests for sync timing history."""
+
+from pathlib import Path
+
+from vindicta_cli.lib import sync_history
+from vindicta_cli.lib.sync_history import (
+    append_run,
+    history_path,
+    load_runs,
+    percentile,
+    summarize,
+)
+from vindicta_cli.lib.sync_service import SyncResult
+
+
+def _result(name: str, total: float, action: str = "fetched") -> SyncResult:
+    return SyncResult(
+        name=name,
+        success=True,
+        action=action,
+        timings={"fetch": total / 2, "total": total},
+    )
+
+
+class TestAppendRun:
+    """Tests for recording runs."""
+
+    def test_appends_one_line_per_run(self, tmp_path: Path):
+        append_run(tmp_path, [_result("RepoA", 1.0)])
+        append_run(tmp_path, [_result("RepoA", 3.0)])
+
+        runs = load_runs(tmp_path)
+        assert len(runs) == 2
+        assert runs[1]["repos"]["RepoA"]["total"] == 3.0
+
+    def test_skipped_repos_not_recorded(self, tmp_path: Path):
+        append_run(tmp_path, [_result("Dirty", 0.1, action="skipped")])
+        assert not history_path(tmp_path).exists()
+
+    def test_ignores_corrupt_lines(self, tmp_path: Path):
+        append_run(tmp_path, [_result("RepoA", 1.0)])
+        with history_path(tmp_path).open("a") as f:
+            f.write("{truncated\n")
+        append_run(tmp_path, [_result("RepoA", 2.0)])
+
+        assert len(load_runs(tmp_path)) == 2
+
+    def test_trims_old_runs(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(sync_history, "MAX_RUNS", 3)
+        for i in range(7):
+            append_run(tmp_path, [_result("RepoA", float(i))])
+
+        runs = load_runs(tmp_path)
+        assert len(runs) <= 6
+        assert runs[-1]["repos"]["RepoA"]["total"] == 6.0
+
+
+class TestSummarize:
+    """Tests for p50/p95 aggregation."""
+
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 21)]
+        assert percentile(values, 50) == 10.0
+        assert percentile(values, 95) == 19.0
+        assert percentile([4.0], 95) == 4.0
+
+    def test_per_repo_phase_stats(self, tmp_path: Path):
+        for total in (1.0, 2.0, 10.0):
+            append_run(tmp_path, [_result("RepoA", total), _result("RepoB", 0.5)])
+
+        summary = summarize(load_runs(tmp_path))
+
+        assert summary["RepoA"]["total"] == {"p50": 2.0, "p95": 10.0, "runs": 3}
+        assert summary["RepoB"]["fetch"]["p50"] == 0.25
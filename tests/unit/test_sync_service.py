@@ -4,12 +4,24 @@ Tests for parallel fetch, dirty skip, auto-pull, timeout, force flag.
 """
 
 import asyncio
+import os
+import sys
+import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
+import pytest
+
+from tests.conftest import git, requires_git
 from vindicta_cli.lib.sync_service import (
+    _OWN_PROCESS_GROUP,
     _check_dirty,
+    _fetch_async,
+    _fetch_command,
     _get_ahead_behind,
+    _git_output,
+    _is_transport_error,
+    _remote_unchanged,
     sync_repos,
 )
 
@@ -28,18 +40,36 @@ class TestSyncRepos:
 
         with (
             patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
-            patch("vindicta_cli.lib.sync_service._run_git_async") as mock_git,
+            patch("vindicta_cli.lib.sync_service._fetch_async") as mock_fetch,
             patch(
                 "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 0)
             ),
         ):
-            mock_git.return_value = True
+            mock_fetch.return_value = (True, False)
             results = asyncio.run(sync_repos(repos))
 
         assert len(results) == 2
         assert all(r.success for r in results)
         assert all(r.action == "fetched" for r in results)
 
+    def test_on_result_called_per_repo(self, tmp_path: Path):
+        """Each result is reported as soon as its repo finishes."""
+        repos = [("RepoA", tmp_path / "RepoA"), ("RepoB", tmp_path / "RepoB")]
+        seen = []
+
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async", return_value=(True, False)
+            ),
+            patch(
+                "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 0)
+            ),
+        ):
+            asyncio.run(sync_repos(repos, on_result=lambda r: seen.append(r.name)))
+
+        assert sorted(seen) == ["RepoA", "RepoB"]
+
     def test_skips_dirty_repos(self, tmp_path: Path):
         """Dirty repos are skipped without force flag."""
         repos = [("DirtyRepo", tmp_path / "DirtyRepo")]
@@ -59,7 +89,9 @@ class TestSyncRepos:
 
         with (
             patch("vindicta_cli.lib.sync_service._check_dirty", return_value=True),
-            patch("vindicta_cli.lib.sync_service._run_git_async", return_value=True),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async", return_value=(True, False)
+            ),
             patch(
                 "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 2)
             ),
@@ -75,6 +107,9 @@ class TestSyncRepos:
 
         with (
             patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async", return_value=(True, False)
+            ),
             patch("vindicta_cli.lib.sync_service._run_git_async", return_value=True),
             patch(
                 "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 3)
@@ -92,45 +127,420 @@ class TestSyncRepos:
 
         with (
             patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
-            patch("vindicta_cli.lib.sync_service._run_git_async", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async",
+                return_value=(False, False),
+            ),
         ):
             results = asyncio.run(sync_repos(repos))
 
         assert results[0].success is False
         assert results[0].action == "failed"
 
+    def test_fetch_timeout_marked_congested(self, tmp_path: Path):
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async",
+                side_effect=asyncio.TimeoutError,
+            ),
+        ):
+            (result,) = asyncio.run(sync_repos([("Repo", tmp_path)]))
+
+        assert result.action == "failed"
+        assert result.congested is True
+
+
+class TestFetchErrors:
+    """Transport failures are told apart from other fetch errors."""
+
+    @pytest.mark.parametrize(
+        "stderr",
+        [
+            "fatal: unable to access 'https://github.com/x/y/': "
+            "Could not resolve host: github.com",
+            "error: RPC failed; curl 56 GnuTLS recv error (-9)",
+            "fatal: the remote end hung up unexpectedly",
+            "fatal: unable to access 'https://github.com/x/y/': "
+            "The requested URL returned error: 503",
+        ],
+    )
+    def test_transport_errors(self, stderr: str):
+        assert _is_transport_error(stderr)
+
+    @pytest.mark.parametrize(
+        "stderr",
+        [
+            "remote: Repository not found.",
+            "fatal: Authentication failed for 'https://github.com/x/y/'",
+            "git@github.com: Permission denied (publickey).",
+            "fatal: 'origin' does not appear to be a git repository",
+        ],
+    )
+    def test_other_errors(self, stderr: str):
+        assert not _is_transport_error(stderr)
+
+    @requires_git
+    def test_missing_remote_is_not_transport_error(self, git_clone: Path):
+        git("remote", "set-url", "origin", str(git_clone / "gone"), cwd=git_clone)
+        ok, transport_error = asyncio.run(
+            _fetch_async(["git", "fetch", "origin"], git_clone, 30)
+        )
+        assert (ok, transport_error) == (False, False)
+
 
 class TestCheckDirty:
     """Tests for _check_dirty helper."""
 
     def test_clean_repo(self, tmp_path: Path):
-        with patch("vindicta_cli.lib.sync_service.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
-            assert _check_dirty(tmp_path) is False
+        with patch("vindicta_cli.lib.sync_service._git_output", return_value=(0, "")):
+            assert asyncio.run(_check_dirty(tmp_path)) is False
 
     def test_dirty_repo(self, tmp_path: Path):
-        with patch("vindicta_cli.lib.sync_service.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout=" M file.py\n?? new.txt", returncode=0
-            )
-            assert _check_dirty(tmp_path) is True
+        with patch(
+            "vindicta_cli.lib.sync_service._git_output",
+            return_value=(0, " M file.py\n?? new.txt"),
+        ):
+            assert asyncio.run(_check_dirty(tmp_path)) is True
+
+    def test_timeout_treated_as_clean(self, tmp_path: Path):
+        with patch(
+            "vindicta_cli.lib.sync_service._git_output",
+            side_effect=asyncio.TimeoutError,
+        ):
+            assert asyncio.run(_check_dirty(tmp_path)) is False
 
 
 class TestGetAheadBehind:
     """Tests for _get_ahead_behind helper."""
 
     def test_parses_output(self, tmp_path: Path):
-        with patch("vindicta_cli.lib.sync_service.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout="3\t5", returncode=0)
-            ahead, behind = _get_ahead_behind(tmp_path)
+        with patch(
+            "vindicta_cli.lib.sync_service._git_output", return_value=(0, "3\t5")
+        ):
+            ahead, behind = asyncio.run(_get_ahead_behind(tmp_path))
 
         assert ahead == 3
         assert behind == 5
 
     def test_handles_error(self, tmp_path: Path):
-        with patch("vindicta_cli.lib.sync_service.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(stdout="", returncode=1)
-            ahead, behind = _get_ahead_behind(tmp_path)
+        with patch("vindicta_cli.lib.sync_service._git_output", return_value=(1, "")):
+            ahead, behind = asyncio.run(_get_ahead_behind(tmp_path))
 
         assert ahead == 0
         assert behind == 0
+
+    @requires_git
+    def test_equal_tips_skip_git(self, git_clone: Path):
+        with patch("vindicta_cli.lib.sync_service._git_output") as mock_git:
+            assert asyncio.run(_get_ahead_behind(git_clone)) == (0, 0)
+        mock_git.assert_not_called()
+
+    @requires_git
+    def test_diverged_tips_use_git(self, git_clone: Path):
+        (git_clone / "new.txt").write_text("x")
+        git("add", "new.txt", cwd=git_clone)
+        git("commit", "-q", "-m", "local", cwd=git_clone)
+        assert asyncio.run(_get_ahead_behind(git_clone)) == (1, 0)
+
+
+@requires_git
+class TestSkipUnchanged:
+    """ls-remote pre-check against a local bare remote."""
+
+    def _push_from_seed(self, tmp_path: Path, git_remote: Path, branch: str):
+        seed = tmp_path / "seed"
+        git("checkout", "-q", "-B", branch, cwd=seed)
+        (seed / f"{branch}.txt").write_text("x")
+        git("add", ".", cwd=seed)
+        git("commit", "-q", "-m", branch, cwd=seed)
+        git("push", "-q", str(git_remote), branch, cwd=seed)
+
+    def test_unchanged_remote_skips_fetch(self, git_clone: Path):
+        assert asyncio.run(_remote_unchanged(git_clone)) is True
+
+        with patch("vindicta_cli.lib.sync_service._fetch_async") as mock_git:
+            results = asyncio.run(
+                sync_repos([("Repo", git_clone)], skip_unchanged=True)
+            )
+
+        mock_git.assert_not_called()
+        assert results[0].action == "up-to-date"
+        assert results[0].success is True
+        assert results[0].refs_moved is False
+
+    def test_new_commit_triggers_fetch(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        self._push_from_seed(tmp_path, git_remote, "main")
+        assert asyncio.run(_remote_unchanged(git_clone)) is False
+
+        results = asyncio.run(sync_repos([("Repo", git_clone)], skip_unchanged=True))
+
+        assert results[0].action == "fetched"
+        assert results[0].behind == 1
+        assert results[0].refs_moved is True
+        assert asyncio.run(_remote_unchanged(git_clone)) is True
+
+    def test_new_branch_triggers_fetch(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        self._push_from_seed(tmp_path, git_remote, "feature")
+        assert asyncio.run(_remote_unchanged(git_clone)) is False
+
+    def test_deleted_branch_triggers_prune(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        self._push_from_seed(tmp_path, git_remote, "feature")
+        git("fetch", "-q", cwd=git_clone)
+        git("push", "-q", str(git_remote), "--delete", "feature", cwd=tmp_path / "seed")
+        assert asyncio.run(_remote_unchanged(git_clone)) is False
+
+    def test_new_tag_triggers_fetch(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        git("tag", "-a", "-m", "release", "v1.0", cwd=tmp_path / "seed")
+        git("push", "-q", str(git_remote), "v1.0", cwd=tmp_path / "seed")
+        assert asyncio.run(_remote_unchanged(git_clone)) is False
+        # A --no-tags fetch wouldn't pick it up
+        assert asyncio.run(_remote_unchanged(git_clone, tags=False)) is True
+
+        git("fetch", "-q", cwd=git_clone)
+        assert asyncio.run(_remote_unchanged(git_clone)) is True
+
+    def test_local_only_tag_is_unchanged(self, git_clone: Path):
+        git("tag", "local-build", cwd=git_clone)
+        assert asyncio.run(_remote_unchanged(git_clone)) is True
+
+    def test_unreachable_remote_counts_as_changed(self, git_clone: Path):
+        git("remote", "set-url", "origin", "/nonexistent/remote.git", cwd=git_clone)
+        assert asyncio.run(_remote_unchanged(git_clone)) is False
+
+
+@requires_git
+class TestFetchProfiles:
+    """Fetch commands per profile, checked against local remotes."""
+
+    def test_full_and_no_tags(self, git_clone: Path):
+        assert _fetch_command(git_clone, "full") == (["git", "fetch", "--prune"], None)
+        cmd, branch = _fetch_command(git_clone, "no-tags")
+        assert "--no-tags" in cmd
+        assert branch is None
+
+    def test_default_branch_only_updates_default(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        seed = tmp_path / "seed"
+        git("checkout", "-q", "-b", "feature", cwd=seed)
+        git("push", "-q", str(git_remote), "feature", cwd=seed)
+
+        cmd, branch = _fetch_command(git_clone, "default-branch")
+        assert branch == "main"
+        assert cmd[-1] == "+refs/heads/main:refs/remotes/origin/main"
+
+        results = asyncio.run(
+            sync_repos([("Repo", git_clone)], fetch_profiles={"Repo": "default-branch"})
+        )
+        assert results[0].success is True
+        refs = git("for-each-ref", "--format=%(refname)", "refs/remotes", cwd=git_clone)
+        assert "refs/remotes/origin/feature" not in refs
+
+    def test_blobless_needs_partial_clone(
+        self, tmp_path: Path, git_remote: Path, git_clone: Path
+    ):
+        assert _fetch_command(git_clone, "blobless") == (
+            ["git", "fetch", "--prune"],
+            None,
+        )
+
+        git("config", "uploadpack.allowFilter", "true", cwd=git_remote)
+        partial = tmp_path / "partial"
+        git(
+            "clone",
+            "-q",
+            "--filter=blob:none",
+            f"file://{git_remote}",
+            str(partial),
+            cwd=tmp_path,
+        )
+        cmd, _ = _fetch_command(partial, "blobless")
+        assert "--filter=blob:none" in cmd
+        assert git("fetch", "--prune", "--filter=blob:none", cwd=partial) == ""
+
+
+class TestNonBlocking:
+    """Git helpers must not stall the event loop."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script")
+    def test_parallel_sync_overlaps_git_calls(self, tmp_path: Path, monkeypatch):
+        """With a slow git, N repos take about as long as one."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        fake_git = bin_dir / "git"
+        fake_git.write_text("#!/bin/sh\nsleep 0.3\n")
+        fake_git.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+        repos = []
+        for i in range(4):
+            path = tmp_path / f"Repo{i}"
+            path.mkdir()
+            repos.append((f"Repo{i}", path))
+
+        start = time.monotonic()
+        results = asyncio.run(sync_repos(repos, parallel_count=4))
+        elapsed = time.monotonic() - start
+
+        assert all(r.action == "fetched" for r in results)
+        # status, fetch and rev-list each take 0.3s; serialized helpers
+        # would need 4 x 0.3s for each of the two blocking phases alone
+        assert elapsed < 1.8
+
+    def test_cancellation_kills_child(self, tmp_path: Path):
+        pid_file = tmp_path / "pid"
+        cmd = [
+            sys.executable,
+            "-c",
+            f"import os, time; open({str(pid_file)!r}, 'w').write(str(os.getpid()));"
+            " time.sleep(30)",
+        ]
+
+        async def _run_and_cancel():
+            task = asyncio.create_task(_git_output(cmd, tmp_path, timeout=60))
+            while not pid_file.exists() or not pid_file.read_text():
+                await asyncio.sleep(0.02)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(_run_and_cancel())
+        pid = int(pid_file.read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    def test_timeout_kills_child(self, tmp_path: Path):
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+        start = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(_git_output(cmd, tmp_path, timeout=0.2))
+        assert time.monotonic() - start < 5
+
+
+class TestPhaseTimings:
+    """Each phase of a repo's sync is timed."""
+
+    def test_records_phases(self, tmp_path: Path):
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch(
+                "vindicta_cli.lib.sync_service._fetch_async", return_value=(True, False)
+            ),
+            patch("vindicta_cli.lib.sync_service._run_git_async", return_value=True),
+            patch(
+                "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 1)
+            ),
+        ):
+            (result,) = asyncio.run(
+                sync_repos([("Repo", tmp_path)], pull=True, skip_unchanged=False)
+            )
+
+        assert set(result.timings) == {"dirty", "fetch", "rev-list", "pull", "total"}
+        assert result.timings["total"] >= result.timings["fetch"]
+
+    def test_skipped_repo_has_dirty_timing(self, tmp_path: Path):
+        with patch("vindicta_cli.lib.sync_service._check_dirty", return_value=True):
+            (result,) = asyncio.run(sync_repos([("Repo", tmp_path)]))
+
+        assert "dirty" in result.timings
+        assert "fetch" not in result.timings
+
+
+class TestDeadline:
+    """A global deadline cancels stragglers and keeps finished results."""
+
+    def test_stragglers_marked_timed_out(self, tmp_path: Path):
+        async def _fetch(cmd, path, timeout):
+            await asyncio.sleep(30 if path.name == "Hung" else 0)
+            return True, False
+
+        repos = [("Fast", tmp_path / "Fast"), ("Hung", tmp_path / "Hung")]
+        seen = []
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch("vindicta_cli.lib.sync_service._fetch_async", side_effect=_fetch),
+            patch(
+                "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 0)
+            ),
+        ):
+            start = time.monotonic()
+            results = asyncio.run(
+                sync_repos(repos, deadline=0.2, on_result=lambda r: seen.append(r.name))
+            )
+
+        assert time.monotonic() - start < 5
+        assert [r.action for r in results] == ["fetched", "timed_out"]
+        assert results[1].success is False
+        assert sorted(seen) == ["Fast", "Hung"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses process groups")
+    def test_cancellation_kills_process_group(self, tmp_path: Path):
+        """Grandchildren (e.g. ssh under git) die with the child."""
+        pid_file = tmp_path / "pid"
+        sleeper = "import time; time.sleep(30)"
+        script = (
+            "import subprocess, sys, time;"
+            f"p = subprocess.Popen([sys.executable, '-c', {sleeper!r}]);"
+            f"open({str(pid_file)!r}, 'w').write(str(p.pid));"
+            "time.sleep(30)"
+        )
+
+        async def _run_and_cancel():
+            # As inside sync_repos with a deadline
+            _OWN_PROCESS_GROUP.set(True)
+            task = asyncio.create_task(
+                _git_output([sys.executable, "-c", script], tmp_path, timeout=60)
+            )
+            while not pid_file.exists() or not pid_file.read_text():
+                await asyncio.sleep(0.02)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(_run_and_cancel())
+        grandchild = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                os.kill(grandchild, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("grandchild still running")
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses process groups")
+    def test_own_process_group_only_with_deadline(self, tmp_path: Path):
+        """Without a deadline git stays reachable by Ctrl-C."""
+        groups = {}
+
+        async def _fetch(cmd, path, timeout):
+            _, out = await _git_output(
+                [sys.executable, "-c", "import os; print(os.getpgid(0))"],
+                tmp_path,
+                timeout=30,
+            )
+            groups[path.name] = int(out)
+            return True, False
+
+        with (
+            patch("vindicta_cli.lib.sync_service._check_dirty", return_value=False),
+            patch("vindicta_cli.lib.sync_service._fetch_async", side_effect=_fetch),
+            patch(
+                "vindicta_cli.lib.sync_service._get_ahead_behind", return_value=(0, 0)
+            ),
+        ):
+            asyncio.run(sync_repos([("Plain", tmp_path / "Plain")]))
+            asyncio.run(sync_repos([("Bounded", tmp_path / "Bounded")], deadline=30))
+
+        assert groups["Plain"] == os.getpgid(0)
+        assert groups["Bounded"] != os.getpgid(0)
@@ -4,15 +4,23 @@ Tests for workspace root discovery, config management,
 repo scanning, and incremental workspace setup.
 """
 
+import subprocess
+import threading
+import time
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+from tests.conftest import git, requires_git
 from vindicta_cli.lib.workspace import (
     CONFIG_FILENAME,
+    collect_repo_infos,
     discover_workspace_root,
+    get_repo_info,
     load_config,
     save_config,
     scan_repos,
 )
+from vindicta_cli.models.repo_info import RepoEntry, RepoInfo
 from vindicta_cli.models.workspace_config import WorkspaceConfig
 
 
@@ -94,3 +102,176 @@ class TestScanRepos:
         core = [r for r in repos if r.name == "Vindicta-Core"]
         assert len(core) == 1
         assert core[0].present is False
+
+    def test_gitdir_file_detected(self, tmp_path: Path):
+        """A `.git` file pointing at an existing git dir counts as present."""
+        store = tmp_path / "store.git"
+        store.mkdir()
+        (tmp_path / "Vindicta-Core").mkdir()
+        (tmp_path / "Vindicta-Core" / ".git").write_text(f"gitdir: {store}\n")
+        (tmp_path / "Vindicta-API").mkdir()
+        (tmp_path / "Vindicta-API" / ".git").write_text("gitdir: /missing\n")
+
+        present = {r.name for r in scan_repos(tmp_path) if r.present}
+        assert present == {"Vindicta-Core"}
+
+
+class TestCollectRepoInfos:
+    """Tests for concurrent collect_repo_infos."""
+
+    @staticmethod
+    def _entries(tmp_path: Path, count: int) -> list[RepoEntry]:
+        return [
+            RepoEntry(
+                name=f"Repo-{i}",
+                tier="P0",
+                repo_type="python",
+                github_url=f"https://github.com/org/Repo-{i}.git",
+                local_path=tmp_path / f"Repo-{i}",
+                present=True,
+            )
+            for i in range(count)
+        ]
+
+    def test_preserves_input_order(self, tmp_path: Path):
+        entries = self._entries(tmp_path, 5)
+
+        def fake_info(path, entry, deadline):
+            # Finish in reverse order
+            time.sleep(0.01 * (5 - int(entry.name.split("-")[1])))
+            return RepoInfo(entry.name, entry.tier, entry.repo_type, path)
+
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=fake_info):
+            infos = collect_repo_infos(entries, parallel_count=5)
+
+        assert [i.name for i in infos] == [e.name for e in entries]
+
+    def test_on_result_streams_in_completion_order(self, tmp_path: Path):
+        entries = self._entries(tmp_path, 3)
+        caller = threading.get_ident()
+        seen = []
+
+        def fake_info(path, entry, deadline):
+            time.sleep(0.02 * (3 - int(entry.name.split("-")[1])))
+            return RepoInfo(entry.name, entry.tier, entry.repo_type, path)
+
+        def on_result(info):
+            assert threading.get_ident() == caller
+            seen.append(info.name)
+
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=fake_info):
+            infos = collect_repo_infos(entries, parallel_count=3, on_result=on_result)
+
+        assert seen == ["Repo-2", "Repo-1", "Repo-0"]
+        # Streamed results are handed over, not kept
+        assert infos == []
+
+    def test_honors_parallel_count(self, tmp_path: Path):
+        entries = self._entries(tmp_path, 8)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_info(path, entry, deadline):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return RepoInfo(entry.name, entry.tier, entry.repo_type, path)
+
+        with patch("vindicta_cli.lib.workspace.get_repo_info", side_effect=fake_info):
+            collect_repo_infos(entries, parallel_count=3)
+
+        assert 1 < peak <= 3
+
+    def test_empty_input(self):
+        assert collect_repo_infos([]) == []
+
+
+class TestGetRepoInfoDeadline:
+    """Tests for the per-repo deadline in get_repo_info."""
+
+    def test_git_calls_share_one_budget(self, tmp_path: Path):
+        entry = RepoEntry(
+            name="Repo",
+            tier="P0",
+            repo_type="python",
+            github_url="https://github.com/org/Repo.git",
+        )
+        timeouts = []
+
+        def fake_run(cmd, **kwargs):
+            timeouts.append(kwargs["timeout"])
+            time.sleep(0.02)
+            return MagicMock(returncode=0, stdout="main\n")
+
+        with patch("vindicta_cli.lib.workspace.subprocess.run", side_effect=fake_run):
+            get_repo_info(tmp_path, entry, deadline=1.0)
+
+        assert all(t <= 1.0 for t in timeouts)
+        assert timeouts == sorted(timeouts, reverse=True)
+
+    def test_expired_deadline_keeps_defaults(self, tmp_path: Path):
+        entry = RepoEntry(
+            name="Repo",
+            tier="P0",
+            repo_type="python",
+            github_url="https://github.com/org/Repo.git",
+        )
+        with patch("vindicta_cli.lib.workspace.subprocess.run") as mock_run:
+            info = get_repo_info(tmp_path, entry, deadline=0)
+
+        mock_run.assert_not_called()
+        assert info.current_branch == "main"
+        assert info.is_dirty is False
+
+
+@requires_git
+class TestGetRepoInfoGit:
+    """get_repo_info against a real repository and upstream."""
+
+    @staticmethod
+    def _entry() -> RepoEntry:
+        return RepoEntry(
+            name="Repo",
+            tier="P0",
+            repo_type="python",
+            github_url="https://github.com/org/Repo.git",
+        )
+
+    def test_clean_clone(self, git_clone: Path):
+        info = get_repo_info(git_clone, self._entry())
+        assert info.current_branch == "main"
+        assert info.upstream == "origin/main"
+        assert info.is_dirty is False
+        assert info.default_branch == "main"
+        assert len(info.last_commit_hash) == 40
+
+    def test_refs_survive_git_timeout(self, git_clone: Path):
+        """Branch and HEAD come from the in-process reader, not git."""
+        with patch(
+            "vindicta_cli.lib.workspace.subprocess.run",
+            side_effect=subprocess.TimeoutExpired("git", 0),
+        ):
+            info = get_repo_info(git_clone, self._entry())
+        assert info.current_branch == "main"
+        assert info.last_commit_hash == git("rev-parse", "HEAD", cwd=git_clone)
+
+    def test_counts_and_ahead_of_real_upstream(self, git_clone: Path):
+        git("checkout", "-q", "-b", "feat/x", "--track", "origin/main", cwd=git_clone)
+        (git_clone / "new.py").write_text("x = 1\n")
+        git("add", "new.py", cwd=git_clone)
+        git("commit", "-q", "-m", "feat", cwd=git_clone)
+        (git_clone / "README.md").write_text("changed\n")
+        (git_clone / "untracked.txt").write_text("?")
+
+        info = get_repo_info(git_clone, self._entry())
+        assert info.current_branch == "feat/x"
+        assert info.upstream == "origin/main"
+        assert (info.ahead, info.behind) == (1, 0)
+        assert info.unstaged_count == 1
+        assert info.untracked_count == 1
+        assert info.is_dirty is True
@@ -122,3 +122,75 @@ class TestWorkspaceConfigValidation:
 
         with pytest.raises(ValueError):
             WorkspaceConfig(sync_timeout=700)
+
+    def test_fetch_profile_must_be_known(self):
+        from vindicta_cli.models.workspace_config import WorkspaceConfig
+
+        with pytest.raises(ValueError):
+            WorkspaceConfig(fetch_profile="everything")
+
+    def test_repo_fetch_profile_must_be_known(self):
+        from vindicta_cli.models.workspace_config import WorkspaceConfig
+
+        with pytest.raises(ValueError):
+            WorkspaceConfig(
+                repositories=[{"name": "Vindicta-Web", "fetch_profile": "tiny"}]
+            )
+
+    def test_clone_modes_must_be_known(self):
+        from vindicta_cli.models.workspace_config import WorkspaceConfig
+
+        with pytest.raises(ValueError):
+            WorkspaceConfig(clone_mode="tiny")
+        with pytest.raises(ValueError):
+            WorkspaceConfig(tier_clone_modes={"P2": "tiny"})
+        with pytest.raises(ValueError):
+            WorkspaceConfig(repositories=[{"name": "X", "clone_mode": "tiny"}])
+
+    def test_clone_depth_positive(self):
+        from vindicta_cli.models.workspace_config import WorkspaceConfig
+
+        with pytest.raises(ValueError):
+            WorkspaceConfig(clone_depth=0)
+
+
+class TestFetchProfileFor:
+    """Test per-repo fetch profile lookup."""
+
+    def test_repo_override_from_yaml(self):
+        from vindicta_cli.models.workspace_config import WorkspaceConfig
+
+        config = WorkspaceConfig.from_yaml(
+            "fetch_profile: no-tags\n"
+            "repositories:\n"
+            "  - name: Vindicta-Docs\n"
+            "    fetch_profile: default-branch\n"
+        )
+        assert config.fetch_profile_for("Vindicta-Docs") == "default-branch"
+        assert config.fetch_profile_for("Vindicta-Core") == "no-tags"
+
+
+class TestCloneModeFor:
+    """Test per-repo / per-tier clone mode lookup."""
+
+    def test_p3_defaults_to_shallow(self):
+        from vindicta_cli.models.workspace_config import WorkspaceConfig
+
+        config = WorkspaceConfig()
+        assert config.clone_mode_for("Vindicta-Tools", "P3") == "shallow"
+        assert config.clone_mode_for("Vindicta-Core", "P0") == "full"
+
+    def test_repo_then_tier_then_default(self):
+        from vindicta_cli.models.workspace_config import WorkspaceConfig
+
+        config = WorkspaceConfig.from_yaml(
+            "clone_mode: blobless\n"
+            "tier_clone_modes:\n"
+            "  P2: single-branch\n"
+            "repositories:\n"
+            "  - name: Vindicta-Docs\n"
+            "    clone_mode: shallow\n"
+        )
+        assert config.clone_mode_for("Vindicta-Docs", "P2") == "shallow"
+        assert config.clone_mode_for("Vindicta-Web", "P2") == "single-branch"
+        assert config.clone_mode_for("Vindicta-Tools", "P3") == "blobless"